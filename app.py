@@ -9,8 +9,11 @@ with human feedback integration and learning capabilities.
 # # Standard library imports
 # Standard library imports
 import asyncio
+import atexit
 import os
 import sys
+import threading
+import time
 from datetime import datetime
 from pathlib import Path
 from typing import Any
@@ -22,7 +25,13 @@ from flask import Flask, jsonify, render_template, request, send_file
 # # Local application imports
 # Local application imports
 from src.agents.email_graph import EmailProcessingGraph
-from src.email_interface.base import EmailSearchCriteria
+from src.agents.email_pipeline import (
+    EmailIngestionPipeline,
+    build_email_data,
+    build_email_summary,
+    release_attachment_content,
+)
+from src.email_interface.base import AuthenticationError, EmailSearchCriteria
 from src.email_interface.factory import EmailInterfaceFactory, EmailSystemType
 from src.memory import create_memory_systems
 from src.memory.simple_memory import reset_all_memory_to_baseline
@@ -63,6 +72,58 @@ memory_systems = None
 gmail_interface = None
 msgraph_interface = None
 
+# Long-lived event loop shared by all requests, so email interfaces keep
+# their HTTP connection pools and sessions between requests
+_event_loop: asyncio.AbstractEventLoop | None = None
+_event_loop_lock = threading.Lock()
+
+
+def _get_event_loop() -> asyncio.AbstractEventLoop:
+    """
+    Get the shared background event loop, starting it on first use.
+
+    Returns:
+        Event loop running in a daemon thread
+    """
+    global _event_loop
+
+    with _event_loop_lock:
+        if _event_loop is None:
+            _event_loop = asyncio.new_event_loop()
+            threading.Thread(
+                target=_event_loop.run_forever, name="email-agent-loop", daemon=True
+            ).start()
+        return _event_loop
+
+
+def run_async(coro: Any) -> Any:
+    """
+    Run a coroutine on the shared event loop and wait for its result.
+
+    Args:
+        coro: Coroutine to run
+
+    Returns:
+        Result of the coroutine
+    """
+    return asyncio.run_coroutine_threadsafe(coro, _get_event_loop()).result()
+
+
+@atexit.register
+def _shutdown_event_loop() -> None:
+    """Close the email interfaces and stop the shared event loop."""
+    if _event_loop is None:
+        return
+
+    for interface in (gmail_interface, msgraph_interface):
+        if interface is not None:
+            try:
+                run_async(interface.close())
+            except Exception as e:
+                logger.warning(f"Failed to close {interface.__class__.__name__}: {e}")
+
+    _event_loop.call_soon_threadsafe(_event_loop.stop)
+
 
 def _clean_bytes_from_dict(obj: Any) -> Any:
     """Recursively clean bytes objects from dictionaries for JSON serialization."""
@@ -99,14 +160,44 @@ def initialize_system() -> bool:
 
         # Initialize email interfaces
         try:
-            gmail_interface = EmailInterfaceFactory.create(EmailSystemType.GMAIL.value)
+            gmail_interface = EmailInterfaceFactory.create(
+                EmailSystemType.GMAIL.value,
+                sync_state_path=config.sync_state_file,
+                max_concurrent_attachments=config.max_concurrent_attachments,
+                attachment_spool_threshold=int(
+                    config.attachment_spool_threshold_mb * 1024 * 1024
+                ),
+                attachment_spool_dir=config.attachment_spool_dir or None,
+                attachment_byte_budget=int(
+                    config.attachment_byte_budget_mb * 1024 * 1024
+                ),
+                transport=config.gmail_transport,
+            )
+            email_graph.register_attachment_loader("gmail", gmail_interface)
+            gmail_interface.set_attachment_filter(
+                email_graph.attachment_policy.check_download
+            )
             logger.info("Gmail interface created")
         except Exception as e:
             logger.warning(f"Gmail interface not available: {e}")
 
         try:
             msgraph_interface = EmailInterfaceFactory.create(
-                EmailSystemType.MICROSOFT_GRAPH.value
+                EmailSystemType.MICROSOFT_GRAPH.value,
+                sync_state_path=config.sync_state_file,
+                max_concurrent_attachments=config.max_concurrent_attachments,
+                attachment_spool_threshold=int(
+                    config.attachment_spool_threshold_mb * 1024 * 1024
+                ),
+                attachment_spool_dir=config.attachment_spool_dir or None,
+                attachment_byte_budget=int(
+                    config.attachment_byte_budget_mb * 1024 * 1024
+                ),
+                body_content_type=config.msgraph_body_content_type,
+            )
+            email_graph.register_attachment_loader("msgraph", msgraph_interface)
+            msgraph_interface.set_attachment_filter(
+                email_graph.attachment_policy.check_download
             )
             logger.info("Microsoft Graph interface created")
         except Exception as e:
@@ -169,15 +260,28 @@ def system_diagnostics() -> dict[str, Any]:
         "email_interfaces": {
             "gmail": {
                 "interface_created": gmail_interface is not None,
+                "connected": bool(gmail_interface and gmail_interface.is_connected),
                 "credentials_file_exists": Path(config.gmail_credentials_path).exists(),
                 "token_file_exists": Path(config.gmail_token_path).exists(),
+                "attachment_policy": (
+                    gmail_interface.attachment_stats if gmail_interface else None
+                ),
                 "error": None,
             },
             "msgraph": {
                 "interface_created": msgraph_interface is not None,
+                "connected": bool(msgraph_interface and msgraph_interface.is_connected),
+                "connection_pool": (
+                    msgraph_interface.get_connection_stats()
+                    if msgraph_interface
+                    else None
+                ),
                 "credentials_file_exists": Path(
                     config.msgraph_credentials_path
                 ).exists(),
+                "attachment_policy": (
+                    msgraph_interface.attachment_stats if msgraph_interface else None
+                ),
                 "error": None,
             },
         },
@@ -217,6 +321,8 @@ def process_emails() -> tuple[dict[str, Any], int] | dict[str, Any]:
         data = request.json
         email_system = data.get("email_system")  # 'gmail' or 'msgraph'
         max_emails = data.get("max_emails", 5)
+        use_pipeline = data.get("pipeline", config.ingestion_pipeline_enabled)
+        sync_mode = data.get("sync_mode", config.email_sync_mode)
 
         if not email_system:
             return jsonify({"error": "Email system not specified"}), 400
@@ -229,8 +335,15 @@ def process_emails() -> tuple[dict[str, Any], int] | dict[str, Any]:
         else:
             return jsonify({"error": f"Email system {email_system} not available"}), 400
 
-        # Process emails asynchronously
-        results = asyncio.run(process_emails_async(interface, max_emails))
+        # Process emails on the shared loop so connections are reused
+        results = run_async(
+            process_emails_async(
+                interface,
+                max_emails,
+                use_pipeline=use_pipeline,
+                incremental=sync_mode == "incremental",
+            )
+        )
 
         return jsonify(results)
 
@@ -239,23 +352,184 @@ def process_emails() -> tuple[dict[str, Any], int] | dict[str, Any]:
         return jsonify({"error": str(e)}), 500
 
 
+def _log_processing_result(email: Any, result: dict[str, Any]) -> None:
+    """
+    Log the key fields of a graph processing result for debugging.
+
+    Args:
+        email: Email object that was processed
+        result: Final graph state returned by process_email
+    """
+    logger.info(f"=== PROCESSING RESULT FOR: {email.subject[:60]} ===")
+    logger.info(f"Sender: {email.sender.address}")
+    logger.info(f"Attachments: {len(email.attachments)}")
+    if email.attachments:
+        for att in email.attachments:
+            logger.info(f"  - {att.filename}")
+
+    # Log key results
+    if result.get("relevance_result"):
+        rel = result["relevance_result"]
+        logger.info(
+            f"Relevance: {rel.get('relevance')} (confidence: {rel.get('confidence')})"
+        )
+
+    if result.get("asset_matches"):
+        matches = result["asset_matches"]
+        if matches:
+            logger.info(f"Asset Matches: {len(matches)}")
+            for match in matches:
+                logger.info(
+                    f"  - {match.get('asset_id')} (confidence: {match.get('confidence')})"
+                )
+        else:
+            logger.info("Asset Matches: None")
+
+    if result.get("actions"):
+        logger.info(f"Actions: {result['actions']}")
+
+    if result.get("processing_errors"):
+        logger.error(f"Processing Errors: {result['processing_errors']}")
+
+    logger.info("=" * 60)
+
+
+async def _process_single_email(email: Any, index: int, total: int) -> dict[str, Any]:
+    """
+    Run one email through the processing graph, isolating any failure.
+
+    Args:
+        email: Email object returned by an email interface
+        index: 1-based position of the email in the batch
+        total: Number of emails in the batch
+
+    Returns:
+        Summary dictionary for the email, including its processing time and
+        an error message instead of a processing result if it failed
+    """
+    logger.info(f"Processing email {index}/{total}: {email.subject[:50]}...")
+    start_time = time.perf_counter()
+
+    summary = build_email_summary(email)
+
+    try:
+        email_data = build_email_data(email)
+        result = await asyncio.wait_for(
+            email_graph.process_email(email_data),
+            timeout=config.processing_timeout_seconds,
+        )
+        _log_processing_result(email, result)
+        summary["processing_result"] = result
+        summary["success"] = True
+
+    except TimeoutError:
+        logger.error(
+            f"Email {index}/{total} timed out after "
+            f"{config.processing_timeout_seconds}s: {email.subject[:50]}"
+        )
+        summary["success"] = False
+        summary["error"] = (
+            f"Processing timed out after {config.processing_timeout_seconds} seconds"
+        )
+
+    except Exception as e:
+        logger.error(f"Email {index}/{total} failed: {e}")
+        summary["success"] = False
+        summary["error"] = str(e)
+
+    if not summary["success"]:
+        # Keep the result shape the dashboard expects for failed emails
+        summary["processing_result"] = {
+            "processing_errors": [summary["error"]],
+            "actions": [],
+        }
+
+    # Spool files of attachments that were not saved are removed here
+    release_attachment_content(email)
+
+    summary["processing_time_seconds"] = round(time.perf_counter() - start_time, 3)
+    return summary
+
+
 @log_function()
-async def process_emails_async(interface: Any, max_emails: int) -> dict[str, Any]:
+async def process_email_batch(
+    emails: list[Any],
+) -> tuple[list[dict[str, Any]], dict[str, Any]]:
+    """
+    Process a batch of emails concurrently with bounded parallelism.
+
+    At most config.max_concurrent_emails emails are in the graph at once.
+    Results are returned in the same order as the input emails, and a
+    failure in one email is recorded in its summary without affecting the
+    others.
+
+    Args:
+        emails: Email objects returned by an email interface
+
+    Returns:
+        Tuple of (per-email summaries, batch timing statistics)
+    """
+    semaphore = asyncio.Semaphore(config.max_concurrent_emails)
+    total = len(emails)
+
+    async def bounded(index: int, email: Any) -> dict[str, Any]:
+        async with semaphore:
+            return await _process_single_email(email, index, total)
+
+    batch_start = time.perf_counter()
+    summaries = await asyncio.gather(
+        *(bounded(i, email) for i, email in enumerate(emails, 1))
+    )
+    wall_time = time.perf_counter() - batch_start
+
+    sum_email_time = sum(s["processing_time_seconds"] for s in summaries)
+    batch_stats = {
+        "max_concurrent_emails": config.max_concurrent_emails,
+        "email_count": total,
+        "failed_count": sum(1 for s in summaries if not s["success"]),
+        "wall_time_seconds": round(wall_time, 3),
+        "sum_email_time_seconds": round(sum_email_time, 3),
+        "effective_parallelism": (
+            round(sum_email_time / wall_time, 2) if wall_time > 0 else 0.0
+        ),
+    }
+
+    logger.info(
+        f"Processed {total} emails in {batch_stats['wall_time_seconds']}s wall time "
+        f"({batch_stats['sum_email_time_seconds']}s summed per-email time, "
+        f"concurrency limit {config.max_concurrent_emails}, "
+        f"{batch_stats['failed_count']} failed)"
+    )
+
+    return list(summaries), batch_stats
+
+
+@log_function()
+async def process_emails_async(
+    interface: Any,
+    max_emails: int,
+    use_pipeline: bool = False,
+    incremental: bool = False,
+) -> dict[str, Any]:
     """
     Process emails asynchronously.
 
     Args:
         interface: Email interface instance (Gmail or Microsoft Graph)
         max_emails: Maximum number of emails to process
+        use_pipeline: Stream emails through the staged ingestion pipeline
+            instead of fetching the whole batch before processing
+        incremental: Only fetch emails added since the previous sync
+            of this mailbox
 
     Returns:
         Dictionary with processing results
     """
     try:
-        # Connect to email system
-        logger.info(f"Connecting to {interface.__class__.__name__}...")
+        # Interfaces stay connected between requests to reuse their pools
+        if not interface.is_connected:
+            logger.info(f"Connecting to {interface.__class__.__name__}...")
 
-        if hasattr(interface, "connect"):
             if interface.__class__.__name__ == "GmailInterface":
                 # Gmail needs credentials
                 await interface.connect(
@@ -268,105 +542,37 @@ async def process_emails_async(interface: Any, max_emails: int) -> dict[str, Any
                 # Microsoft Graph
                 await interface.connect()
 
-        # Get recent emails with attachments
+        # Get recent emails with attachments; in lazy mode their content is
+        # only downloaded when the attachment processor saves them
         criteria = EmailSearchCriteria(
-            max_results=max_emails, has_attachments=None
-        )  # None means include both
-        emails = await interface.list_emails(criteria)
-
-        logger.info(f"Retrieved {len(emails)} emails for processing")
-
-        # Process each email through the graph
-        processed_results = []
-
-        for i, email in enumerate(emails, 1):
-            logger.info(f"Processing email {i}/{len(emails)}: {email.subject[:50]}...")
-
-            # Convert email to processing format
-            logger.info(f"Email has {len(email.attachments)} attachments")
-            for j, att in enumerate(email.attachments):
-                logger.info(
-                    f"  Attachment {j+1}: {att.filename} ({att.size} bytes, {att.content_type})"
-                )
-                if not att.content:
-                    logger.warning(f"    No content loaded for {att.filename}")
-
-            # Filter out attachments without content
-            valid_attachments = []
-            for att in email.attachments:
-                if att.content:
-                    valid_attachments.append(
-                        {
-                            "filename": att.filename,
-                            "content": att.content,
-                            "content_type": att.content_type,
-                            "size": att.size,
-                        }
-                    )
-                else:
-                    logger.warning(
-                        f"Skipping attachment {att.filename} - no content loaded"
-                    )
-
-            email_data = {
-                "subject": email.subject,
-                "sender": email.sender.address,
-                "body": email.body_text or email.body_html or "",
-                "attachments": valid_attachments,
-            }
-
-            # Process through the graph
-            result = await email_graph.process_email(email_data)
-
-            # Log processing results for debugging
-            logger.info(f"=== PROCESSING RESULT FOR: {email.subject[:60]} ===")
-            logger.info(f"Sender: {email.sender.address}")
-            logger.info(f"Attachments: {len(email.attachments)}")
-            if email.attachments:
-                for att in email.attachments:
-                    logger.info(f"  - {att.filename}")
-
-            # Log key results
-            if result.get("relevance_result"):
-                rel = result["relevance_result"]
-                logger.info(
-                    f"Relevance: {rel.get('relevance')} (confidence: {rel.get('confidence')})"
-                )
-
-            if result.get("asset_matches"):
-                matches = result["asset_matches"]
-                if matches:
-                    logger.info(f"Asset Matches: {len(matches)}")
-                    for match in matches:
-                        logger.info(
-                            f"  - {match.get('asset_id')} (confidence: {match.get('confidence')})"
-                        )
-                else:
-                    logger.info("Asset Matches: None")
-
-            if result.get("actions"):
-                logger.info(f"Actions: {result['actions']}")
-
-            if result.get("processing_errors"):
-                logger.error(f"Processing Errors: {result['processing_errors']}")
-
-            logger.info("=" * 60)
+            max_results=max_emails,
+            has_attachments=None,  # None means include both
+            include_attachment_content=not config.lazy_attachment_fetch,
+        )
 
-            # Add summary info
-            processed_results.append(
-                {
-                    "email_subject": email.subject[:60],
-                    "sender": email.sender.address,
-                    "received_date": (
-                        email.received_date.isoformat() if email.received_date else None
-                    ),
-                    "attachments_count": len(email.attachments),
-                    "processing_result": result,
-                }
+        if use_pipeline:
+            # Overlap fetching with relevance, matching and saving
+            pipeline = EmailIngestionPipeline(email_graph)
+            processed_results = await pipeline.run(
+                interface, criteria, incremental=incremental
             )
+            batch_stats = pipeline.get_stats()
+            if isinstance(pipeline.fetch_error, AuthenticationError):
+                # Partial results are kept; force a fresh sign-in next time
+                logger.error(f"Email authentication error: {pipeline.fetch_error}")
+                await interface.disconnect()
+        else:
+            if incremental:
+                emails = [
+                    email async for email in interface.stream_new_emails(criteria)
+                ]
+            else:
+                emails = await interface.list_emails(criteria)
 
-        # Disconnect
-        await interface.disconnect()
+            logger.info(f"Retrieved {len(emails)} emails for processing")
+
+            # Process the emails through the graph concurrently
+            processed_results, batch_stats = await process_email_batch(emails)
 
         # Clean results by removing bytes content before JSON serialization
         cleaned_results = []
@@ -383,8 +589,14 @@ async def process_emails_async(interface: Any, max_emails: int) -> dict[str, Any
             "success": True,
             "processed_count": len(cleaned_results),
             "results": cleaned_results,
+            "batch_stats": batch_stats,
         }
 
+    except AuthenticationError as e:
+        # Force a fresh sign-in on the next request
+        logger.error(f"Email authentication error: {e}")
+        await interface.disconnect()
+        return {"success": False, "error": str(e)}
     except Exception as e:
         logger.error(f"Async email processing error: {e}")
         return {"success": False, "error": str(e)}
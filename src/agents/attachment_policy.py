@@ -0,0 +1,132 @@
+"""
+Attachment security policy shared by ingestion and attachment processing.
+
+Evaluates the memory-driven file rules (semantic ``file_type_rules``,
+procedural ``file_processing_rules`` and ``config.allowed_file_extensions``)
+from attachment metadata alone. AttachmentProcessorNode applies it before
+saving, and email interfaces apply it as a pre-download gate through
+``check_download`` so blocked or oversized attachments are never fetched.
+"""
+
+# # Standard library imports
+from pathlib import Path
+from typing import Any
+
+# # Local application imports
+from src.email_interface.base import EmailAttachment
+from src.utils.config import config
+from src.utils.logging_system import get_logger
+
+logger = get_logger(__name__)
+
+
+class AttachmentPolicy:
+    """
+    Memory-driven allow/block decision for an attachment.
+
+    Decisions only need the filename and size, which providers include in
+    message metadata, so the same policy can run before and after download.
+    """
+
+    def __init__(
+        self, semantic_memory=None, procedural_memory=None, max_file_size=None
+    ) -> None:
+        """
+        Initialize the policy.
+
+        Args:
+            semantic_memory: Semantic memory holding file_type_rules
+            procedural_memory: Procedural memory holding file_processing_rules
+            max_file_size: Default size limit in bytes
+                (defaults to config.max_attachment_size_mb)
+        """
+        self.semantic_memory = semantic_memory
+        self.procedural_memory = procedural_memory
+        self.max_file_size = (
+            max_file_size or config.max_attachment_size_mb * 1024 * 1024
+        )
+
+    def evaluate(self, filename: str, file_size: int) -> dict[str, Any]:
+        """
+        Apply the security rules to attachment metadata.
+
+        Args:
+            filename: Attachment filename
+            file_size: Attachment size in bytes
+
+        Returns:
+            Dictionary with 'allowed' boolean and 'reason' string
+        """
+        file_ext = Path(filename).suffix.lower().lstrip(".")
+
+        # Get file type rules from semantic memory
+        file_type_rules = None
+        if self.semantic_memory:
+            try:
+                file_type_rules = self.semantic_memory.get_file_type_rules(file_ext)
+            except Exception as e:
+                logger.warning(
+                    f"Failed to get file type rules from semantic memory: {e}"
+                )
+
+        # Use memory-driven size limits if available
+        max_size_bytes = self.max_file_size  # Default from config
+        if file_type_rules and "max_size_mb" in file_type_rules:
+            max_size_bytes = file_type_rules["max_size_mb"] * 1024 * 1024
+
+        # File size check with memory-driven limits
+        if file_size > max_size_bytes:
+            return {
+                "allowed": False,
+                "reason": f"File too large: {file_size} bytes (max: {max_size_bytes} bytes for {file_ext})",
+            }
+
+        # File extension check with memory-driven rules
+        if file_type_rules:
+            # Use semantic memory rules
+            if not file_type_rules.get("allowed", False):
+                return {
+                    "allowed": False,
+                    "reason": f"File type not allowed by memory rules: {file_ext}",
+                }
+        else:
+            # Fallback to config
+            allowed_extensions = config.allowed_file_extensions
+            if file_ext not in allowed_extensions:
+                return {
+                    "allowed": False,
+                    "reason": f"File extension not allowed: {file_ext}",
+                }
+
+        # Get file processing rules from procedural memory
+        if self.procedural_memory:
+            try:
+                file_proc_rules = self.procedural_memory.get_file_processing_rules(
+                    file_ext
+                )
+                if file_proc_rules:
+                    # Apply any additional procedural security checks
+                    for rule in file_proc_rules:
+                        rule_max_size = rule.get("max_size_mb", 100) * 1024 * 1024
+                        if file_size > rule_max_size:
+                            return {
+                                "allowed": False,
+                                "reason": f"File exceeds procedural rule limit: {rule_max_size} bytes",
+                            }
+            except Exception as e:
+                logger.warning(f"Failed to apply procedural security checks: {e}")
+
+        return {"allowed": True, "reason": "Security checks passed"}
+
+    def check_download(self, attachment: EmailAttachment) -> str | None:
+        """
+        Pre-download gate for email interfaces.
+
+        Args:
+            attachment: Attachment metadata from the provider
+
+        Returns:
+            Reason the attachment is blocked, or None if it may be downloaded
+        """
+        decision = self.evaluate(attachment.filename, attachment.size)
+        return None if decision["allowed"] else decision["reason"]
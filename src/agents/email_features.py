@@ -0,0 +1,168 @@
+"""
+Per-email text features shared by the processing graph nodes.
+
+Relevance filtering and asset matching both search the same subject, body
+and attachment filenames. EmailFeatures normalizes that text once per email
+(lowercased text, word and token sets, sender domain and per-attachment
+filename terms) so the nodes do not lowercase, concatenate and tokenize the
+body again for every rule, asset and attachment.
+
+EmailProcessingGraph builds the features for each email and passes them to
+the nodes under the ``features`` key of their email data. Nodes called
+directly with plain email data build their own through ``get_email_features``.
+"""
+
+# # Standard library imports
+import re
+from dataclasses import dataclass, field
+from typing import Any
+
+WORD_PATTERN = re.compile(r"\b\w+\b")
+
+
+def _distinct_words(text: str) -> tuple[str, ...]:
+    """Distinct words of text in first-occurrence order."""
+    return tuple(dict.fromkeys(WORD_PATTERN.findall(text)))
+
+
+@dataclass(frozen=True)
+class AttachmentFeatures:
+    """Normalized filename of one attachment combined with its email's text."""
+
+    filename: str
+    extension: str  # Lowercased, without the dot
+    name_text: str  # Lowercased filename with underscores as spaces
+    name_terms: tuple[str, ...]  # Words of the filename stem, longer than 1 char
+    text: str  # name_text followed by the email text, as searched by the matcher
+    words: tuple[str, ...]  # Distinct words of text in first-occurrence order
+    tokens: frozenset[str]  # Whitespace-separated tokens of text
+
+
+@dataclass
+class EmailFeatures:
+    """
+    Normalized text of an email, computed once and reused by every node.
+
+    Attributes:
+        subject: Original subject
+        sender: Original sender address
+        body: Original body
+        text: Lowercased subject and body separated by a space
+        words: Distinct words of text in first-occurrence order
+        tokens: Whitespace-separated tokens of text
+        sender_lower: Lowercased sender address
+        sender_domain: Lowercased domain of the sender address
+    """
+
+    subject: str
+    sender: str
+    body: str
+    text: str
+    words: tuple[str, ...]
+    tokens: frozenset[str]
+    sender_lower: str
+    sender_domain: str
+    _attachments: dict[str, AttachmentFeatures] = field(
+        default_factory=dict, repr=False
+    )
+
+    @classmethod
+    def from_email_data(cls, email_data: dict[str, Any]) -> "EmailFeatures":
+        """
+        Build features from graph email data.
+
+        Args:
+            email_data: Dictionary with subject, sender, body and attachments
+
+        Returns:
+            Features with every attachment already normalized
+        """
+        subject = email_data.get("subject", "") or ""
+        sender = email_data.get("sender", "") or ""
+        body = email_data.get("body", "") or ""
+        text = f"{subject} {body}".lower()
+        sender_lower = sender.lower()
+
+        features = cls(
+            subject=subject,
+            sender=sender,
+            body=body,
+            text=text,
+            words=_distinct_words(text),
+            tokens=frozenset(text.split()),
+            sender_lower=sender_lower,
+            sender_domain=sender_lower.rpartition("@")[2],
+        )
+        for attachment in email_data.get("attachments", []) or []:
+            features.attachment(attachment)
+        return features
+
+    def describes(self, email_data: dict[str, Any]) -> bool:
+        """
+        Check whether these features were built from the given email data.
+
+        Args:
+            email_data: Dictionary with subject, sender and body
+
+        Returns:
+            True if subject, sender and body are unchanged
+        """
+        return (
+            self.subject == (email_data.get("subject", "") or "")
+            and self.sender == (email_data.get("sender", "") or "")
+            and self.body == (email_data.get("body", "") or "")
+        )
+
+    def attachment(self, attachment: dict[str, Any]) -> AttachmentFeatures:
+        """
+        Get the features of an attachment, normalizing it on first use.
+
+        Args:
+            attachment: Attachment metadata with a filename
+
+        Returns:
+            Attachment features
+        """
+        filename = attachment.get("filename", "") or ""
+        cached = self._attachments.get(filename)
+        if cached is not None:
+            return cached
+
+        filename_lower = filename.lower()
+        name_text = filename_lower.replace("_", " ")
+        stem = filename_lower.split(".")[0]
+        text = f"{name_text} {self.text}"
+
+        features = AttachmentFeatures(
+            filename=filename,
+            extension=filename_lower.split(".")[-1] if "." in filename_lower else "",
+            name_text=name_text,
+            name_terms=tuple(
+                word
+                for word in stem.replace("_", " ").replace("-", " ").split()
+                if len(word) > 1
+            ),
+            text=text,
+            words=tuple(
+                dict.fromkeys(WORD_PATTERN.findall(name_text) + list(self.words))
+            ),
+            tokens=self.tokens.union(name_text.split()),
+        )
+        self._attachments[filename] = features
+        return features
+
+
+def get_email_features(email_data: dict[str, Any]) -> EmailFeatures:
+    """
+    Get the features passed with email data, building them if absent.
+
+    Args:
+        email_data: Graph email data, optionally carrying ``features``
+
+    Returns:
+        Features describing the email data
+    """
+    features = email_data.get("features")
+    if isinstance(features, EmailFeatures) and features.describes(email_data):
+        return features
+    return EmailFeatures.from_email_data(email_data)
@@ -7,6 +7,7 @@ All business logic is stored in memory rather than hardcoded.
 """
 
 # # Standard library imports
+from collections import OrderedDict
 from datetime import datetime
 from typing import Literal, TypedDict
 
@@ -15,15 +16,20 @@ from langgraph.checkpoint.memory import MemorySaver
 from langgraph.graph import END, StateGraph
 
 # # Local application imports
+from src.agents.email_features import EmailFeatures
 from src.agents.nodes.asset_matcher import AssetMatcherNode
 from src.agents.nodes.attachment_processor import AttachmentProcessorNode
 from src.agents.nodes.feedback_integrator import FeedbackIntegratorNode
 from src.agents.nodes.relevance_filter import RelevanceFilterNode
+from src.email_interface.base import BaseEmailInterface
 from src.memory import create_memory_systems
 from src.utils.logging_system import get_logger, log_function
 
 logger = get_logger(__name__)
 
+# Emails whose features are kept between the relevance and matching stages
+FEATURE_CACHE_SIZE = 256
+
 
 # Define the state structure for our email processing graph
 class EmailState(TypedDict):
@@ -95,9 +101,14 @@ class EmailProcessingGraph:
         self.attachment_processor = AttachmentProcessorNode(
             memory_systems=memory_systems
         )
+        self.attachment_policy = self.attachment_processor.policy
 
         self.feedback_integrator = FeedbackIntegratorNode(memory_systems=memory_systems)
 
+        # Normalized email text shared by the nodes, keyed by email id. Kept
+        # outside EmailState so checkpoints only hold plain data.
+        self._email_features: OrderedDict[str, EmailFeatures] = OrderedDict()
+
         # Create the graph
         self.workflow = StateGraph(EmailState)
 
@@ -130,6 +141,43 @@ class EmailProcessingGraph:
 
         self.logger.info("Memory-driven email processing graph initialized")
 
+    def register_attachment_loader(
+        self, provider: str, loader: BaseEmailInterface
+    ) -> None:
+        """
+        Register the email interface that loads lazily fetched attachments.
+
+        Args:
+            provider: Provider name used in attachment source handles
+            loader: Connected email interface providing load_attachments
+        """
+        self.attachment_processor.register_attachment_loader(provider, loader)
+
+    def get_email_features(self, state: EmailState) -> EmailFeatures:
+        """
+        Get the normalized text features of the email in a state.
+
+        Features are built once per email and reused by every node; the
+        least recently used entries are dropped past FEATURE_CACHE_SIZE.
+
+        Args:
+            state: Current graph state
+
+        Returns:
+            Features for the state's subject, sender, body and attachments
+        """
+        email_id = state["email_id"]
+        features = self._email_features.get(email_id)
+        if features is not None and features.describes(state):
+            self._email_features.move_to_end(email_id)
+            return features
+
+        features = EmailFeatures.from_email_data(state)
+        self._email_features[email_id] = features
+        while len(self._email_features) > FEATURE_CACHE_SIZE:
+            self._email_features.popitem(last=False)
+        return features
+
     @log_function()
     async def evaluate_relevance(self, state: EmailState) -> EmailState:
         """
@@ -148,6 +196,7 @@ class EmailProcessingGraph:
                 "body": state["body"],
                 "attachments": state["attachments"],
                 "received_date": state["received_date"],
+                "features": self.get_email_features(state),
             }
 
             # Use memory-driven relevance evaluation
@@ -218,6 +267,7 @@ class EmailProcessingGraph:
                 "sender": state["sender"],
                 "body": state["body"],
                 "received_date": state["received_date"],
+                "features": self.get_email_features(state),
             }
 
             # Use memory-driven asset matching
@@ -269,6 +319,9 @@ class EmailProcessingGraph:
         """
         self.logger.info(f"Processing {len(state['attachments'])} attachments")
 
+        # Text features are only needed by relevance and matching
+        self._email_features.pop(state["email_id"], None)
+
         try:
             # Skip if no attachments
             if not state["attachments"]:
@@ -405,18 +458,17 @@ class EmailProcessingGraph:
             state["processing_errors"].append(f"Feedback integration error: {e}")
             return state
 
-    async def process_email(self, email_data: dict) -> dict:
+    def create_initial_state(self, email_data: dict) -> EmailState:
         """
-        Process a single email through the memory-driven graph.
+        Build the initial graph state for an email.
 
         Args:
             email_data: Dictionary with email information
 
         Returns:
-            Final state after processing with complete decision audit trail
+            Initial EmailState with empty result and audit fields
         """
-        # Initialize state with memory-driven architecture
-        initial_state = EmailState(
+        return EmailState(
             email_id=email_data.get("id", ""),
             subject=email_data.get("subject", ""),
             sender=email_data.get("sender", ""),
@@ -443,6 +495,19 @@ class EmailProcessingGraph:
             actions=[],
         )
 
+    async def process_email(self, email_data: dict) -> dict:
+        """
+        Process a single email through the memory-driven graph.
+
+        Args:
+            email_data: Dictionary with email information
+
+        Returns:
+            Final state after processing with complete decision audit trail
+        """
+        # Initialize state with memory-driven architecture
+        initial_state = self.create_initial_state(email_data)
+
         # Run through the memory-driven graph
         config = {"configurable": {"thread_id": email_data.get("id", "default")}}
         final_state = await self.app.ainvoke(initial_state, config)
@@ -0,0 +1,540 @@
+"""
+Staged ingestion pipeline for email processing.
+
+Connects an email interface's ``stream_emails`` generator to the stages of
+the EmailProcessingGraph through bounded asyncio queues:
+
+    fetch -> relevance -> match -> save
+
+Each stage runs its own workers, so the graph starts classifying the first
+email while later emails are still being downloaded. Bounded queues provide
+backpressure: when a downstream stage falls behind, its input queue fills
+and the upstream stage waits instead of buffering the whole mailbox.
+"""
+
+# # Standard library imports
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Any
+
+# # Local application imports
+from src.agents.email_graph import EmailProcessingGraph, EmailState
+from src.email_interface.base import BaseEmailInterface, Email, EmailSearchCriteria
+from src.utils.config import config
+from src.utils.logging_system import get_logger, log_function
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class StageStats:
+    """Throughput and queue statistics for a single pipeline stage."""
+
+    name: str
+    workers: int
+    processed: int = 0
+    failed: int = 0
+    busy_seconds: float = 0.0
+    queue_depth: int = 0
+    max_queue_depth: int = 0
+
+    def to_dict(self, elapsed_seconds: float) -> dict[str, Any]:
+        """
+        Convert the statistics to a dictionary.
+
+        Args:
+            elapsed_seconds: Wall time since the pipeline started
+
+        Returns:
+            Dictionary with counters, queue depth and throughput
+        """
+        return {
+            "workers": self.workers,
+            "processed": self.processed,
+            "failed": self.failed,
+            "busy_seconds": round(self.busy_seconds, 3),
+            "queue_depth": self.queue_depth,
+            "max_queue_depth": self.max_queue_depth,
+            "throughput_per_second": (
+                round(self.processed / elapsed_seconds, 3)
+                if elapsed_seconds > 0
+                else 0.0
+            ),
+        }
+
+
+@dataclass
+class _PipelineItem:
+    """An email travelling through the pipeline together with its state."""
+
+    index: int
+    email: Email
+    state: EmailState
+    started_at: float
+    finished_at: float | None = None
+    error: str | None = None
+
+
+def build_email_data(email: Email) -> dict[str, Any]:
+    """
+    Convert an interface Email into the dictionary format used by the graph.
+
+    Attachments listed without content (lazy fetching) are kept with their
+    plain-data source handle so AttachmentProcessorNode can download them
+    only if they are saved; attachments blocked by the pre-download policy
+    are kept without content so they are reported as blocked.
+
+    Args:
+        email: Email object returned by an email interface
+
+    Returns:
+        Email data dictionary for EmailProcessingGraph
+    """
+    logger.info(f"Email has {len(email.attachments)} attachments")
+    for j, att in enumerate(email.attachments):
+        logger.info(
+            f"  Attachment {j+1}: {att.filename} ({att.size} bytes, {att.content_type})"
+        )
+        if not att.is_loaded and not att.source and not att.blocked_reason:
+            logger.warning(f"    No content loaded for {att.filename}")
+
+    # Filter out attachments without content
+    valid_attachments = []
+    for att in email.attachments:
+        if att.is_loaded:
+            # Large attachments are passed by spool file path, not bytes
+            valid_attachments.append(
+                {
+                    "filename": att.filename,
+                    "content": att.content,
+                    "spool_path": att.spool_path,
+                    "content_sha256": att.content_sha256,
+                    "content_type": att.content_type,
+                    "size": att.size,
+                }
+            )
+        elif att.download_error:
+            logger.warning(
+                f"Skipping attachment {att.filename} - download failed: {att.download_error}"
+            )
+        elif att.source or att.blocked_reason:
+            # Blocked attachments stay so the processor reports them as blocked
+            if att.blocked_reason:
+                logger.info(
+                    f"Attachment {att.filename} was not downloaded: {att.blocked_reason}"
+                )
+            valid_attachments.append(
+                {
+                    "filename": att.filename,
+                    "content": None,
+                    "content_type": att.content_type,
+                    "size": att.size,
+                    "source": att.source,
+                }
+            )
+        else:
+            logger.warning(f"Skipping attachment {att.filename} - no content loaded")
+
+    # The email id doubles as the graph checkpoint thread id, which keeps
+    # concurrently processed emails from sharing checkpoint state.
+    return {
+        "id": email.id,
+        "subject": email.subject,
+        "sender": email.sender.address,
+        "body": email.body_text or email.body_html or "",
+        "attachments": valid_attachments,
+    }
+
+
+def release_attachment_content(email: Email) -> None:
+    """
+    Drop attachment content once an email has been processed.
+
+    Removes spool files of attachments that were not saved (saved ones
+    were moved into place) and frees in-memory content.
+
+    Args:
+        email: Processed email
+    """
+    for att in email.attachments:
+        att.discard_content()
+
+
+def build_email_summary(email: Email) -> dict[str, Any]:
+    """
+    Build the per-email summary returned by the processing API.
+
+    Args:
+        email: Email object returned by an email interface
+
+    Returns:
+        Summary dictionary without the processing result
+    """
+    return {
+        "email_subject": email.subject[:60],
+        "sender": email.sender.address,
+        "received_date": (
+            email.received_date.isoformat() if email.received_date else None
+        ),
+        "attachments_count": len(email.attachments),
+    }
+
+
+class EmailIngestionPipeline:
+    """
+    Producer/consumer pipeline that overlaps fetching with processing.
+
+    The fetch stage consumes ``interface.stream_emails`` and feeds the
+    relevance, match and save stages, which call the corresponding
+    EmailProcessingGraph nodes directly. The save stage also runs feedback
+    integration when the graph's routing would. Results are returned in
+    fetch order.
+
+    Each stage call is bounded by the per-email processing timeout. If the
+    fetch stage fails, emails already fetched still finish and their
+    results are returned; the error is kept on fetch_error.
+    """
+
+    STAGES = ("fetch", "relevance", "match", "save")
+
+    def __init__(
+        self,
+        graph: EmailProcessingGraph,
+        queue_size: int | None = None,
+        workers_per_stage: int | None = None,
+        processing_timeout: float | None = None,
+    ) -> None:
+        """
+        Initialize the pipeline.
+
+        Args:
+            graph: Email processing graph whose nodes run the stages
+            queue_size: Capacity of each inter-stage queue
+                (defaults to config.ingestion_queue_size)
+            workers_per_stage: Concurrent workers in each processing stage
+                (defaults to config.max_concurrent_emails)
+            processing_timeout: Seconds a single stage may take for one email
+                (defaults to config.processing_timeout_seconds)
+        """
+        self.graph = graph
+        self.queue_size = queue_size or config.ingestion_queue_size
+        self.workers_per_stage = workers_per_stage or config.max_concurrent_emails
+        self.processing_timeout = (
+            processing_timeout or config.processing_timeout_seconds
+        )
+        self.fetch_error: Exception | None = None
+
+        self.stats: dict[str, StageStats] = self._new_stats()
+        self._queues: dict[str, asyncio.Queue] = {}
+        self._results: list[_PipelineItem] = []
+        self._started_at: float | None = None
+        self._finished_at: float | None = None
+
+    @log_function()
+    async def run(
+        self,
+        interface: BaseEmailInterface,
+        criteria: EmailSearchCriteria,
+        incremental: bool = False,
+    ) -> list[dict[str, Any]]:
+        """
+        Stream emails from an interface through all pipeline stages.
+
+        Args:
+            interface: Connected email interface to stream from
+            criteria: Search criteria passed to stream_emails
+            incremental: Stream only emails added since the previous sync
+                (stream_new_emails) instead of the full listing
+
+        Returns:
+            Per-email summaries in fetch order
+        """
+        self._started_at = time.perf_counter()
+        self._finished_at = None
+        self._results = []
+        self.fetch_error = None
+        self.stats = self._new_stats()
+        self._queues = {
+            name: asyncio.Queue(maxsize=self.queue_size) for name in self.STAGES[1:]
+        }
+
+        workers = [
+            asyncio.create_task(self._stage_worker(stage, next_stage))
+            for stage, next_stage in (
+                ("relevance", "match"),
+                ("match", "save"),
+                ("save", None),
+            )
+            for _ in range(self.workers_per_stage)
+        ]
+
+        try:
+            try:
+                await self._fetch(interface, criteria, incremental)
+            except Exception as e:
+                # Emails fetched before the failure are still processed
+                logger.error(f"Pipeline fetch stage failed: {e}")
+                self.stats["fetch"].failed += 1
+                self.fetch_error = e
+
+            # Drain the stages in order so every fetched email completes
+            for name in self.STAGES[1:]:
+                await self._queues[name].join()
+        finally:
+            for worker in workers:
+                worker.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+            # Anything still queued (e.g. after cancellation) never finishes
+            for queue in self._queues.values():
+                while not queue.empty():
+                    self._abandon(queue.get_nowait())
+                    queue.task_done()
+            self._finished_at = time.perf_counter()
+
+        self._results.sort(key=lambda item: item.index)
+        summaries = [self._summarize(item) for item in self._results]
+
+        stats = self.get_stats()
+        logger.info(
+            f"Pipeline processed {len(summaries)} emails in "
+            f"{stats['wall_time_seconds']}s: "
+            + ", ".join(
+                f"{name} {stage['processed']} "
+                f"({stage['throughput_per_second']}/s, "
+                f"max queue {stage['max_queue_depth']})"
+                for name, stage in stats["stages"].items()
+            )
+        )
+        return summaries
+
+    def get_stats(self) -> dict[str, Any]:
+        """
+        Get per-stage queue depth and throughput counters.
+
+        Returns:
+            Dictionary with overall wall time and per-stage statistics
+        """
+        if self._started_at is None:
+            elapsed = 0.0
+        else:
+            end = self._finished_at or time.perf_counter()
+            elapsed = end - self._started_at
+
+        for name, queue in self._queues.items():
+            self.stats[name].queue_depth = queue.qsize()
+
+        return {
+            "queue_size": self.queue_size,
+            "workers_per_stage": self.workers_per_stage,
+            "wall_time_seconds": round(elapsed, 3),
+            "fetch_error": str(self.fetch_error) if self.fetch_error else None,
+            "stages": {
+                name: stage.to_dict(elapsed) for name, stage in self.stats.items()
+            },
+        }
+
+    def _new_stats(self) -> dict[str, StageStats]:
+        """
+        Create fresh statistics for every stage.
+
+        Returns:
+            Dictionary mapping stage names to their statistics
+        """
+        return {
+            "fetch": StageStats(name="fetch", workers=1),
+            **{
+                name: StageStats(name=name, workers=self.workers_per_stage)
+                for name in self.STAGES[1:]
+            },
+        }
+
+    async def _fetch(
+        self,
+        interface: BaseEmailInterface,
+        criteria: EmailSearchCriteria,
+        incremental: bool,
+    ) -> None:
+        """
+        Producer stage: stream emails and enqueue them for relevance.
+
+        Blocks on the bounded relevance queue when downstream stages fall
+        behind.
+
+        Args:
+            interface: Connected email interface to stream from
+            criteria: Search criteria passed to the stream
+            incremental: Use stream_new_emails instead of stream_emails
+        """
+        fetch_stats = self.stats["fetch"]
+        index = 0
+        stage_start = time.perf_counter()
+
+        stream = (
+            interface.stream_new_emails(criteria)
+            if incremental
+            else interface.stream_emails(criteria)
+        )
+
+        async for email in stream:
+            index += 1
+            fetch_stats.busy_seconds += time.perf_counter() - stage_start
+            logger.info(f"Fetched email {index}: {email.subject[:50]}...")
+
+            try:
+                state = self.graph.create_initial_state(build_email_data(email))
+                item = _PipelineItem(
+                    index=index,
+                    email=email,
+                    state=state,
+                    started_at=time.perf_counter(),
+                )
+            except Exception as e:
+                logger.error(f"Failed to prepare email {index} for processing: {e}")
+                fetch_stats.failed += 1
+                release_attachment_content(email)
+                self._results.append(
+                    _PipelineItem(
+                        index=index,
+                        email=email,
+                        state=self.graph.create_initial_state({"id": email.id}),
+                        started_at=stage_start,
+                        finished_at=time.perf_counter(),
+                        error=str(e),
+                    )
+                )
+                stage_start = time.perf_counter()
+                continue
+
+            fetch_stats.processed += 1
+            await self._enqueue("relevance", item)
+            stage_start = time.perf_counter()
+
+    async def _enqueue(self, stage: str, item: _PipelineItem) -> None:
+        """
+        Put an item on a stage's input queue and track its depth.
+
+        Args:
+            stage: Name of the stage to enqueue for
+            item: Pipeline item to enqueue
+        """
+        queue = self._queues[stage]
+        await queue.put(item)
+        stats = self.stats[stage]
+        stats.queue_depth = queue.qsize()
+        stats.max_queue_depth = max(stats.max_queue_depth, stats.queue_depth)
+
+    async def _stage_worker(self, stage: str, next_stage: str | None) -> None:
+        """
+        Consumer loop for one processing stage.
+
+        A failure or timeout is recorded on the item, which then skips the
+        remaining stages instead of stopping the pipeline.
+
+        Args:
+            stage: Name of the stage this worker runs
+            next_stage: Stage to hand items to, or None for the last stage
+        """
+        queue = self._queues[stage]
+        stats = self.stats[stage]
+
+        while True:
+            item = await queue.get()
+            try:
+                stage_start = time.perf_counter()
+                try:
+                    item.state = await asyncio.wait_for(
+                        self._run_stage(stage, item.state),
+                        timeout=self.processing_timeout,
+                    )
+                    stats.processed += 1
+                except TimeoutError:
+                    logger.error(
+                        f"Pipeline stage '{stage}' timed out after "
+                        f"{self.processing_timeout}s for email {item.index}"
+                    )
+                    stats.failed += 1
+                    item.error = (
+                        f"{stage} stage timed out after "
+                        f"{self.processing_timeout} seconds"
+                    )
+                except Exception as e:
+                    logger.error(
+                        f"Pipeline stage '{stage}' failed for email {item.index}: {e}"
+                    )
+                    stats.failed += 1
+                    item.error = f"{stage} stage error: {e}"
+                finally:
+                    stats.busy_seconds += time.perf_counter() - stage_start
+
+                if next_stage is None or item.error:
+                    item.finished_at = time.perf_counter()
+                    release_attachment_content(item.email)
+                    self._results.append(item)
+                else:
+                    await self._enqueue(next_stage, item)
+            except asyncio.CancelledError:
+                self._abandon(item)
+                raise
+            finally:
+                queue.task_done()
+
+    def _abandon(self, item: _PipelineItem) -> None:
+        """
+        Record an item the pipeline stopped before it completed.
+
+        Args:
+            item: Pipeline item that will not be processed further
+        """
+        item.error = item.error or "Pipeline stopped before processing completed"
+        item.finished_at = time.perf_counter()
+        release_attachment_content(item.email)
+        self._results.append(item)
+
+    async def _run_stage(self, stage: str, state: EmailState) -> EmailState:
+        """
+        Run the graph node(s) belonging to a stage.
+
+        Args:
+            stage: Name of the stage
+            state: Current email state
+
+        Returns:
+            Updated email state
+        """
+        if stage == "relevance":
+            return await self.graph.evaluate_relevance(state)
+        if stage == "match":
+            return await self.graph.match_assets(state)
+
+        state = await self.graph.process_attachments(state)
+        if self.graph.should_integrate_feedback(state) == "feedback":
+            state = await self.graph.integrate_feedback(state)
+        return state
+
+    def _summarize(self, item: _PipelineItem) -> dict[str, Any]:
+        """
+        Build the API summary for a completed pipeline item.
+
+        Args:
+            item: Completed pipeline item
+
+        Returns:
+            Summary dictionary matching the batch processing format
+        """
+        summary = build_email_summary(item.email)
+        finished_at = item.finished_at or time.perf_counter()
+        summary["processing_time_seconds"] = round(finished_at - item.started_at, 3)
+
+        if item.error:
+            summary["success"] = False
+            summary["error"] = item.error
+            summary["processing_result"] = {
+                "processing_errors": [item.error],
+                "actions": [],
+            }
+        else:
+            summary["success"] = True
+            summary["processing_result"] = item.state
+
+        return summary
@@ -6,20 +6,36 @@ and semantic memory for WHAT to match against (asset profiles, relationships).
 """
 
 # # Standard library imports
+import asyncio
+import math
+import random
 import re
+from collections.abc import Iterable
 from datetime import datetime
-from difflib import SequenceMatcher
 
 # Standard library imports
 from typing import Any
 
+# # Third-party imports
+import numpy as np
+from Levenshtein import ratio
+
 # # Local application imports
 # Local application imports
+from src.agents.asset_scoring import AssetScoringMatrix
+from src.agents.email_features import AttachmentFeatures, get_email_features
 from src.utils.config import config
 from src.utils.logging_system import get_logger, log_function
 
 logger = get_logger(__name__)
 
+# Assets per attachment whose rule-by-rule reasoning is rebuilt and reported
+REASONING_ASSET_LIMIT = 10
+
+# Candidate retrieval defaults, overridable in procedural memory thresholds
+DEFAULT_CANDIDATE_TOP_K = 20
+DEFAULT_RECALL_SAMPLE_RATE = 0.1
+
 
 class AssetMatcherNode:
     """
@@ -50,19 +66,52 @@ class AssetMatcherNode:
             self.episodic_memory = systems["episodic"]
 
         # Get threshold from procedural memory (memory-driven architecture)
+        self.candidate_top_k = DEFAULT_CANDIDATE_TOP_K
+        self.candidate_recall_sample_rate = DEFAULT_RECALL_SAMPLE_RATE
         try:
             if self.procedural_memory:
                 thresholds = self.procedural_memory.data.get("thresholds", {})
                 self.asset_match_threshold = thresholds.get(
                     "asset_match_threshold", config.requires_review_threshold
                 )
+                self.candidate_top_k = max(
+                    1, int(thresholds.get("candidate_top_k", DEFAULT_CANDIDATE_TOP_K))
+                )
+                self.candidate_recall_sample_rate = float(
+                    thresholds.get(
+                        "candidate_recall_sample_rate", DEFAULT_RECALL_SAMPLE_RATE
+                    )
+                )
             else:
                 self.asset_match_threshold = config.requires_review_threshold
         except Exception:
             self.asset_match_threshold = config.requires_review_threshold
 
+        # Compiled candidate assets, their keyword index and the fuzzy
+        # results for the last text matched against it
+        self._scoring_matrix: AssetScoringMatrix | None = None
+        self._fuzzy_index: FuzzyKeywordIndex | None = None
+        self._fuzzy_matches: (
+            tuple[AttachmentFeatures, FuzzyKeywordIndex, dict[str, dict[str, Any]]]
+            | None
+        ) = None
+
+        # Fuzzy index over the words of every catalog keyword, for retrieval
+        self._keyword_word_index: tuple[set[str], FuzzyKeywordIndex] | None = None
+
+        # Candidate retrieval counters, logged as pruning and recall@k metrics
+        self.retrieval_stats = {
+            "queries": 0,
+            "pool_assets": 0,
+            "candidates": 0,
+            "pruned": 0,
+            "recall_checks": 0,
+            "recall_hits": 0,
+        }
+
         logger.info(
-            f"Asset matcher initialized (threshold: {self.asset_match_threshold})"
+            f"Asset matcher initialized (threshold: {self.asset_match_threshold}, "
+            f"candidate top-k: {self.candidate_top_k})"
         )
 
     @log_function()
@@ -73,7 +122,8 @@ class AssetMatcherNode:
         Match attachments to specific investment assets.
 
         Args:
-            email_data: Email metadata (subject, sender, body)
+            email_data: Email metadata (subject, sender, body), optionally with
+                the email's precomputed features
             attachments: List of attachment metadata
 
         Returns:
@@ -105,6 +155,9 @@ class AssetMatcherNode:
 
         logger.info(f"Matching {len(attachments)} attachments to assets")
 
+        # Normalize the email text once for every rule, asset and attachment
+        email_data = {**email_data, "features": get_email_features(email_data)}
+
         # Get matching algorithms from procedural memory
         matching_rules = await self.query_matching_procedures(email_data)
         logger.info(
@@ -113,7 +166,9 @@ class AssetMatcherNode:
 
         # Get asset data from semantic memory - include attachments in context
         context_with_attachments = {**email_data, "attachments": attachments}
-        available_assets = await self.query_asset_profiles(context_with_attachments)
+        available_assets, candidate_pool = self._retrieve_candidates(
+            context_with_attachments
+        )
         logger.info(
             f"🔍 Retrieved {len(available_assets)} asset profiles from semantic memory"
         )
@@ -137,6 +192,22 @@ class AssetMatcherNode:
                 f"🔍 Attachment {i+1} generated {len(attachment_matches)} matches"
             )
 
+        # Sample emails whose pool was pruned to measure recall of the top-k
+        if (
+            len(candidate_pool) > len(available_assets)
+            and random.random() < self.candidate_recall_sample_rate
+        ):
+            # Scoring the whole pool is CPU-bound; keep it off the shared loop
+            await asyncio.to_thread(
+                self._check_candidate_recall,
+                attachments,
+                email_data,
+                matching_rules,
+                available_assets,
+                candidate_pool,
+                similar_cases,
+            )
+
         # Record matching session in episodic memory for learning
         await self._record_matching_session(email_data, attachments, matches)
 
@@ -232,7 +303,7 @@ class AssetMatcherNode:
             # Capture detailed reasoning about what was tried and why it failed
             fallback_reasoning = []
 
-            # Include information about all assets that were considered
+            # Include information about the best-scoring assets considered
             for asset_id, scores in asset_scores.items():
                 if asset_id == "HUMAN_REVIEW_QUEUE":
                     continue
@@ -292,7 +363,11 @@ class AssetMatcherNode:
                     "score": 0.1,  # Add score field for frontend compatibility
                     "reason": f"No asset achieved confidence ≥ {self.asset_match_threshold} - automatic human review required",
                     "total_assets_considered": len(
-                        [a for a in asset_scores if a != "HUMAN_REVIEW_QUEUE"]
+                        [
+                            a
+                            for a in available_assets
+                            if a["asset_id"] != "HUMAN_REVIEW_QUEUE"
+                        ]
                     ),
                     "highest_confidence": highest_conf,
                     "memory_source": "procedural_memory.matching_rules.fallback_policy",
@@ -350,6 +425,10 @@ class AssetMatcherNode:
         """
         Calculate confidence scores for each asset using memory-driven rules.
 
+        Every asset is scored at once through the compiled scoring matrix;
+        rule-by-rule reasoning is then rebuilt only for the highest-scoring
+        assets (at most REASONING_ASSET_LIMIT), which are the ones returned.
+
         Args:
             attachment: Attachment metadata
             email_data: Email context
@@ -358,7 +437,7 @@ class AssetMatcherNode:
             similar_cases: Episodic memory cases
 
         Returns:
-            Dictionary mapping asset_id to score data
+            Dictionary mapping asset_id to score data for the top assets
         """
         sender = email_data.get("sender", "").lower()
         filename = attachment.get("filename", "")
@@ -373,131 +452,303 @@ class AssetMatcherNode:
         logger.info(f"🔍   Filename: '{filename}'")
         logger.info(f"🔍   Available Assets: {len(available_assets)}")
         logger.info(f"🔍   Matching Rules: {len(matching_rules)}")
+        attachment_features = self._get_attachment_features(attachment, email_data)
+        logger.info(f"🔍   Combined text: '{attachment_features.text[:150]}...'")
+
+        matrix = self._get_scoring_matrix(available_assets)
+        adjustments = self._episodic_adjustments(
+            email_data.get("sender", ""), similar_cases
+        )
+        rule_scores, episodic, confidence = self._score_assets(
+            matrix,
+            self._fuzzy_index,
+            matching_rules,
+            attachment,
+            attachment_features,
+            email_data,
+            adjustments,
+        )
+
+        logger.info(
+            f"🔍   Scored {len(matrix)} assets; "
+            f"{int(np.count_nonzero(confidence >= self.asset_match_threshold))} "
+            f"reach threshold {self.asset_match_threshold}"
+        )
 
+        # Rebuild detailed reasoning for the assets that are reported
         asset_scores = {}
+        for position in matrix.top_indices(confidence, REASONING_ASSET_LIMIT):
+            asset_scores[matrix.asset_ids[position]] = self._build_score_data(
+                matrix.asset_ids[position],
+                matrix.profiles[position],
+                attachment,
+                email_data,
+                matching_rules,
+                [float(scores[position]) for scores in rule_scores],
+                float(episodic[position]),
+                float(confidence[position]),
+                similar_cases,
+            )
 
-        for asset_data in available_assets:
-            asset_id = asset_data["asset_id"]
-            profile = asset_data["profile"]
-            asset_name = profile.get("name", "unknown")
+        return asset_scores
 
-            logger.info(f"🔍 --- SCORING ASSET: {asset_id} ({asset_name}) ---")
+    def _get_scoring_matrix(
+        self, available_assets: list[dict[str, Any]]
+    ) -> AssetScoringMatrix:
+        """
+        Get the compiled scoring matrix for a list of candidate assets.
 
-            score_data = {
-                "confidence": 0.0,
-                "match_factors": [],
-                "confidence_factors": [],
-                "rule_matches": [],
-                "decision_reasoning": [],  # Initialize reasoning storage
-            }
+        The matrix and its fuzzy keyword index are built once per candidate
+        list and reused for every attachment of the email.
 
-            # Apply each matching rule from procedural memory
-            for rule in matching_rules:
-                rule_id = rule.get("rule_id", "unknown")
-                logger.info(f"🔍   Applying rule: {rule_id}")
+        Args:
+            available_assets: Candidate asset profiles
 
-                rule_score, reasoning = self._apply_matching_rule(
-                    rule, attachment, email_data, profile, asset_id
-                )
+        Returns:
+            Scoring matrix for the candidates
+        """
+        matrix = self._scoring_matrix
+        if matrix is None or matrix.source is not available_assets:
+            matrix = self._scoring_matrix = AssetScoringMatrix(available_assets)
+            self._fuzzy_index = FuzzyKeywordIndex(matrix.keywords.terms)
+            self._fuzzy_matches = None
+        return matrix
+
+    def _score_assets(
+        self,
+        matrix: AssetScoringMatrix,
+        fuzzy_index: "FuzzyKeywordIndex | None",
+        matching_rules: list[dict[str, Any]],
+        attachment: dict[str, Any],
+        attachment_features: AttachmentFeatures,
+        email_data: dict[str, Any],
+        adjustments: dict[str, float],
+    ) -> tuple[list[np.ndarray], np.ndarray, np.ndarray]:
+        """
+        Score every asset of a matrix with all matching rules.
 
-                # Store detailed reasoning for this rule
-                score_data["decision_reasoning"].append(reasoning)
+        Args:
+            matrix: Compiled assets
+            fuzzy_index: Keyword index of the matrix's assets
+            matching_rules: Procedural memory rules
+            attachment: Attachment metadata
+            attachment_features: Features of the attachment and its email
+            email_data: Email context
+            adjustments: Episodic adjustment per asset id
 
-                if rule_score > 0:
-                    weight = rule.get("weight", 1.0)
-                    weighted_score = rule_score * weight
-                    score_data["confidence"] += weighted_score
-                    score_data["rule_matches"].append(
-                        {
-                            "rule_id": rule_id,
-                            "score": rule_score,
-                            "weight": weight,
-                            "weighted_score": weighted_score,
-                        }
-                    )
-                    logger.info(
-                        f"🔍     ✓ {rule_id}: raw_score={rule_score:.3f}, weight={weight:.2f}, weighted={weighted_score:.3f}"
-                    )
-                else:
-                    logger.info(f"🔍     ✗ {rule_id}: score=0.000")
+        Returns:
+            Per-rule scores, episodic adjustments and final confidence,
+            each with one entry per asset
+        """
+        # Score all assets per rule, then combine with the rule weights
+        rule_scores = []
+        confidence = matrix.zeros()
+        for rule in matching_rules:
+            scores = self._score_rule(
+                rule, matrix, attachment, attachment_features, email_data, fuzzy_index
+            )
+            rule_scores.append(scores)
+            confidence += np.where(scores > 0, scores * rule.get("weight", 1.0), 0.0)
+
+        # Apply episodic learning adjustments
+        episodic = np.array(
+            [adjustments.get(asset_id, 0.0) for asset_id in matrix.asset_ids]
+        )
+        return rule_scores, episodic, np.minimum(confidence + episodic, 1.0)
+
+    def _score_rule(
+        self,
+        rule: dict[str, Any],
+        matrix: AssetScoringMatrix,
+        attachment: dict[str, Any],
+        attachment_features: AttachmentFeatures,
+        email_data: dict[str, Any],
+        fuzzy_index: "FuzzyKeywordIndex | None" = None,
+    ) -> np.ndarray:
+        """
+        Score every candidate asset with one matching rule.
+
+        Args:
+            rule: Matching rule from procedural memory
+            matrix: Compiled candidate assets
+            attachment: Attachment data
+            attachment_features: Features of the attachment and its email
+            email_data: Email context
+            fuzzy_index: Keyword index of the matrix's assets (the current
+                candidates' index if None)
+
+        Returns:
+            Per-asset rule scores, as _apply_matching_rule would return them
+        """
+        rule_id = rule.get("rule_id", "unknown")
+
+        if rule_id == "file_name_patterns":
+            return matrix.filename_pattern_scores(
+                attachment.get("filename", ""), rule.get("confidence", 0.8)
+            )
 
-            # Apply episodic learning adjustments
-            episodic_adjustment = self._apply_episodic_learning(
-                asset_id, email_data.get("sender", ""), similar_cases
+        if rule_id == "asset_name_in_content":
+            return matrix.asset_name_scores(
+                attachment_features.text,
+                attachment_features.tokens,
+                rule.get("confidence", 0.95),
             )
-            if episodic_adjustment != 0:
-                logger.info(f"🔍   📚 Episodic adjustment: {episodic_adjustment:+.3f}")
-                score_data["confidence"] += episodic_adjustment
-                score_data["confidence_factors"].append(
-                    f"Adjustment based on {len(similar_cases)} similar cases: {episodic_adjustment:+.3f}"
+
+        if rule_id == "sender_asset_association":
+            sender = email_data.get("sender", "").lower()
+            try:
+                sender_mapping = self.semantic_memory.get_sender_mapping(sender)
+            except Exception as e:
+                # The per-asset rule carries the fallback sender logic
+                logger.warning(f"🔍   Could not query sender mappings: {e}")
+                return np.array(
+                    [
+                        self._apply_matching_rule(
+                            rule, attachment, email_data, profile, asset_id
+                        )[0]
+                        for asset_id, profile in zip(
+                            matrix.asset_ids, matrix.profiles, strict=True
+                        )
+                    ]
                 )
+            asset_ids = sender_mapping.get("asset_ids", []) if sender_mapping else []
+            return matrix.sender_scores(asset_ids, rule.get("confidence", 0.3))
+
+        if rule_id == "keyword_match":
+            return matrix.keyword_scores(
+                self._keyword_matches(attachment_features, fuzzy_index),
+                attachment_features.text,
+                rule.get("confidence", 0.8),
+            )
+
+        return matrix.zeros()
+
+    def _build_score_data(
+        self,
+        asset_id: str,
+        profile: dict[str, Any],
+        attachment: dict[str, Any],
+        email_data: dict[str, Any],
+        matching_rules: list[dict[str, Any]],
+        rule_scores: list[float],
+        episodic_adjustment: float,
+        confidence: float,
+        similar_cases: list[dict[str, Any]],
+    ) -> dict[str, Any]:
+        """
+        Build the score data and decision reasoning for one scored asset.
 
-                # Add episodic reasoning to decision breakdown
-                score_data["decision_reasoning"].append(
+        Args:
+            asset_id: Asset identifier
+            profile: Asset profile from semantic memory
+            attachment: Attachment data
+            email_data: Email context
+            matching_rules: Procedural memory rules
+            rule_scores: Score of each rule for this asset
+            episodic_adjustment: Confidence adjustment from human feedback
+            confidence: Final capped confidence
+            similar_cases: Episodic memory cases
+
+        Returns:
+            Score data with rule matches and per-rule reasoning
+        """
+        logger.info(
+            f"🔍 --- SCORING ASSET: {asset_id} ({profile.get('name', 'unknown')}) ---"
+        )
+
+        score_data = {
+            "confidence": confidence,
+            "match_factors": [],
+            "confidence_factors": [],
+            "rule_matches": [],
+            "decision_reasoning": [],  # Initialize reasoning storage
+        }
+
+        for rule, rule_score in zip(matching_rules, rule_scores, strict=True):
+            # Rebuild the detailed reasoning for this rule
+            _, reasoning = self._apply_matching_rule(
+                rule, attachment, email_data, profile, asset_id
+            )
+            score_data["decision_reasoning"].append(reasoning)
+
+            if rule_score > 0:
+                weight = rule.get("weight", 1.0)
+                score_data["rule_matches"].append(
                     {
-                        "rule_id": "episodic_learning",
-                        "rule_name": "Learning from Similar Cases",
-                        "score": episodic_adjustment,
-                        "memory_items": [
-                            {
-                                "type": "episodic_memory",
-                                "source": "similar_cases",
-                                "content": [
-                                    {
-                                        "sender": case.get("sender", ""),
-                                        "asset_id": case.get("asset_id", ""),
-                                        "confidence": case.get("confidence", 0),
-                                    }
-                                    for case in similar_cases[:3]
-                                ],  # Truncate for readability
-                                "description": f"Similar cases for sender and asset combination ({len(similar_cases)} total)",
-                            }
-                        ],
-                        "evidence": {
-                            "similar_cases_count": len(similar_cases),
-                            "adjustment": episodic_adjustment,
-                        },
-                        "contributing_factors": [
-                            f"Adjustment based on {len(similar_cases)} similar cases: {episodic_adjustment:+.3f}"
-                        ],
+                        "rule_id": rule.get("rule_id", "unknown"),
+                        "score": rule_score,
+                        "weight": weight,
+                        "weighted_score": rule_score * weight,
                     }
                 )
 
-            # Cap confidence at 1.0
-            score_data["confidence"] = min(score_data["confidence"], 1.0)
-
-            # Add detailed reasoning
-            if score_data["confidence"] > 0:
-                score_data["match_factors"].append(
-                    f"Asset: {profile.get('name', asset_id)}"
-                )
-                if score_data["rule_matches"]:
-                    score_data["confidence_factors"].append(
-                        f"Rule matches: {len(score_data['rule_matches'])}"
-                    )
+        if episodic_adjustment != 0:
+            logger.info(f"🔍   📚 Episodic adjustment: {episodic_adjustment:+.3f}")
+            score_data["confidence_factors"].append(
+                f"Adjustment based on {len(similar_cases)} similar cases: {episodic_adjustment:+.3f}"
+            )
 
-            # Store comprehensive scoring details
-            score_data.update(
+            # Add episodic reasoning to decision breakdown
+            score_data["decision_reasoning"].append(
                 {
-                    "asset_id": asset_id,
-                    "asset_name": profile.get("name", asset_id),
-                    "final_score": score_data["confidence"],
-                    "base_average": score_data["confidence"],
-                    "episodic_adjustment": episodic_adjustment,
-                    "rules_applied": len(score_data["rule_matches"]),
-                    "cumulative_score": score_data["confidence"],
-                    "profile": profile,  # Include full profile for reference
+                    "rule_id": "episodic_learning",
+                    "rule_name": "Learning from Similar Cases",
+                    "score": episodic_adjustment,
+                    "memory_items": [
+                        {
+                            "type": "episodic_memory",
+                            "source": "similar_cases",
+                            "content": [
+                                {
+                                    "sender": case.get("sender", ""),
+                                    "asset_id": case.get("asset_id", ""),
+                                    "confidence": case.get("confidence", 0),
+                                }
+                                for case in similar_cases[:3]
+                            ],  # Truncate for readability
+                            "description": f"Similar cases for sender and asset combination ({len(similar_cases)} total)",
+                        }
+                    ],
+                    "evidence": {
+                        "similar_cases_count": len(similar_cases),
+                        "adjustment": episodic_adjustment,
+                    },
+                    "contributing_factors": [
+                        f"Adjustment based on {len(similar_cases)} similar cases: {episodic_adjustment:+.3f}"
+                    ],
                 }
             )
 
-            # Debug logging for final scores
-            logger.info(
-                f"🔍   FINAL SCORE for {asset_id}: {score_data['confidence']:.3f} (threshold: {self.asset_match_threshold})"
+        # Add detailed reasoning
+        if score_data["confidence"] > 0:
+            score_data["match_factors"].append(
+                f"Asset: {profile.get('name', asset_id)}"
             )
+            if score_data["rule_matches"]:
+                score_data["confidence_factors"].append(
+                    f"Rule matches: {len(score_data['rule_matches'])}"
+                )
 
-            asset_scores[asset_id] = score_data
+        # Store comprehensive scoring details
+        score_data.update(
+            {
+                "asset_id": asset_id,
+                "asset_name": profile.get("name", asset_id),
+                "final_score": score_data["confidence"],
+                "base_average": score_data["confidence"],
+                "episodic_adjustment": episodic_adjustment,
+                "rules_applied": len(score_data["rule_matches"]),
+                "cumulative_score": score_data["confidence"],
+                "profile": profile,  # Include full profile for reference
+            }
+        )
 
-        return asset_scores
+        # Debug logging for final scores
+        logger.info(
+            f"🔍   FINAL SCORE for {asset_id}: {score_data['confidence']:.3f} (threshold: {self.asset_match_threshold})"
+        )
+
+        return score_data
 
     def _apply_matching_rule(
         self,
@@ -522,7 +773,8 @@ class AssetMatcherNode:
         """
         rule_id = rule.get("rule_id", "unknown")
         filename = attachment.get("filename", "")
-        combined_text = self._get_combined_text(attachment, email_data)
+        attachment_features = self._get_attachment_features(attachment, email_data)
+        combined_text = attachment_features.text
 
         # Initialize reasoning details
         reasoning = {
@@ -608,7 +860,7 @@ class AssetMatcherNode:
 
                 # Partial name match: check for significant word overlap
                 asset_words = set(asset_name.split())
-                text_words = set(combined_text.split())
+                text_words = attachment_features.tokens
                 common_words = asset_words.intersection(text_words)
 
                 reasoning["evidence"]["asset_words"] = list(asset_words)
@@ -781,11 +1033,8 @@ class AssetMatcherNode:
                     )
                 else:
                     # Try fuzzy matching for typos, abbreviations, case variations
-                    fuzzy_result = fuzzy_keyword_match(
-                        keyword,
-                        combined_text,
-                        exact_threshold=0.9,
-                        partial_threshold=0.7,
+                    fuzzy_result = self._fuzzy_keyword_match(
+                        keyword, attachment_features
                     )
 
                     if fuzzy_result["score"] > 0:
@@ -941,39 +1190,134 @@ class AssetMatcherNode:
 
         return 0.0, reasoning
 
-    def _get_combined_text(
+    def _fuzzy_keyword_match(
+        self, keyword: str, attachment_features: AttachmentFeatures
+    ) -> dict[str, Any]:
+        """
+        Fuzzy-match an asset keyword against the combined attachment text.
+
+        Uses the keyword index built for the current attachment, matching
+        the text's words against it on first use; keywords outside the index
+        fall back to fuzzy_keyword_match.
+
+        Args:
+            keyword: Asset keyword
+            attachment_features: Features of the attachment and its email
+
+        Returns:
+            Match info as returned by fuzzy_keyword_match
+        """
+        if self._fuzzy_index is not None:
+            result = self._keyword_matches(attachment_features).get(keyword.lower())
+            if result is not None:
+                return result
+
+        return fuzzy_keyword_match(
+            keyword,
+            attachment_features.text,
+            exact_threshold=0.9,
+            partial_threshold=0.7,
+        )
+
+    def _keyword_matches(
+        self,
+        attachment_features: AttachmentFeatures,
+        fuzzy_index: "FuzzyKeywordIndex | None" = None,
+    ) -> dict[str, dict[str, Any]]:
+        """
+        Match every indexed asset keyword against an attachment's text.
+
+        Results are kept for the last attachment and index, as every asset
+        and the rebuilt reasoning look them up for the same text.
+
+        Args:
+            attachment_features: Features of the attachment and its email
+            fuzzy_index: Keyword index to match (the current candidates'
+                index if None)
+
+        Returns:
+            Match info per lowercased keyword (empty without an index)
+        """
+        if fuzzy_index is None:
+            fuzzy_index = self._fuzzy_index
+        if fuzzy_index is None:
+            return {}
+
+        if (
+            self._fuzzy_matches is None
+            or self._fuzzy_matches[0] is not attachment_features
+            or self._fuzzy_matches[1] is not fuzzy_index
+        ):
+            self._fuzzy_matches = (
+                attachment_features,
+                fuzzy_index,
+                fuzzy_index.match_text(
+                    attachment_features.text,
+                    exact_threshold=0.9,
+                    partial_threshold=0.7,
+                    words=attachment_features.words,
+                ),
+            )
+        return self._fuzzy_matches[2]
+
+    def _get_attachment_features(
         self, attachment: dict[str, Any], email_data: dict[str, Any]
-    ) -> str:
+    ) -> AttachmentFeatures:
         """
-        Combine attachment filename, email subject and body into searchable text.
+        Get the searchable text of an attachment's filename, subject and body.
 
         Args:
             attachment: Attachment metadata
-            email_data: Email context
+            email_data: Email context, optionally with precomputed features
 
         Returns:
-            Combined text for keyword matching
+            Attachment features whose text is used for keyword matching
         """
-        filename = attachment.get("filename", "").lower().replace("_", " ")
-        subject = email_data.get("subject", "").lower()
-        body = email_data.get("body", "").lower()
+        return get_email_features(email_data).attachment(attachment)
 
-        # Clean and combine text
-        combined = f"{filename} {subject} {body}"
+    def _episodic_adjustments(
+        self, sender: str, similar_cases: list[dict[str, Any]]
+    ) -> dict[str, float]:
+        """
+        Get human feedback adjustments for every asset the sender has feedback on.
+
+        Human feedback is queried once per sender rather than once per asset.
 
-        # Log for debugging
-        logger.info(f"🔍       Filename text: '{filename}'")
-        logger.info(f"🔍       Subject text: '{subject}'")
-        logger.info(f"🔍       Body text: '{body[:100]}...'")
-        logger.info(f"🔍       Combined text: '{combined[:150]}...'")
+        Args:
+            sender: Email sender
+            similar_cases: Similar cases from processing history (NOT used for decision-making)
 
-        return combined
+        Returns:
+            Mapping of asset_id to non-zero confidence adjustment
+        """
+        if not self.episodic_memory:
+            return {}
+
+        try:
+            feedback_patterns = self.episodic_memory.search_human_feedback_patterns(
+                sender=sender, feedback_type="asset_match", limit=10
+            )
+        except Exception as e:
+            logger.error(f"Failed to apply human feedback learning: {e}")
+            return {}
+
+        adjustments = {}
+        for asset_id in dict.fromkeys(
+            feedback.get("asset_id") for feedback in feedback_patterns or []
+        ):
+            adjustment = self._apply_episodic_learning(
+                asset_id, sender, similar_cases, feedback_patterns
+            )
+            if adjustment != 0:
+                adjustments[asset_id] = adjustment
+        return adjustments
 
     def _apply_episodic_learning(
         self,
         asset_id: str,
         sender: str,
         similar_cases: list[dict[str, Any]],
+        feedback_patterns: list[dict[str, Any]] | None = None,
     ) -> float:
         """
         Apply learning from human feedback to adjust confidence.
@@ -985,6 +1329,7 @@ class AssetMatcherNode:
             asset_id: Asset ID being matched
             sender: Email sender
             similar_cases: Similar cases from processing history (NOT used for decision-making)
+            feedback_patterns: Human feedback already queried for the sender
 
         Returns:
             Confidence adjustment based on human feedback (-0.3 to +0.3)
@@ -994,9 +1339,10 @@ class AssetMatcherNode:
 
         try:
             # Query ONLY human feedback patterns, NOT processing history
-            feedback_patterns = self.episodic_memory.search_human_feedback_patterns(
-                sender=sender, feedback_type="asset_match", limit=10
-            )
+            if feedback_patterns is None:
+                feedback_patterns = self.episodic_memory.search_human_feedback_patterns(
+                    sender=sender, feedback_type="asset_match", limit=10
+                )
 
             if not feedback_patterns:
                 return 0.0
@@ -1083,31 +1429,53 @@ class AssetMatcherNode:
         self, context: dict[str, Any]
     ) -> list[dict[str, Any]]:
         """
-        Query semantic memory for asset profiles using search terms and fallback strategies.
+        Query semantic memory for the candidate assets of an email.
+
+        Args:
+            context: Email context for filtering relevant assets
+
+        Returns:
+            At most candidate_top_k asset profiles with retrieval scores
+        """
+        candidates, _ = self._retrieve_candidates(context)
+        return candidates
+
+    def _retrieve_candidates(
+        self, context: dict[str, Any]
+    ) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+        """
+        Retrieve candidate assets from the semantic memory indexes.
+
+        First stage of matching: every strategy looks assets up in the
+        asset profile index instead of scanning the catalog, and only the
+        candidate_top_k best-scoring assets go on to full scoring.
 
         Uses multiple strategies to ensure relevant assets are found:
         1. Specific term matching (asset-specific keywords)
-        2. Sender-based asset retrieval (trusted senders)
-        3. Fuzzy term matching for partial matches
+        2. Filename pattern matching
+        3. Sender-based asset retrieval (trusted senders)
+        4. Fuzzy term matching for partial matches
+
+        When no strategy finds an asset, no candidates are returned and the
+        attachments are routed to the human review queue.
 
         Args:
-            context: Email context for filtering relevant assets
+            context: Email context with its attachments
 
         Returns:
-            List of asset profiles with keywords and patterns
+            Tuple of the top-k candidates and the whole retrieved pool, both
+            sorted by retrieval score
         """
         if not self.semantic_memory:
             logger.warning("Semantic memory not available, using defaults")
-            return []
+            return [], []
 
         try:
             # DEBUG: Check what's actually in semantic memory
-            total_assets = len(self.semantic_memory.data.get("asset_profiles", {}))
-            logger.info(f"🔍 DEBUG: Total assets in semantic memory: {total_assets}")
-            asset_names = list(
-                self.semantic_memory.data.get("asset_profiles", {}).keys()
+            asset_profiles = self.semantic_memory.data.get("asset_profiles", {})
+            logger.info(
+                f"🔍 DEBUG: Total assets in semantic memory: {len(asset_profiles)}"
             )
-            logger.info(f"🔍 DEBUG: Asset IDs in memory: {asset_names}")
 
             # Extract search terms from email content
             search_terms = self._extract_search_terms(context)
@@ -1116,9 +1484,11 @@ class AssetMatcherNode:
 
             # Get all asset keywords from semantic memory
             all_asset_keywords = self._get_all_asset_keywords()
-            logger.info(f"🔍 All asset keywords in memory: {sorted(all_asset_keywords)}")
+            logger.info(f"🔍 Asset keyword tokens in memory: {len(all_asset_keywords)}")
 
-            all_results = []
+            # Best retrieval score per asset, in the order assets were found
+            found: dict[str, float] = {}
+            sources: dict[str, int] = {}
 
             # Strategy 1: Search for specific terms that exist in asset keywords
             specific_terms = [
@@ -1136,13 +1506,28 @@ class AssetMatcherNode:
                     logger.info(
                         f"🔍     {result['asset_id']} ({result['profile'].get('name', 'N/A')}): score={result['score']:.3f}"
                     )
-                all_results.extend(results)
+                    self._add_candidate(found, sources, "keywords", result)
+
+            # Strategy 2: Assets whose filename patterns occur in a filename
+            for attachment in context.get("attachments", []):
+                filename = attachment.get("filename", "")
+                if not filename:
+                    continue
+                for asset_id in self.semantic_memory.find_assets_by_filename(filename):
+                    logger.info(f"🔍 Strategy 2 - Filename pattern match: {asset_id}")
+                    self._add_candidate(
+                        found,
+                        sources,
+                        "filename_patterns",
+                        {"asset_id": asset_id, "score": 0.5},
+                    )
 
-            # Strategy 2: Sender-based asset retrieval for trusted senders
+            # Strategy 3: Sender-based asset retrieval for trusted senders
             sender = context.get("sender", "")
+            sender_mapping = None
             if sender:
                 logger.info(
-                    f"🔍 Strategy 2 - Checking sender-based assets for: {sender}"
+                    f"🔍 Strategy 3 - Checking sender-based assets for: {sender}"
                 )
                 sender_mapping = self.semantic_memory.get_sender_mapping(sender)
                 if sender_mapping and "asset_ids" in sender_mapping:
@@ -1150,119 +1535,220 @@ class AssetMatcherNode:
                     logger.info(f"🔍   Sender has access to assets: {sender_assets}")
 
                     # Add all sender's assets as candidates with base relevance score
-                    asset_profiles = self.semantic_memory.data.get("asset_profiles", {})
                     for asset_id in sender_assets:
-                        if asset_id in asset_profiles and not any(
-                            r["asset_id"] == asset_id for r in all_results
-                        ):
-                            # Only add if not already found in strategy 1
-                            all_results.append(
-                                {
-                                    "asset_id": asset_id,
-                                    "profile": asset_profiles[asset_id],
-                                    "score": 0.3,  # Base relevance for sender assets
-                                }
+                        if asset_id in asset_profiles and asset_id not in found:
+                            # Only add if not already found by a stronger strategy
+                            self._add_candidate(
+                                found,
+                                sources,
+                                "sender",
+                                {"asset_id": asset_id, "score": 0.3},
                             )
                             logger.info(
                                 f"🔍     Added sender asset: {asset_id} (base score: 0.3)"
                             )
 
-            # Strategy 3: Fuzzy term matching for asset keywords
-            if len(all_results) < 3:  # Only if we don't have many results
-                logger.info("🔍 Strategy 3 - Fuzzy matching for additional assets")
-                asset_profiles = self.semantic_memory.data.get("asset_profiles", {})
-
-                for asset_id, profile in asset_profiles.items():
+            # Strategy 4: Fuzzy term matching for asset keywords
+            if len(found) < 3:  # Only if we don't have many results
+                logger.info("🔍 Strategy 4 - Fuzzy matching for additional assets")
+                for asset_id, best_fuzzy_score in self._fuzzy_candidates(
+                    search_terms
+                ).items():
                     # Skip if already found
-                    if any(r["asset_id"] == asset_id for r in all_results):
+                    if asset_id in found:
                         continue
-
-                    # Check for fuzzy matches between search terms and asset keywords
-                    keywords = profile.get("keywords", [])
-                    best_fuzzy_score = 0.0
-
-                    for search_term in search_terms:
-                        for keyword in keywords:
-                            # Use fuzzy matching
-                            fuzzy_result = fuzzy_keyword_match(
-                                search_term,
-                                keyword,
-                                exact_threshold=0.8,
-                                partial_threshold=0.6,
-                            )
-                            if fuzzy_result["score"] > best_fuzzy_score:
-                                best_fuzzy_score = fuzzy_result["score"]
-
-                    # Add assets with decent fuzzy matches
-                    if best_fuzzy_score >= 0.6:
-                        all_results.append(
-                            {
-                                "asset_id": asset_id,
-                                "profile": profile,
-                                "score": best_fuzzy_score
-                                * 0.5,  # Discounted fuzzy score
-                            }
-                        )
-                        logger.info(
-                            f"🔍     Added fuzzy match: {asset_id} (fuzzy score: {best_fuzzy_score:.3f})"
-                        )
+                    self._add_candidate(
+                        found,
+                        sources,
+                        "fuzzy",
+                        {
+                            "asset_id": asset_id,
+                            "score": best_fuzzy_score * 0.5,  # Discounted fuzzy score
+                        },
+                    )
+                    logger.info(
+                        f"🔍     Added fuzzy match: {asset_id} (fuzzy score: {best_fuzzy_score:.3f})"
+                    )
 
             # DEBUG: Check if we have no search results at all
-            if not all_results:
+            if not found:
                 logger.warning("🔍 WARNING: No asset profiles found with any strategy")
                 logger.warning(f"🔍 Search terms: {search_terms}")
-                logger.warning(f"🔍 Asset keywords: {sorted(all_asset_keywords)}")
                 logger.warning(f"🔍 Sender: {sender}")
+                # No index signal to rank the catalog by; leave it to review
+                logger.info("🔍 No candidates retrieved - routing to human review")
+                return [], []
 
-                # Last resort: return all assets if sender is trusted
-                if sender_mapping and sender_mapping.get("trust_score", 0) >= 0.8:
-                    logger.info(
-                        "🔍 Last resort: returning all assets for trusted sender"
-                    )
-                    asset_profiles = self.semantic_memory.data.get("asset_profiles", {})
-                    for asset_id, profile in asset_profiles.items():
-                        all_results.append(
-                            {
-                                "asset_id": asset_id,
-                                "profile": profile,
-                                "score": 0.1,  # Very low base score
-                            }
-                        )
-
-                if not all_results:
-                    return []
-
-            # Deduplicate and merge scores
-            asset_map = {}
-            for result in all_results:
-                asset_id = result["asset_id"]
-                if asset_id not in asset_map:
-                    asset_map[asset_id] = result
-                else:
-                    # Combine scores (take maximum)
-                    asset_map[asset_id]["score"] = max(
-                        asset_map[asset_id]["score"], result["score"]
-                    )
+            # Rank the pool by retrieval score (stable, so ties keep the order
+            # assets were found in) and prune it to the top k
+            pool = [
+                {
+                    "asset_id": asset_id,
+                    "profile": asset_profiles[asset_id],
+                    "score": score,
+                }
+                for asset_id, score in sorted(
+                    found.items(), key=lambda item: item[1], reverse=True
+                )
+            ]
+            candidates = pool[: self.candidate_top_k]
+            pruned = len(pool) - len(candidates)
+
+            stats = self.retrieval_stats
+            stats["queries"] += 1
+            stats["pool_assets"] += len(pool)
+            stats["candidates"] += len(candidates)
+            stats["pruned"] += pruned
+            logger.info(
+                f"🔍 Candidate retrieval: {len(pool)} of {len(asset_profiles)} assets "
+                f"retrieved {sources}, kept top {len(candidates)} "
+                f"(k={self.candidate_top_k}), pruned {pruned}"
+            )
 
-            final_results = list(asset_map.values())
-            logger.info(f"🔍 FINAL ASSET PROFILES ({len(final_results)} unique):")
-            for result in final_results:
+            logger.info(
+                f"🔍 FINAL ASSET PROFILES ({len(candidates)} of {len(pool)} unique):"
+            )
+            for result in candidates:
                 logger.info(
                     f"🔍   {result['asset_id']} ({result['profile'].get('name', 'N/A')}): final_score={result['score']:.3f}"
                 )
 
-            # Sort by score and return top matches
-            final_results.sort(key=lambda x: x["score"], reverse=True)
-            top_results = final_results[:20]  # Limit to top 20
-
             logger.info(
-                f"🔍 === ASSET PROFILES QUERY COMPLETE ({len(top_results)} returned) ==="
+                f"🔍 === ASSET PROFILES QUERY COMPLETE ({len(candidates)} returned) ==="
             )
-            return top_results
+            return candidates, pool
 
         except Exception as e:
             logger.error(f"Failed to query semantic memory: {e}")
-            return []
+            return [], []
+
+    @staticmethod
+    def _add_candidate(
+        found: dict[str, float],
+        sources: dict[str, int],
+        source: str,
+        result: dict[str, Any],
+    ) -> None:
+        """
+        Record a retrieved asset, keeping its best retrieval score.
+
+        Args:
+            found: Best score per asset id, updated in place
+            sources: Number of assets first found per strategy, updated in place
+            source: Strategy that retrieved the asset
+            result: Retrieval result with 'asset_id' and 'score'
+        """
+        asset_id = result["asset_id"]
+        if asset_id not in found:
+            found[asset_id] = result["score"]
+            sources[source] = sources.get(source, 0) + 1
+        else:
+            found[asset_id] = max(found[asset_id], result["score"])
+
+    def _fuzzy_candidates(self, search_terms: list[str]) -> dict[str, float]:
+        """
+        Find assets whose keywords fuzzy-match any search term.
+
+        Scores each asset as fuzzy_keyword_match(term, keyword, 0.8, 0.6)
+        would for its best term and keyword, but through the semantic
+        memory indexes: keyword words similar to a term are found by
+        length-bounded comparison, and keywords containing a term through
+        the substring index.
+
+        Args:
+            search_terms: Lowercased search terms
+
+        Returns:
+            Best fuzzy score (at least 0.6) per asset id, in catalog order
+        """
+        # The word index is rebuilt only when the catalog's vocabulary changes
+        words = self.semantic_memory.get_asset_keyword_words()
+        if self._keyword_word_index is None or self._keyword_word_index[0] != words:
+            self._keyword_word_index = (words, FuzzyKeywordIndex(words))
+        word_index = self._keyword_word_index[1]
+
+        best: dict[str, float] = {}
+        for word, score in word_index.similar_keywords(search_terms, 0.6).items():
+            for asset_id in self.semantic_memory.get_assets_by_keyword_word(word):
+                best[asset_id] = max(best.get(asset_id, 0.0), score)
+
+        # A term inside a keyword is an exact match
+        for term in search_terms:
+            for asset_id in self.semantic_memory.find_assets_by_keyword_substring(term):
+                best[asset_id] = 1.0
+
+        return {
+            asset_id: best[asset_id]
+            for asset_id in self.semantic_memory.index.in_catalog_order(set(best))
+        }
+
+    def _check_candidate_recall(
+        self,
+        attachments: list[dict[str, Any]],
+        email_data: dict[str, Any],
+        matching_rules: list[dict[str, Any]],
+        candidates: list[dict[str, Any]],
+        pool: list[dict[str, Any]],
+        similar_cases: list[dict[str, Any]],
+    ) -> None:
+        """
+        Measure whether top-k pruning lost any attachment's best match.
+
+        Scores the whole retrieved pool as if nothing had been pruned. An
+        attachment whose best pool asset reaches the threshold counts as a
+        hit when that asset was among the kept candidates; the running
+        recall@k is logged.
+
+        Args:
+            attachments: Attachments of the email
+            email_data: Email context with its features
+            matching_rules: Procedural memory rules
+            candidates: Candidates kept for scoring
+            pool: Every retrieved asset
+            similar_cases: Similar cases from episodic memory
+        """
+        try:
+            matrix = AssetScoringMatrix(pool)
+            fuzzy_index = FuzzyKeywordIndex(matrix.keywords.terms)
+            adjustments = self._episodic_adjustments(
+                email_data.get("sender", ""), similar_cases
+            )
+            kept = {candidate["asset_id"] for candidate in candidates}
+
+            stats = self.retrieval_stats
+            for attachment in attachments:
+                _, _, confidence = self._score_assets(
+                    matrix,
+                    fuzzy_index,
+                    matching_rules,
+                    attachment,
+                    self._get_attachment_features(attachment, email_data),
+                    email_data,
+                    adjustments,
+                )
+                best = int(np.argmax(confidence))
+                if confidence[best] < self.asset_match_threshold:
+                    continue
+
+                stats["recall_checks"] += 1
+                if matrix.asset_ids[best] in kept:
+                    stats["recall_hits"] += 1
+                else:
+                    logger.warning(
+                        f"🔍 Candidate pruning missed {matrix.asset_ids[best]} "
+                        f"(confidence {confidence[best]:.3f}) for "
+                        f"{attachment.get('filename', 'N/A')}"
+                    )
+        except Exception as e:
+            logger.error(f"Failed to check candidate recall: {e}")
+            return
+
+        if stats["recall_checks"]:
+            logger.info(
+                f"🔍 Candidate recall@{self.candidate_top_k}: "
+                f"{stats['recall_hits']}/{stats['recall_checks']} "
+                f"({stats['recall_hits'] / stats['recall_checks']:.1%})"
+            )
 
     async def query_similar_cases(
         self, context: dict[str, Any]
@@ -1347,16 +1833,12 @@ class AssetMatcherNode:
             logger.info(f"🔍   Body terms: {body_words[:10]}")
 
         # Extract from attachment filenames
+        features = get_email_features(context)
         for attachment in attachments:
             filename = attachment.get("filename", "")
             if filename:
-                # Remove extension and split
-                name_part = filename.lower().split(".")[0]
-                filename_words = [
-                    word.strip().lower()
-                    for word in name_part.replace("_", " ").replace("-", " ").split()
-                    if len(word.strip()) > 1
-                ]
+                # Filename stem words, normalized once per email
+                filename_words = list(features.attachment(attachment).name_terms)
                 search_terms.extend(filename_words)
                 logger.info(f"🔍   Filename '{filename}' terms: {filename_words}")
 
@@ -1385,24 +1867,8 @@ class AssetMatcherNode:
             return set()
 
         try:
-            # Get all asset profiles from semantic memory
-            asset_data = self.semantic_memory.data.get("asset_profiles", {})
-            all_keywords = set()
-
-            for _, profile in asset_data.items():
-                keywords = profile.get("keywords", [])
-                # Add individual keywords, making them lowercase for matching
-                for keyword in keywords:
-                    if isinstance(keyword, str) and len(keyword.strip()) > 0:
-                        # Split multi-word keywords and add individual words
-                        words = keyword.lower().strip().split()
-                        all_keywords.update(words)
-
-            logger.info(
-                f"Extracted {len(all_keywords)} unique keywords from {len(asset_data)} assets"
-            )
-            return all_keywords
-
+            # Individual words of multi-word keywords, kept by the asset index
+            return self.semantic_memory.get_asset_keyword_tokens()
         except Exception as e:
             logger.error(f"Failed to extract asset keywords from semantic memory: {e}")
             return set()
@@ -1549,8 +2015,56 @@ def levenshtein_similarity(a: str, b: str) -> float:
     if not a or not b:
         return 0.0
 
-    # Use SequenceMatcher for efficiency
-    return SequenceMatcher(None, a.lower(), b.lower()).ratio()
+    # Normalized indel similarity, computed in C by python-Levenshtein
+    return ratio(a.lower(), b.lower())
+
+
+def _similar_lengths(length: int, threshold: float) -> range:
+    """
+    Get the string lengths whose similarity with a string can reach threshold.
+
+    Similarity is at most 2 * min(len_a, len_b) / (len_a + len_b), so
+    words much shorter or longer than a keyword never need comparing.
+
+    Args:
+        length: Length of the string being matched
+        threshold: Minimum similarity of interest
+
+    Returns:
+        Range of candidate lengths
+    """
+    if threshold <= 0:
+        return range(0, 2**63)
+
+    # The epsilon keeps lengths that reach the threshold exactly
+    low = math.ceil(length * threshold / (2 - threshold) - 1e-9)
+    high = math.floor(length * (2 - threshold) / threshold + 1e-9)
+    return range(low, high + 1)
+
+
+def _fuzzy_result(
+    score: float, matched_text: str, exact_threshold: float, partial_threshold: float
+) -> dict[str, Any]:
+    """
+    Build a fuzzy match result from the best similarity found.
+
+    Args:
+        score: Best similarity
+        matched_text: Word that produced it
+        exact_threshold: Minimum similarity for "exact" match
+        partial_threshold: Minimum similarity for partial match
+
+    Returns:
+        Dictionary with match info: {'score': float, 'match_type': str, 'matched_text': str}
+    """
+    if not matched_text or score < partial_threshold:
+        return {"score": 0.0, "match_type": "none", "matched_text": ""}
+
+    return {
+        "score": score,
+        "match_type": "exact_fuzzy" if score >= exact_threshold else "partial_fuzzy",
+        "matched_text": matched_text,
+    }
 
 
 def fuzzy_keyword_match(
@@ -1581,27 +2095,130 @@ def fuzzy_keyword_match(
     if keyword_lower in text_lower:
         return {"score": 1.0, "match_type": "exact_substring", "matched_text": keyword}
 
-    # Split text into words for fuzzy matching
-    words = re.findall(r"\b\w+\b", text_lower)
+    # Compare each distinct word once, skipping lengths that cannot match
+    words = dict.fromkeys(re.findall(r"\b\w+\b", text_lower))
+    lengths = _similar_lengths(len(keyword_lower), partial_threshold)
 
     best_score = 0.0
     best_match = ""
-    match_type = "none"
 
     for word in words:
-        similarity = levenshtein_similarity(keyword_lower, word)
+        if len(word) not in lengths:
+            continue
 
+        similarity = ratio(keyword_lower, word)
         if similarity > best_score:
             best_score = similarity
             best_match = word
 
-            if similarity >= exact_threshold:
-                match_type = "exact_fuzzy"
-            elif similarity >= partial_threshold:
-                match_type = "partial_fuzzy"
+    return _fuzzy_result(best_score, best_match, exact_threshold, partial_threshold)
 
-    return {
-        "score": best_score if best_score >= partial_threshold else 0.0,
-        "match_type": match_type if best_score >= partial_threshold else "none",
-        "matched_text": best_match if best_score >= partial_threshold else "",
-    }
+
+class FuzzyKeywordIndex:
+    """
+    Asset keywords bucketed by length for fuzzy matching against a text.
+
+    match_text scores every indexed keyword against the distinct words of
+    one text in a single pass, comparing each word only with the keyword
+    lengths that can reach the partial threshold. Results are the same as
+    calling fuzzy_keyword_match for each keyword.
+    """
+
+    def __init__(self, keywords: Iterable[str]) -> None:
+        """
+        Build the index.
+
+        Args:
+            keywords: Asset keywords (duplicates and case variants are merged)
+        """
+        self._keywords: dict[str, str] = {}
+        self._buckets: dict[int, list[str]] = {}
+        for keyword in keywords:
+            if not isinstance(keyword, str) or not keyword:
+                continue
+            keyword_lower = keyword.lower()
+            if keyword_lower not in self._keywords:
+                self._keywords[keyword_lower] = keyword
+                self._buckets.setdefault(len(keyword_lower), []).append(keyword_lower)
+
+    def __len__(self) -> int:
+        return len(self._keywords)
+
+    def _best_matches(
+        self, words: Iterable[str], threshold: float
+    ) -> dict[str, tuple[float, str]]:
+        """Best similarity and word per keyword; ties keep the earliest word."""
+        best: dict[str, tuple[float, str]] = {}
+        for word in words:
+            lengths = _similar_lengths(len(word), threshold)
+            for length, bucket in self._buckets.items():
+                if length not in lengths:
+                    continue
+                for keyword in bucket:
+                    similarity = ratio(keyword, word)
+                    if similarity > best.get(keyword, (0.0, ""))[0]:
+                        best[keyword] = (similarity, word)
+        return best
+
+    def similar_keywords(
+        self, words: Iterable[str], threshold: float
+    ) -> dict[str, float]:
+        """
+        Find the indexed keywords similar to any of the given words.
+
+        Args:
+            words: Lowercased words
+            threshold: Minimum similarity
+
+        Returns:
+            Mapping of lowercased keyword to its best similarity
+        """
+        return {
+            keyword: score
+            for keyword, (score, _) in self._best_matches(words, threshold).items()
+            if score >= threshold
+        }
+
+    def match_text(
+        self,
+        text: str,
+        exact_threshold: float = 0.9,
+        partial_threshold: float = 0.7,
+        words: Iterable[str] | None = None,
+    ) -> dict[str, dict[str, Any]]:
+        """
+        Find the best fuzzy match in text for every indexed keyword.
+
+        Args:
+            text: The text to search in
+            exact_threshold: Minimum similarity for "exact" match
+            partial_threshold: Minimum similarity for partial match
+            words: Distinct lowercased words of text in first-occurrence
+                order, if already known
+
+        Returns:
+            Mapping of lowercased keyword to match info as returned by
+            fuzzy_keyword_match
+        """
+        text_lower = text.lower()
+
+        if words is None:
+            words = dict.fromkeys(re.findall(r"\b\w+\b", text_lower))
+
+        # Words in first-occurrence order, so ties keep the earliest word
+        best = self._best_matches(words, partial_threshold)
+
+        results = {}
+        for keyword_lower, keyword in self._keywords.items():
+            if text_lower and keyword_lower in text_lower:
+                results[keyword_lower] = {
+                    "score": 1.0,
+                    "match_type": "exact_substring",
+                    "matched_text": keyword,
+                }
+            else:
+                score, word = best.get(keyword_lower, (0.0, ""))
+                results[keyword_lower] = _fuzzy_result(
+                    score, word, exact_threshold, partial_threshold
+                )
+        return results
@@ -7,12 +7,19 @@ security) and semantic memory for document categorization patterns.
 
 # # Standard library imports
 # Standard library imports
+import asyncio
+import binascii
+import shutil
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
 # # Local application imports
 # Local application imports
+from src.agents.attachment_policy import AttachmentPolicy
+from src.email_interface.base import BaseEmailInterface, EmailAttachment
+from src.email_interface.rate_limiter import get_byte_budget
+from src.email_interface.spool import remove_spool_file, write_base64_file
 from src.utils.config import config
 from src.utils.logging_system import get_logger, log_function
 
@@ -50,8 +57,33 @@ class AttachmentProcessorNode:
             config.max_attachment_size_mb * 1024 * 1024
         )  # Convert to bytes
 
+        # Same rules also gate downloads in the email interfaces
+        self.policy = AttachmentPolicy(
+            self.semantic_memory, self.procedural_memory, self.max_file_size
+        )
+
+        # Email interfaces by provider, for attachments listed without content
+        self.attachment_loaders: dict[str, BaseEmailInterface] = {}
+
+        # Shared with the email interfaces' attachment downloads
+        self.byte_budget = get_byte_budget(
+            "attachments", int(config.attachment_byte_budget_mb * 1024 * 1024)
+        )
+
         logger.info(f"Attachment processor initialized (base path: {self.base_path})")
 
+    def register_attachment_loader(
+        self, provider: str, loader: BaseEmailInterface
+    ) -> None:
+        """
+        Register the email interface that downloads a provider's attachments.
+
+        Args:
+            provider: Provider name used in attachment source handles
+            loader: Email interface providing load_attachments
+        """
+        self.attachment_loaders[provider] = loader
+
     @log_function()
     async def process_attachments(
         self,
@@ -211,8 +243,17 @@ class AttachmentProcessorNode:
 
         final_path = target_path / final_filename
 
-        # Simulate file saving (in real implementation, would save actual file)
-        await self._save_attachment(attachment_data, final_path)
+        # Lazily listed attachments are downloaded only once they are saved
+        loaded_on_demand = await self._load_attachment_content(attachment_data)
+
+        try:
+            # Simulate file saving (in real implementation, would save actual file)
+            async with self.byte_budget.reserve(attachment_data.get("size", 0)):
+                await self._save_attachment(attachment_data, final_path)
+        finally:
+            if loaded_on_demand:
+                # Saving moves the spool file; remove it if saving failed
+                remove_spool_file(attachment_data.get("spool_path"))
 
         return {
             "attachment_filename": filename,
@@ -249,6 +290,9 @@ class AttachmentProcessorNode:
         """
         Apply security checks using memory-driven rules.
 
+        The checks only use metadata, so they give the same answer as the
+        pre-download gate the email interfaces apply (AttachmentPolicy).
+
         Args:
             attachment_data: Attachment metadata including filename and size
             processing_rules: Security rules from procedural memory
@@ -256,68 +300,9 @@ class AttachmentProcessorNode:
         Returns:
             Dictionary with 'allowed' boolean and 'reason' string
         """
-        filename = attachment_data.get("filename", "")
-        file_size = attachment_data.get("size", 0)
-        file_ext = Path(filename).suffix.lower().lstrip(".")
-
-        # Get file type rules from semantic memory
-        file_type_rules = None
-        if self.semantic_memory:
-            try:
-                file_type_rules = self.semantic_memory.get_file_type_rules(file_ext)
-            except Exception as e:
-                logger.warning(
-                    f"Failed to get file type rules from semantic memory: {e}"
-                )
-
-        # Use memory-driven size limits if available
-        max_size_bytes = self.max_file_size  # Default from config
-        if file_type_rules and "max_size_mb" in file_type_rules:
-            max_size_bytes = file_type_rules["max_size_mb"] * 1024 * 1024
-
-        # File size check with memory-driven limits
-        if file_size > max_size_bytes:
-            return {
-                "allowed": False,
-                "reason": f"File too large: {file_size} bytes (max: {max_size_bytes} bytes for {file_ext})",
-            }
-
-        # File extension check with memory-driven rules
-        if file_type_rules:
-            # Use semantic memory rules
-            if not file_type_rules.get("allowed", False):
-                return {
-                    "allowed": False,
-                    "reason": f"File type not allowed by memory rules: {file_ext}",
-                }
-        else:
-            # Fallback to config
-            allowed_extensions = config.allowed_file_extensions
-            if file_ext not in allowed_extensions:
-                return {
-                    "allowed": False,
-                    "reason": f"File extension not allowed: {file_ext}",
-                }
-
-        # Get file processing rules from procedural memory
-        if self.procedural_memory:
-            try:
-                file_proc_rules = self.procedural_memory.get_file_processing_rules(
-                    file_ext
-                )
-                if file_proc_rules:
-                    # Apply any additional procedural security checks
-                    for rule in file_proc_rules:
-                        rule_max_size = rule.get("max_size_mb", 100) * 1024 * 1024
-                        if file_size > rule_max_size:
-                            return {
-                                "allowed": False,
-                                "reason": f"File exceeds procedural rule limit: {rule_max_size} bytes",
-                            }
-            except Exception as e:
-                logger.warning(f"Failed to apply procedural security checks: {e}")
-
-        return {"allowed": True, "reason": "Security checks passed"}
+        return self.policy.evaluate(
+            attachment_data.get("filename", ""), attachment_data.get("size", 0)
+        )
 
     async def _generate_filename(
         self,
@@ -337,6 +322,57 @@ class AttachmentProcessorNode:
 
         return clean_filename
 
+    async def _load_attachment_content(self, attachment_data: dict[str, Any]) -> bool:
+        """
+        Download the content of an attachment listed without it.
+
+        Args:
+            attachment_data: Attachment dictionary with a 'source' handle;
+                its 'content' or 'spool_path' is filled in place
+
+        Returns:
+            True if the content was downloaded by this call
+
+        Raises:
+            ValueError: If no loader is registered for the provider or the
+                download fails
+        """
+        source = attachment_data.get("source")
+        if (
+            attachment_data.get("content")
+            or attachment_data.get("spool_path")
+            or not source
+        ):
+            return False
+
+        loader = self.attachment_loaders.get(source["provider"])
+        if loader is None:
+            raise ValueError(
+                f"No attachment loader registered for provider {source['provider']}"
+            )
+
+        attachment = EmailAttachment(
+            filename=attachment_data.get("filename", "unknown"),
+            content_type=attachment_data.get("content_type", ""),
+            size=attachment_data.get("size", 0),
+            attachment_id=source["attachment_id"],
+            message_id=source["message_id"],
+            provider=source["provider"],
+        )
+        await loader.load_attachments([attachment])
+
+        if not attachment.is_loaded:
+            raise ValueError(
+                f"Failed to download {attachment.filename}: "
+                f"{attachment.download_error or 'no content'}"
+            )
+
+        attachment_data["content"] = attachment.content
+        attachment_data["spool_path"] = attachment.spool_path
+        attachment_data["content_sha256"] = attachment.content_sha256
+        logger.info(f"Downloaded {attachment.filename} on demand")
+        return True
+
     async def _save_attachment(
         self, attachment_data: dict[str, Any], target_path: Path
     ) -> None:
@@ -344,6 +380,16 @@ class AttachmentProcessorNode:
         Save attachment to file system.
         """
         try:
+            # Spooled content is moved into place without reading it
+            spool_path = attachment_data.get("spool_path")
+            if spool_path:
+                target_path.parent.mkdir(parents=True, exist_ok=True)
+                shutil.move(spool_path, target_path)
+                attachment_data["spool_path"] = None
+                target_path.chmod(0o600)
+                logger.info(f"Successfully saved attachment to: {target_path}")
+                return
+
             # Get attachment content
             content = attachment_data.get("content")
             if not content:
@@ -361,15 +407,10 @@ class AttachmentProcessorNode:
                 with open(target_path, "wb") as f:
                     f.write(content)
             elif isinstance(content, str):
-                # Content might be base64 encoded
-                # # Standard library imports
-                import base64
-
+                # Content might be base64 encoded; decode it off the event loop
                 try:
-                    decoded_content = base64.b64decode(content)
-                    with open(target_path, "wb") as f:
-                        f.write(decoded_content)
-                except Exception as e:
+                    await asyncio.to_thread(write_base64_file, content, target_path)
+                except (binascii.Error, ValueError) as e:
                     logger.error(f"Failed to decode base64 content: {e}")
                     # Try writing as text
                     with open(target_path, "w", encoding="utf-8") as f:
@@ -11,6 +11,7 @@ from typing import Any
 
 # # Local application imports
 # Local application imports
+from src.agents.email_features import EmailFeatures, get_email_features
 from src.utils.config import config
 from src.utils.logging_system import get_logger, log_function
 
@@ -60,6 +61,7 @@ class RelevanceFilterNode:
 
         Args:
             email_data: Email metadata including subject, sender, body, attachments
+                and optionally the email's precomputed features
 
         Returns:
             Tuple of (classification, confidence_score, reasoning)
@@ -72,8 +74,8 @@ class RelevanceFilterNode:
 
         subject = email_data.get("subject", "")
         sender = email_data.get("sender", "")
-        body = email_data.get("body", "")
         attachments = email_data.get("attachments", [])
+        features = get_email_features(email_data)
 
         logger.info(f"Evaluating relevance: {subject[:50]}...")
         logger.info(
@@ -84,7 +86,7 @@ class RelevanceFilterNode:
 
         # Use memory systems for relevance evaluation
         relevance_score = await self._memory_driven_relevance_check(
-            subject, sender, body, attachments, reasoning
+            features, attachments, reasoning
         )
 
         # Determine classification based on score
@@ -103,7 +105,7 @@ class RelevanceFilterNode:
             )
 
         # Check for obvious spam patterns (basic protection)
-        if await self._is_obvious_spam(subject, body, sender):
+        if await self._is_obvious_spam(features):
             classification = "spam"
             relevance_score = 0.1
             reasoning["flags"].append("Obvious spam detected")
@@ -116,9 +118,7 @@ class RelevanceFilterNode:
 
     async def _memory_driven_relevance_check(
         self,
-        subject: str,
-        sender: str,
-        body: str,
+        features: EmailFeatures,
         attachments: list[dict[str, Any]],
         reasoning: dict[str, Any],
     ) -> float:
@@ -128,6 +128,8 @@ class RelevanceFilterNode:
         Uses procedural memory for rules, semantic memory for patterns,
         and episodic memory for learned sender patterns.
         """
+        sender = features.sender
+        subject = features.subject
         logger.info(
             f"🔍 ENTERING _memory_driven_relevance_check for sender: {sender}, subject: {subject[:30]}..."
         )
@@ -142,8 +144,8 @@ class RelevanceFilterNode:
         # Get relevance rules from procedural memory
         relevance_rules = self.procedural_memory.get_relevance_rules()
 
-        # Combine all text for analysis
-        combined_text = f"{subject} {body}".lower()
+        # Lowercased subject and body, built once per email
+        combined_text = features.text
 
         # Apply each relevance rule
         for rule in relevance_rules:
@@ -170,8 +172,7 @@ class RelevanceFilterNode:
             relevant_count = 0
 
             for attachment in attachments:
-                filename = attachment.get("filename", "")
-                file_ext = filename.lower().split(".")[-1] if "." in filename else ""
+                file_ext = features.attachment(attachment).extension
 
                 file_rules = self.semantic_memory.get_file_type_rules(file_ext)
                 if file_rules and file_rules.get("allowed", False):
@@ -186,7 +187,7 @@ class RelevanceFilterNode:
 
         # Check sender trust (simple domain check for now)
         if any(
-            domain in sender.lower()
+            domain in features.sender_lower
             for domain in [".gov", ".edu", "investor", "finance", "capital"]
         ):
             score += 0.15
@@ -321,18 +322,19 @@ class RelevanceFilterNode:
             logger.error(f"Exception type: {type(e).__name__}")
             return 0.0
 
-    async def _is_obvious_spam(self, subject: str, body: str, sender: str) -> bool:
+    async def _is_obvious_spam(self, features: EmailFeatures) -> bool:
         """
         Basic spam detection until procedural memory rules are available.
 
         This will be replaced with procedural memory queries.
         """
-        combined_text = f"{subject} {body} {sender}".lower()
-
         # Very obvious spam indicators
         spam_terms = ["you've won", "lottery", "viagra", "casino", "nigerian prince"]
 
-        return any(term in combined_text for term in spam_terms)
+        return any(
+            term in features.text or term in features.sender_lower
+            for term in spam_terms
+        )
 
     async def query_semantic_patterns(
         self, email_data: dict[str, Any]
@@ -41,12 +41,13 @@ Copyright 2025 by Inveniam Capital Partners, LLC and Rick Bunker
 """
 
 # # Standard library imports
+import asyncio
 import os
 
 # Logging system integration
 import sys
 from abc import ABC, abstractmethod
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, Callable, Iterator
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
@@ -58,6 +59,16 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
 # # Local application imports
 from utils.logging_system import get_logger, log_function  # noqa: E402
 
+from .rate_limiter import DEFAULT_BYTE_BUDGET, ByteBudget, get_byte_budget  # noqa: E402
+from .spool import (  # noqa: E402
+    CHUNK_SIZE,
+    DEFAULT_SPOOL_THRESHOLD,
+    SpooledAttachmentBuffer,
+    decode_base64_into,
+    iter_spool_file,
+    remove_spool_file,
+)
+
 # Initialize logger
 logger = get_logger(__name__)
 
@@ -109,7 +120,14 @@ class EmailAttachment:
         content_type: MIME content type (e.g., 'application/pdf')
         size: Size in bytes
         attachment_id: Email system-specific attachment identifier
-        content: Actual file content (loaded on demand)
+        content: Actual file content (loaded on demand) when held in memory
+        spool_path: Temporary file holding the content when it was too
+            large to keep in memory
+        content_sha256: Hex SHA-256 of the content, computed while downloading
+        download_error: Reason the content could not be downloaded, if any
+        message_id: Email system-specific id of the message holding it
+        provider: Email system the attachment comes from (e.g. 'gmail')
+        blocked_reason: Why the attachment policy blocked the download, if it did
     """
 
     filename: str
@@ -117,6 +135,12 @@ class EmailAttachment:
     size: int
     attachment_id: str | None = None
     content: bytes | None = None
+    spool_path: str | None = None
+    content_sha256: str | None = None
+    download_error: str | None = None
+    message_id: str | None = None
+    provider: str | None = None
+    blocked_reason: str | None = None
 
     def __post_init__(self) -> None:
         """Validate attachment metadata after initialization."""
@@ -128,13 +152,80 @@ class EmailAttachment:
     @property
     def is_loaded(self) -> bool:
         """Check if attachment content has been loaded."""
-        return self.content is not None
+        return self.content is not None or self.spool_path is not None
+
+    def read_content(self) -> bytes | None:
+        """
+        Get the content, reading it from the spool file if needed.
+
+        Returns:
+            Content bytes, or None if not loaded
+        """
+        if self.content is not None:
+            return self.content
+        if self.spool_path:
+            with open(self.spool_path, "rb") as f:
+                return f.read()
+        return None
+
+    def iter_content(self, chunk_size: int = CHUNK_SIZE) -> Iterator[bytes]:
+        """
+        Iterate over the content without loading a spooled file at once.
+
+        Args:
+            chunk_size: Maximum bytes per chunk
+
+        Yields:
+            Consecutive chunks of content
+        """
+        if self.spool_path:
+            yield from iter_spool_file(self.spool_path, chunk_size)
+        elif self.content is not None:
+            for start in range(0, len(self.content), chunk_size):
+                yield self.content[start : start + chunk_size]
+
+    def set_content(self, buffer: SpooledAttachmentBuffer) -> None:
+        """
+        Take the content of a completed download buffer.
+
+        Args:
+            buffer: Closed buffer holding the attachment content
+        """
+        self.discard_content()
+        if buffer.is_spooled:
+            self.spool_path = buffer.path
+        else:
+            self.content = buffer.getvalue()
+        self.content_sha256 = buffer.sha256
+
+    def discard_content(self) -> None:
+        """Drop loaded content and remove its spool file, if any."""
+        remove_spool_file(self.spool_path)
+        self.spool_path = None
+        self.content = None
 
     @property
     def file_extension(self) -> str:
         """Get file extension from filename."""
         return Path(self.filename).suffix.lower()
 
+    @property
+    def source(self) -> dict[str, str] | None:
+        """
+        Plain-data handle for loading the content later.
+
+        Returns:
+            Dictionary with provider, message_id and attachment_id, or None
+            if the attachment cannot be downloaded separately
+        """
+        if not (self.provider and self.message_id and self.attachment_id):
+            return None
+        return {
+            "provider": self.provider,
+            "message_id": self.message_id,
+            "attachment_id": self.attachment_id,
+        }
+
 
 class EmailImportance(Enum):
     """
@@ -246,6 +337,9 @@ class EmailSearchCriteria:
         date_before: Filter emails before this date
         labels: Filter by labels/folders
         max_results: Maximum number of results to return
+        include_attachment_content: Download attachment content while
+            listing; when False only metadata and a source handle are
+            returned and content is loaded later with load_attachments
     """
 
     query: str | None = None
@@ -259,6 +353,7 @@ class EmailSearchCriteria:
     date_before: datetime | None = None
     labels: list[str] = field(default_factory=list)
     max_results: int = 50
+    include_attachment_content: bool = True
 
     def __post_init__(self) -> None:
         """Validate search criteria after initialization."""
@@ -396,14 +491,171 @@ class BaseEmailInterface(ABC):
         display_name: Display name of the authenticated user
     """
 
-    def __init__(self) -> None:
-        """Initialize the email interface."""
+    def __init__(
+        self,
+        max_concurrent_attachments: int = 10,
+        attachment_spool_threshold: int = DEFAULT_SPOOL_THRESHOLD,
+        attachment_spool_dir: str | None = None,
+        attachment_byte_budget: int = DEFAULT_BYTE_BUDGET,
+    ) -> None:
+        """
+        Initialize the email interface.
+
+        Args:
+            max_concurrent_attachments: Maximum attachment downloads in
+                flight at once for this interface
+            attachment_spool_threshold: Attachments larger than this many
+                bytes are kept in a temporary file instead of in memory
+            attachment_spool_dir: Directory for attachment spool files
+                (system temp dir if None)
+            attachment_byte_budget: Attachment bytes that may be downloading
+                at once across all interfaces in the process (0 for no limit)
+        """
         self.is_connected: bool = False
         self.user_email: str | None = None
         self.display_name: str | None = None
+        self.max_concurrent_attachments = max(1, max_concurrent_attachments)
+        self._attachment_semaphore: asyncio.Semaphore | None = None
+        self._attachment_semaphore_loop: asyncio.AbstractEventLoop | None = None
+        self.attachment_spool_threshold = attachment_spool_threshold
+        self.attachment_spool_dir = attachment_spool_dir or None
+        # Process-wide, shared with the attachment processor's saves
+        self.attachment_byte_budget: ByteBudget = get_byte_budget(
+            "attachments", attachment_byte_budget
+        )
+        self.attachment_filter: Callable[[EmailAttachment], str | None] | None = None
+        self.attachment_stats = {"blocked": 0, "bytes_avoided": 0}
         self.logger = get_logger(f"{__name__}.{self.__class__.__name__}")
         self.logger.info("Initializing email interface")
 
+    def set_attachment_filter(
+        self, attachment_filter: Callable[[EmailAttachment], str | None] | None
+    ) -> None:
+        """
+        Set the pre-download gate for attachments.
+
+        The filter sees attachment metadata (filename, content type, size)
+        before any content is fetched and returns a reason to block the
+        download, or None to allow it.
+
+        Args:
+            attachment_filter: Gate function, or None to download everything
+        """
+        self.attachment_filter = attachment_filter
+
+    def _new_attachment_buffer(
+        self, attachment: EmailAttachment
+    ) -> SpooledAttachmentBuffer:
+        """
+        Create a download buffer using this interface's spool settings.
+
+        Args:
+            attachment: Attachment the buffer will hold
+
+        Returns:
+            Empty buffer
+        """
+        return SpooledAttachmentBuffer(
+            self.attachment_spool_threshold,
+            self.attachment_spool_dir,
+            attachment.file_extension,
+        )
+
+    def _store_attachment_content(
+        self, attachment: EmailAttachment, data: bytes
+    ) -> None:
+        """
+        Store downloaded content, spooling it to disk above the threshold.
+
+        Args:
+            attachment: Attachment the content belongs to
+            data: Downloaded content
+        """
+        buffer = self._new_attachment_buffer(attachment)
+        buffer.write(data)
+        buffer.close()
+        attachment.set_content(buffer)
+
+    async def _store_attachment_base64(
+        self, attachment: EmailAttachment, data: str | bytes, urlsafe: bool = False
+    ) -> int:
+        """
+        Decode base64 content in a worker thread, spooling it like any download.
+
+        Args:
+            attachment: Attachment the content belongs to
+            data: Base64 content as returned by the provider
+            urlsafe: Whether data uses the URL-safe alphabet
+
+        Returns:
+            Number of decoded bytes
+
+        Raises:
+            binascii.Error: If data is not valid base64
+        """
+        buffer = self._new_attachment_buffer(attachment)
+        try:
+            size = await asyncio.to_thread(decode_base64_into, data, buffer, urlsafe)
+        except Exception:
+            buffer.discard()
+            raise
+        buffer.close()
+        attachment.set_content(buffer)
+        return size
+
+    def _apply_attachment_filter(self, attachments: list[EmailAttachment]) -> None:
+        """
+        Mark attachments the filter blocks so their content is never fetched.
+
+        Blocked attachments keep their metadata and get a blocked_reason;
+        their sizes are added to attachment_stats['bytes_avoided'].
+
+        Args:
+            attachments: Attachments parsed from message metadata
+        """
+        if self.attachment_filter is None:
+            return
+
+        for attachment in attachments:
+            if attachment.is_loaded or attachment.blocked_reason:
+                continue
+            try:
+                reason = self.attachment_filter(attachment)
+            except Exception as e:
+                self.logger.warning(
+                    f"Attachment filter failed for {attachment.filename}: {e}"
+                )
+                continue
+            if reason:
+                attachment.blocked_reason = reason
+                self.attachment_stats["blocked"] += 1
+                self.attachment_stats["bytes_avoided"] += attachment.size
+                self.logger.info(
+                    f"Not downloading {attachment.filename} ({attachment.size} bytes): {reason}"
+                )
+
+    def _get_attachment_semaphore(self) -> asyncio.Semaphore:
+        """
+        Get the semaphore bounding concurrent attachment downloads.
+
+        The web app runs every request on one shared event loop, but
+        scripts and tests may drive an interface from several loops (e.g.
+        successive asyncio.run calls), so the semaphore is recreated
+        whenever the running loop changes.
+
+        Returns:
+            Semaphore sized by max_concurrent_attachments
+        """
+        loop = asyncio.get_running_loop()
+        if self._attachment_semaphore is None or (
+            self._attachment_semaphore_loop is not loop
+        ):
+            self._attachment_semaphore = asyncio.Semaphore(
+                self.max_concurrent_attachments
+            )
+            self._attachment_semaphore_loop = loop
+        return self._attachment_semaphore
+
     @abstractmethod
     @log_function()
     async def connect(self, credentials: dict[str, Any]) -> bool:
@@ -439,6 +691,17 @@ class BaseEmailInterface(ABC):
         """
         pass
 
+    @log_function()
+    async def close(self) -> None:
+        """
+        Release long-lived resources such as connection and thread pools.
+
+        disconnect() keeps these pools so the interface can reconnect
+        cheaply; close() is called once the interface is no longer needed.
+        The default simply disconnects.
+        """
+        await self.disconnect()
+
     @abstractmethod
     @log_function()
     async def get_profile(self) -> dict[str, Any]:
@@ -682,6 +945,29 @@ class BaseEmailInterface(ABC):
         for email in emails:
             yield email
 
+    @log_function()
+    async def stream_new_emails(
+        self, criteria: EmailSearchCriteria
+    ) -> AsyncGenerator[Email, None]:
+        """
+        Stream emails that arrived since the previous sync of this mailbox.
+
+        Implementations with a provider-side change feed override this to
+        fetch only new messages using a persisted checkpoint. The default
+        performs a full sync through stream_emails.
+
+        Args:
+            criteria: Search criteria for filtering emails
+
+        Yields:
+            Email objects added since the previous sync
+
+        Raises:
+            ConnectionError: If not connected to email system
+        """
+        async for email in self.stream_emails(criteria):
+            yield email
+
     @log_function()
     def _parse_email_address(self, address_str: str) -> EmailAddress:
         """
@@ -751,13 +1037,55 @@ class BaseEmailInterface(ABC):
         """
         email = await self.get_email(email_id, include_attachments=True)
         for attachment in email.attachments:
-            if attachment.attachment_id == attachment_id and attachment.content:
-                return attachment.content
+            if attachment.attachment_id == attachment_id and attachment.is_loaded:
+                return attachment.read_content()
 
         raise EmailNotFoundError(
             f"Attachment {attachment_id} not found in email {email_id}"
         )
 
+    async def load_attachments(self, attachments: list[EmailAttachment]) -> None:
+        """
+        Download content for attachments that were listed without it.
+
+        Used for lazy fetching, where emails are listed with
+        include_attachment_content=False and content is only loaded for
+        attachments that are actually saved. Attachments that already have
+        content, no source handle or a blocked_reason are skipped. Failures
+        are logged and recorded on the attachment's download_error. The
+        default implementation downloads each attachment with
+        get_attachment_content, up to max_concurrent_attachments at once
+        and within the attachment byte budget.
+
+        Args:
+            attachments: Attachments to load
+        """
+        semaphore = self._get_attachment_semaphore()
+
+        async def load(attachment: EmailAttachment) -> None:
+            try:
+                async with self.attachment_byte_budget.reserve(attachment.size):
+                    async with semaphore:
+                        content = await self.get_attachment_content(
+                            attachment.message_id, attachment.attachment_id
+                        )
+                    self._store_attachment_content(attachment, content)
+            except Exception as e:
+                self.logger.error(
+                    f"Failed to download attachment {attachment.filename} from message {attachment.message_id}: {e}"
+                )
+                attachment.download_error = str(e)
+
+        await asyncio.gather(
+            *(
+                load(attachment)
+                for attachment in attachments
+                if not attachment.is_loaded
+                and attachment.source
+                and not attachment.blocked_reason
+            )
+        )
+
     @log_function()
     async def health_check(self) -> dict[str, Any]:
         """
@@ -43,11 +43,14 @@ import asyncio
 import base64
 import contextlib
 import email
+import functools
+import inspect
 import os
 
 # Logging system
 import sys
-from collections.abc import Callable
+import threading
+from collections.abc import AsyncGenerator, Callable
 from concurrent.futures import ThreadPoolExecutor
 from email import encoders
 from email.mime.base import MIMEBase
@@ -56,8 +59,10 @@ from email.mime.text import MIMEText
 from typing import Any
 
 # # Third-party imports
+import httplib2
 from google.auth.transport.requests import Request
 from google.oauth2.credentials import Credentials
+from google_auth_httplib2 import AuthorizedHttp
 from google_auth_oauthlib.flow import InstalledAppFlow
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
@@ -79,11 +84,40 @@ from .base import (  # noqa: E402
     EmailSendRequest,
     EmailSystemError,
 )
+from .gmail_rest import GmailRestBatch, GmailRestClient, GmailRestService  # noqa: E402
+from .rate_limiter import (  # noqa: E402
+    DEFAULT_BYTE_BUDGET,
+    THROTTLE_STATUSES,
+    ApiRateLimiter,
+    get_rate_limiter,
+    parse_retry_after,
+)
+from .spool import DEFAULT_SPOOL_THRESHOLD  # noqa: E402
+from .sync_state import SyncStateStore  # noqa: E402
 
 # Initialize logger
 logger = get_logger(__name__)
 
 
+def _message_fields(part_depth: int) -> str:
+    """
+    Build the messages.get partial-response field mask.
+
+    Nested parts keep only what _extract_payload reads; parts nested deeper
+    than part_depth levels are returned in full.
+
+    Args:
+        part_depth: Levels of nested parts to project
+
+    Returns:
+        Value for the 'fields' request parameter
+    """
+    parts = "parts"
+    for _ in range(part_depth):
+        parts = f"parts(mimeType,filename,body,{parts})"
+    return f"id,threadId,labelIds,payload(mimeType,filename,headers,body,{parts})"
+
+
 class GmailInterface(BaseEmailInterface):
     """
     Gmail API integration for email management.
@@ -126,9 +160,32 @@ class GmailInterface(BaseEmailInterface):
     DEFAULT_PAGE_SIZE = 25
     MAX_PAGE_SIZE = 100
     REQUEST_TIMEOUT = 30
-    RETRY_ATTEMPTS = 3
+    RETRY_ATTEMPTS = 3  # Retries for throttled requests
+    RATE_LIMIT_PER_SECOND = 40  # ~200 of the 250 quota units/s per user
+    MAX_CONCURRENT_REQUESTS = 10
+    HISTORY_PAGE_SIZE = 500
+
+    TRANSPORTS = ("executor", "aiohttp")
 
-    def __init__(self) -> None:
+    # Partial responses: only the fields the parsers read
+    MESSAGE_FIELDS = _message_fields(part_depth=4)
+    MESSAGE_LIST_FIELDS = "messages/id,nextPageToken"
+    HISTORY_FIELDS = "history(id,messagesAdded/message/id),historyId,nextPageToken"
+
+    # Batch endpoint limits
+    MAX_BATCH_SIZE = 100  # Sub-requests per batch HTTP call
+    MESSAGE_BATCH_SIZE = 50  # Messages fetched per batch while streaming
+    ATTACHMENT_BATCH_MAX_BYTES = 20 * 1024 * 1024  # Attachment bytes per batch
+
+    def __init__(
+        self,
+        sync_state_path: str = "data/sync_state.json",
+        max_concurrent_attachments: int = 10,
+        transport: str = "executor",
+        attachment_spool_threshold: int = DEFAULT_SPOOL_THRESHOLD,
+        attachment_spool_dir: str | None = None,
+        attachment_byte_budget: int = DEFAULT_BYTE_BUDGET,
+    ) -> None:
         """
         Initialize Gmail interface with complete configuration.
 
@@ -136,22 +193,59 @@ class GmailInterface(BaseEmailInterface):
         thread pool for blocking operations, and logging
         for production deployment in asset management environments.
 
+        Args:
+            sync_state_path: JSON file holding incremental sync checkpoints
+            max_concurrent_attachments: Maximum attachment batch downloads
+                in flight at once
+            transport: 'executor' runs googleapiclient calls in the thread
+                pool; 'aiohttp' sends them from the event loop through
+                GmailRestClient
+            attachment_spool_threshold: Attachments larger than this many
+                bytes are kept in a temporary file instead of in memory
+            attachment_spool_dir: Directory for attachment spool files
+            attachment_byte_budget: Attachment bytes that may be downloading
+                at once across the process (0 for no limit)
+
         Raises:
+            ValueError: If the transport is unknown
             RuntimeError: If required Google libraries are missing
 
         Note:
             Requires valid Google OAuth 2.0 credentials for Gmail API access
             with appropriate scopes for email management operations.
         """
-        super().__init__()
+        super().__init__(
+            max_concurrent_attachments,
+            attachment_spool_threshold,
+            attachment_spool_dir,
+            attachment_byte_budget,
+        )
 
         self.logger = get_logger(f"{__name__}.GmailInterface")
         self.logger.info("Initializing Gmail email interface")
 
+        if transport not in self.TRANSPORTS:
+            raise ValueError(
+                f"Unknown Gmail transport '{transport}', "
+                f"expected one of {self.TRANSPORTS}"
+            )
+        self.transport = transport
+        self._rest_client: GmailRestClient | None = None
+
         # Core components
         self.service = None
         self.credentials: Credentials | None = None
-        self.executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="gmail")
+        # Enough threads that concurrent attachment downloads are bounded by
+        # max_concurrent_attachments rather than by the pool size
+        self.executor = ThreadPoolExecutor(
+            max_workers=max(4, self.max_concurrent_attachments),
+            thread_name_prefix="gmail",
+        )
+        # httplib2 connections are not thread-safe; each pool thread keeps its own
+        self._thread_local = threading.local()
+
+        # Incremental sync checkpoints (historyId per mailbox)
+        self.sync_state = SyncStateStore(sync_state_path)
 
         # Performance tracking
         self.request_count = 0
@@ -241,9 +335,16 @@ class GmailInterface(BaseEmailInterface):
 
             # Build Gmail service
             self.credentials = creds
-            self.service = await self._run_in_executor(
-                lambda: build("gmail", "v1", credentials=creds)
-            )
+            if self.transport == "aiohttp":
+                # Keep the client (and its connection pool) across reconnects
+                if self._rest_client is None:
+                    self._rest_client = GmailRestClient(creds)
+                self._rest_client.credentials = creds
+                self.service = GmailRestService(self._rest_client)
+            else:
+                self.service = await self._run_in_executor(
+                    lambda: build("gmail", "v1", credentials=creds)
+                )
 
             # Validate connection by getting user profile
             profile = await self.get_profile()
@@ -307,10 +408,11 @@ class GmailInterface(BaseEmailInterface):
     @log_function()
     async def disconnect(self) -> None:
         """
-        Disconnect from Gmail and cleanup resources.
+        Disconnect from Gmail.
 
-        Properly closes service connections, clears authentication tokens,
-        and resets connection state with complete cleanup.
+        Clears the service and authentication tokens and resets connection
+        state. The thread pool is kept so a later connect() can reuse the
+        interface; call close() to release it.
         """
         self.logger.info("Disconnecting from Gmail")
 
@@ -323,11 +425,18 @@ class GmailInterface(BaseEmailInterface):
         self.user_email = None
         self.display_name = None
 
-        # Shutdown thread pool
-        self.executor.shutdown(wait=True)
-
         self.logger.info("Gmail disconnection complete")
 
+    @log_function()
+    async def close(self) -> None:
+        """Disconnect and shut down the thread pool and REST session."""
+        await self.disconnect()
+        if self._rest_client is not None:
+            await self._rest_client.close()
+            self._rest_client = None
+        self.executor.shutdown(wait=True)
+        self.logger.info("Gmail interface closed")
+
     @log_function()
     async def get_profile(self) -> dict[str, Any]:
         """
@@ -348,7 +457,7 @@ class GmailInterface(BaseEmailInterface):
 
         try:
             # Get Gmail profile information
-            gmail_profile = await self._run_in_executor(
+            gmail_profile = await self._execute_request(
                 self.service.users().getProfile(userId="me").execute
             )
 
@@ -397,7 +506,9 @@ class GmailInterface(BaseEmailInterface):
         start_time = loop.time()
 
         try:
-            result = await loop.run_in_executor(self.executor, func, *args, **kwargs)
+            result = await loop.run_in_executor(
+                self.executor, functools.partial(func, *args, **kwargs)
+            )
 
             # Update performance tracking
             execution_time = loop.time() - start_time
@@ -411,74 +522,448 @@ class GmailInterface(BaseEmailInterface):
             execution_time = loop.time() - start_time
             self.total_request_time += execution_time
 
-            self.logger.error(f"Gmail API call failed: {func.__name__} - {e}")
+            self.logger.error(
+                f"Gmail API call failed: {getattr(func, '__name__', func)} - {e}"
+            )
             raise
 
+    def _get_rate_limiter(self, api: str = "gmail") -> ApiRateLimiter:
+        """
+        Get the shared rate limiter for a Google API and this mailbox.
+
+        Args:
+            api: Google API the requests go to ('gmail' or 'people')
+
+        Returns:
+            Process-wide ApiRateLimiter
+        """
+        return get_rate_limiter(
+            "gmail",
+            self.user_email or "me",
+            api,
+            requests_per_second=self.RATE_LIMIT_PER_SECOND,
+            max_concurrency=self.MAX_CONCURRENT_REQUESTS,
+            retry_attempts=self.RETRY_ATTEMPTS,
+        )
+
+    def _is_rate_limited(self, error: Exception) -> bool:
+        """
+        Check whether an API error means the request was throttled.
+
+        Args:
+            error: Exception raised by a Google API request
+
+        Returns:
+            True for HTTP 429/503 and 403 rate limit errors
+        """
+        if not isinstance(error, HttpError):
+            return False
+        if error.resp.status in THROTTLE_STATUSES:
+            return True
+        if error.resp.status != 403:
+            return False
+        content = getattr(error, "content", b"")
+        if isinstance(content, bytes):
+            content = content.decode("utf-8", errors="replace")
+        return any(
+            reason in content
+            for reason in ("rateLimitExceeded", "userRateLimitExceeded")
+        )
+
+    async def _execute_request(
+        self, func: Callable, *args: Any, api: str = "gmail", cost: float = 1.0
+    ) -> Any:
+        """
+        Execute a Google API request under the shared rate limiter.
+
+        Throttled requests are retried up to RETRY_ATTEMPTS times, waiting
+        for Retry-After when Google sends one and a jittered exponential
+        backoff otherwise.
+
+        Args:
+            func: API call, usually a request's execute method; coroutine
+                functions (aiohttp transport) run on the event loop and
+                blocking ones in the thread pool
+            *args: Function arguments
+            api: Google API the request goes to
+            cost: Rate limit tokens used, e.g. sub-requests in a batch
+
+        Returns:
+            Function result
+
+        Raises:
+            HttpError: If the request fails or is still throttled after
+                all retries
+        """
+        limiter = self._get_rate_limiter(api)
+
+        for attempt in range(limiter.retry_attempts + 1):
+            try:
+                async with limiter.slot(cost):
+                    if inspect.iscoroutinefunction(func):
+                        result = await func(*args)
+                    else:
+                        result = await self._run_in_executor(func, *args)
+            except HttpError as e:
+                if not self._is_rate_limited(e) or attempt == limiter.retry_attempts:
+                    raise
+                retry_after = parse_retry_after(e.resp.get("retry-after"))
+                await asyncio.sleep(limiter.record_throttle(attempt, retry_after))
+                continue
+
+            limiter.record_success()
+            return result
+
+    def _build_search_query(self, criteria: EmailSearchCriteria) -> str | None:
+        """
+        Build a Gmail search query string from search criteria.
+
+        Args:
+            criteria: Search criteria for filtering emails
+
+        Returns:
+            Gmail search query, or None to match all messages
+        """
+        query_parts = []
+
+        if criteria.query:
+            query_parts.append(criteria.query)
+        if criteria.sender:
+            query_parts.append(f"from:{criteria.sender}")
+        if criteria.recipient:
+            query_parts.append(f"to:{criteria.recipient}")
+        if criteria.subject:
+            query_parts.append(f"subject:{criteria.subject}")
+        if criteria.has_attachments:
+            query_parts.append("has:attachment")
+        if criteria.is_unread is True:
+            query_parts.append("is:unread")
+        elif criteria.is_unread is False:
+            query_parts.append("is:read")
+        if criteria.is_flagged:
+            query_parts.append("is:starred")
+        if criteria.date_after:
+            date_str = criteria.date_after.strftime("%Y/%m/%d")
+            query_parts.append(f"after:{date_str}")
+        if criteria.date_before:
+            date_str = criteria.date_before.strftime("%Y/%m/%d")
+            query_parts.append(f"before:{date_str}")
+        for label in criteria.labels:
+            query_parts.append(f"label:{label}")
+
+        return " ".join(query_parts) if query_parts else None
+
+    async def _list_message_page(
+        self, query: str | None, page_size: int, page_token: str | None
+    ) -> dict[str, Any]:
+        """
+        Fetch one page of message ids from messages.list.
+
+        Args:
+            query: Gmail search query
+            page_size: Number of message ids to request
+            page_token: nextPageToken from the previous page, if any
+
+        Returns:
+            Raw messages.list response
+        """
+        request_params = {
+            "userId": "me",
+            "q": query,
+            "maxResults": page_size,
+            "fields": self.MESSAGE_LIST_FIELDS,
+        }
+        if page_token:
+            request_params["pageToken"] = page_token
+
+        return await self._execute_request(
+            self.service.users().messages().list(**request_params).execute
+        )
+
     async def list_emails(self, criteria: EmailSearchCriteria) -> list[Email]:
         """List emails matching criteria."""
+        return [email_obj async for email_obj in self.stream_emails(criteria)]
+
+    @log_function()
+    async def stream_emails(
+        self, criteria: EmailSearchCriteria
+    ) -> AsyncGenerator[Email, None]:
+        """
+        Stream emails matching criteria page by page.
+
+        Follows nextPageToken until criteria.max_results message ids have
+        been listed. The next page of ids is requested in the background
+        while the messages of the current page are fetched and consumed,
+        and each Email is yielded as soon as it is parsed, so only one page
+        of ids and one message are held at a time.
+
+        Args:
+            criteria: Search criteria for filtering emails
+
+        Yields:
+            Email objects matching criteria
+
+        Raises:
+            ConnectionError: If not connected to Gmail
+            EmailSystemError: If listing messages fails
+        """
         if not self.service:
             raise ConnectionError("Not connected to Gmail")
 
-        try:
-            # Build Gmail search query
-            query_parts = []
-
-            if criteria.query:
-                query_parts.append(criteria.query)
-            if criteria.sender:
-                query_parts.append(f"from:{criteria.sender}")
-            if criteria.recipient:
-                query_parts.append(f"to:{criteria.recipient}")
-            if criteria.subject:
-                query_parts.append(f"subject:{criteria.subject}")
-            if criteria.has_attachments:
-                query_parts.append("has:attachment")
-            if criteria.is_unread is True:
-                query_parts.append("is:unread")
-            elif criteria.is_unread is False:
-                query_parts.append("is:read")
-            if criteria.is_flagged:
-                query_parts.append("is:starred")
-            if criteria.date_after:
-                date_str = criteria.date_after.strftime("%Y/%m/%d")
-                query_parts.append(f"after:{date_str}")
-            if criteria.date_before:
-                date_str = criteria.date_before.strftime("%Y/%m/%d")
-                query_parts.append(f"before:{date_str}")
-            for label in criteria.labels:
-                query_parts.append(f"label:{label}")
-
-            query = " ".join(query_parts) if query_parts else None
-
-            # Search for messages
-            result = await self._run_in_executor(
-                self.service.users()
-                .messages()
-                .list(userId="me", q=query, maxResults=criteria.max_results)
-                .execute
-            )
+        query = self._build_search_query(criteria)
+        # Include attachments if not explicitly excluded
+        include_attachments = criteria.has_attachments is not False
 
-            messages = result.get("messages", [])
+        remaining = criteria.max_results
+        page_count = 0
+        page_task: asyncio.Task | None = None
 
-            # Get full message details
-            emails = []
-            # Include attachments if not explicitly excluded
-            include_attachments = criteria.has_attachments is not False
+        try:
+            if remaining > 0:
+                page_task = asyncio.create_task(
+                    self._list_message_page(
+                        query, min(remaining, self.MAX_PAGE_SIZE), None
+                    )
+                )
 
-            for msg in messages:
+            while page_task is not None:
                 try:
-                    email_obj = await self.get_email(
-                        msg["id"], include_attachments=include_attachments
+                    result = await page_task
+                except HttpError as e:
+                    raise EmailSystemError(f"Failed to list Gmail messages: {e}") from e
+                page_task = None
+                page_count += 1
+
+                messages = result.get("messages", [])[:remaining]
+                remaining -= len(messages)
+                next_page_token = result.get("nextPageToken")
+
+                # Prefetch the next page of ids while this page is consumed
+                if next_page_token and remaining > 0:
+                    page_task = asyncio.create_task(
+                        self._list_message_page(
+                            query, min(remaining, self.MAX_PAGE_SIZE), next_page_token
+                        )
                     )
-                    emails.append(email_obj)
-                except Exception as e:
-                    logger.warning("Failed to get email %s: %s", msg["id"], e)
-                    continue
 
-            return emails
+                logger.debug(
+                    "Gmail page %d: %d messages (more pages: %s)",
+                    page_count,
+                    len(messages),
+                    page_task is not None,
+                )
+
+                for start in range(0, len(messages), self.MESSAGE_BATCH_SIZE):
+                    message_ids = [
+                        msg["id"]
+                        for msg in messages[start : start + self.MESSAGE_BATCH_SIZE]
+                    ]
+                    fetched = await self.get_emails_batch(
+                        message_ids,
+                        include_attachments=include_attachments,
+                        load_attachment_content=criteria.include_attachment_content,
+                    )
 
-        except HttpError as e:
-            raise EmailSystemError(f"Failed to list Gmail messages: {e}") from e
+                    for message_id in message_ids:
+                        result = fetched[message_id]
+                        if isinstance(result, Exception):
+                            logger.warning(
+                                "Failed to get email %s: %s", message_id, result
+                            )
+                            continue
+
+                        yield result
+
+        finally:
+            if page_task is not None and not page_task.done():
+                page_task.cancel()
+                with contextlib.suppress(asyncio.CancelledError, Exception):
+                    await page_task
+
+    async def _list_history_page(
+        self, start_history_id: str, label_id: str | None, page_token: str | None
+    ) -> dict[str, Any]:
+        """
+        Fetch one page of messageAdded history records.
+
+        Args:
+            start_history_id: History id to list changes after
+            label_id: Only return history for messages with this label
+            page_token: nextPageToken from the previous page, if any
+
+        Returns:
+            Raw history.list response
+        """
+        request_params = {
+            "userId": "me",
+            "startHistoryId": start_history_id,
+            "historyTypes": ["messageAdded"],
+            "maxResults": self.HISTORY_PAGE_SIZE,
+            "fields": self.HISTORY_FIELDS,
+        }
+        if label_id:
+            request_params["labelId"] = label_id
+        if page_token:
+            request_params["pageToken"] = page_token
+
+        return await self._execute_request(
+            self.service.users().history().list(**request_params).execute
+        )
+
+    async def _list_added_messages(
+        self, start_history_id: str, label_id: str | None
+    ) -> tuple[list[tuple[str, str]], str | None]:
+        """
+        List messages added since a history checkpoint.
+
+        Args:
+            start_history_id: History id of the last completed sync
+            label_id: Only return messages with this label
+
+        Returns:
+            Tuple of ((history record id, message id) pairs in history
+            order, current mailbox history id)
+
+        Raises:
+            HttpError: If history.list fails (404 means the checkpoint expired)
+        """
+        added: list[tuple[str, str]] = []
+        seen: set[str] = set()
+        latest_history_id = None
+        page_token = None
+
+        while True:
+            result = await self._list_history_page(
+                start_history_id, label_id, page_token
+            )
+            latest_history_id = result.get("historyId", latest_history_id)
+
+            for record in result.get("history", []):
+                for added_message in record.get("messagesAdded", []):
+                    message_id = added_message.get("message", {}).get("id")
+                    if message_id and message_id not in seen:
+                        seen.add(message_id)
+                        added.append((record["id"], message_id))
+
+            page_token = result.get("nextPageToken")
+            if not page_token:
+                break
+
+        return added, latest_history_id
+
+    @log_function()
+    async def stream_new_emails(
+        self, criteria: EmailSearchCriteria
+    ) -> AsyncGenerator[Email, None]:
+        """
+        Stream emails added since the last sync using history.list.
+
+        The last processed historyId is stored per mailbox in the sync state
+        file. Without a checkpoint, or when Gmail reports it as expired
+        (HTTP 404), this falls back to a full sync through stream_emails and
+        records the mailbox historyId taken before listing. The checkpoint
+        only advances once the yielded emails have been consumed; when
+        criteria.max_results stops the sync early it advances to the last
+        history record that was fully delivered.
+
+        Args:
+            criteria: Search criteria; labels[0] restricts history to that
+                label, has_attachments=True skips emails without attachments
+
+        Yields:
+            Email objects added since the previous sync
+
+        Raises:
+            ConnectionError: If not connected to Gmail
+            EmailSystemError: If history retrieval fails
+        """
+        if not self.service:
+            raise ConnectionError("Not connected to Gmail")
+
+        mailbox = self.user_email or "me"
+        start_history_id = self.sync_state.get("gmail", mailbox, "history_id")
+
+        added: list[tuple[str, str]] = []
+        latest_history_id = None
+        if start_history_id:
+            label_id = criteria.labels[0] if criteria.labels else None
+            try:
+                added, latest_history_id = await self._list_added_messages(
+                    start_history_id, label_id
+                )
+            except HttpError as e:
+                if e.resp.status != 404:
+                    raise EmailSystemError(f"Failed to list Gmail history: {e}") from e
+                self.logger.warning(
+                    f"Gmail history checkpoint {start_history_id} for {mailbox} "
+                    f"has expired - falling back to full sync"
+                )
+                self.sync_state.clear("gmail", mailbox, "history_id")
+                start_history_id = None
+
+        if not start_history_id:
+            # Take the checkpoint before listing so nothing arriving during
+            # the full sync is missed by the next incremental run
+            profile = await self.get_profile()
+            async for email_obj in self.stream_emails(criteria):
+                yield email_obj
+            if profile.get("history_id"):
+                self.sync_state.set(
+                    "gmail", mailbox, "history_id", str(profile["history_id"])
+                )
+            return
+
+        self.logger.info(
+            f"Gmail incremental sync for {mailbox}: {len(added)} new messages "
+            f"since history {start_history_id}"
+        )
+
+        # Include attachments if not explicitly excluded
+        include_attachments = criteria.has_attachments is not False
+        checkpoint = start_history_id
+        checkpoint_frozen = False
+        yielded = 0
+
+        index = 0
+        while index < len(added) and yielded < criteria.max_results:
+            chunk_size = min(self.MESSAGE_BATCH_SIZE, criteria.max_results - yielded)
+            chunk = added[index : index + chunk_size]
+            fetched = await self.get_emails_batch(
+                [message_id for _, message_id in chunk],
+                include_attachments=include_attachments,
+                load_attachment_content=criteria.include_attachment_content,
+            )
+
+            for record_id, message_id in chunk:
+                result = fetched[message_id]
+                email_obj = None
+                if isinstance(result, EmailNotFoundError):
+                    # Deleted between the history event and now
+                    pass
+                elif isinstance(result, Exception):
+                    # Keep the checkpoint before this message so it is retried
+                    logger.warning("Failed to get email %s: %s", message_id, result)
+                    checkpoint_frozen = True
+                else:
+                    email_obj = result
+
+                if email_obj and not (
+                    criteria.has_attachments and not email_obj.attachments
+                ):
+                    yielded += 1
+                    yield email_obj
+
+                # A history record is complete once its last message is handled
+                index += 1
+                is_last_of_record = index == len(added) or added[index][0] != record_id
+                if is_last_of_record and not checkpoint_frozen:
+                    checkpoint = record_id
+
+        if not added or checkpoint == added[-1][0]:
+            checkpoint = latest_history_id or checkpoint
+
+        if checkpoint and checkpoint != start_history_id:
+            self.sync_state.set("gmail", mailbox, "history_id", str(checkpoint))
 
     async def get_email(
         self, email_id: str, include_attachments: bool = False
@@ -489,10 +974,15 @@ class GmailInterface(BaseEmailInterface):
 
         try:
             # Get message
-            message = await self._run_in_executor(
+            message = await self._execute_request(
                 self.service.users()
                 .messages()
-                .get(userId="me", id=email_id, format="full")
+                .get(
+                    userId="me",
+                    id=email_id,
+                    format="full",
+                    fields=self.MESSAGE_FIELDS,
+                )
                 .execute
             )
 
@@ -503,6 +993,306 @@ class GmailInterface(BaseEmailInterface):
                 raise EmailNotFoundError(f"Email {email_id} not found") from e
             raise EmailSystemError(f"Failed to get Gmail message: {e}") from e
 
+    def _map_batch_error(self, item_id: str, exception: Exception) -> EmailSystemError:
+        """
+        Map a failed batch sub-request to an email system exception.
+
+        Args:
+            item_id: Message or attachment id the sub-request was for
+            exception: Exception reported for the sub-request
+
+        Returns:
+            EmailNotFoundError for HTTP 404, EmailSystemError otherwise
+        """
+        if isinstance(exception, HttpError):
+            if exception.resp.status == 404:
+                return EmailNotFoundError(f"Gmail item {item_id} not found")
+            return EmailSystemError(
+                f"Gmail batch request for {item_id} failed: {exception}"
+            )
+        return EmailSystemError(
+            f"Gmail batch request for {item_id} failed: {exception}"
+        )
+
+    def _get_thread_http(self) -> AuthorizedHttp:
+        """
+        Get an authorized HTTP client owned by the calling thread.
+
+        httplib2 clients must not be shared between threads, so batch calls
+        running concurrently in the thread pool each use their own.
+
+        Returns:
+            Authorized HTTP client for the current credentials
+        """
+        http = getattr(self._thread_local, "http", None)
+        if http is None or http.credentials is not self.credentials:
+            http = AuthorizedHttp(self.credentials, http=httplib2.Http())
+            self._thread_local.http = http
+        return http
+
+    async def _execute_batch(
+        self,
+        requests: dict[str, Any],
+        semaphore: asyncio.Semaphore | None = None,
+    ) -> dict[str, Any]:
+        """
+        Execute API requests through the Gmail batch endpoint.
+
+        Requests are sent in chunks of MAX_BATCH_SIZE sub-requests per HTTP
+        call. Throttled sub-requests are resent after a backoff, and any
+        other failure is reported per item rather than failing the batch.
+
+        Args:
+            requests: Mapping of item id to an unexecuted API request
+            semaphore: Bounds how many chunks run at once; without one the
+                chunks run one after another
+
+        Returns:
+            Mapping of item id to the response, or to an EmailSystemError
+            (EmailNotFoundError for 404) if that sub-request failed
+        """
+        results: dict[str, Any] = {}
+        items = list(requests.items())
+        limiter = self._get_rate_limiter()
+
+        def execute(batch: Any) -> None:
+            if self.credentials is None:
+                batch.execute()
+            else:
+                batch.execute(http=self._get_thread_http())
+
+        async def run_chunk(chunk: list[tuple[str, Any]]) -> None:
+            for attempt in range(limiter.retry_attempts + 1):
+                throttled: dict[str, Exception] = {}
+
+                def callback(
+                    request_id: str,
+                    response: Any,
+                    exception: Exception,
+                    throttled: dict[str, Exception] = throttled,
+                ) -> None:
+                    if exception is None:
+                        results[request_id] = response
+                    elif self._is_rate_limited(exception):
+                        throttled[request_id] = exception
+                    else:
+                        results[request_id] = self._map_batch_error(
+                            request_id, exception
+                        )
+
+                batch = self.service.new_batch_http_request(callback=callback)
+                for request_id, api_request in chunk:
+                    batch.add(api_request, request_id=request_id)
+
+                try:
+                    async with semaphore or contextlib.nullcontext():
+                        if isinstance(batch, GmailRestBatch):
+                            await self._execute_request(batch.execute, cost=len(chunk))
+                        else:
+                            await self._execute_request(execute, batch, cost=len(chunk))
+                except Exception as e:
+                    # The whole batch call failed; report it for every item
+                    for request_id, _ in chunk:
+                        results.setdefault(
+                            request_id, self._map_batch_error(request_id, e)
+                        )
+                    return
+
+                if not throttled:
+                    return
+                if attempt == limiter.retry_attempts:
+                    for request_id, exception in throttled.items():
+                        results[request_id] = self._map_batch_error(
+                            request_id, exception
+                        )
+                    return
+
+                # Resend only the throttled sub-requests
+                chunk = [item for item in chunk if item[0] in throttled]
+                await asyncio.sleep(limiter.record_throttle(attempt))
+
+        chunks = [
+            items[start : start + self.MAX_BATCH_SIZE]
+            for start in range(0, len(items), self.MAX_BATCH_SIZE)
+        ]
+        if semaphore is None:
+            for chunk in chunks:
+                await run_chunk(chunk)
+        else:
+            await asyncio.gather(*(run_chunk(chunk) for chunk in chunks))
+
+        return results
+
+    @log_function()
+    async def get_emails_batch(
+        self,
+        email_ids: list[str],
+        include_attachments: bool = False,
+        load_attachment_content: bool = True,
+    ) -> dict[str, Email | EmailSystemError]:
+        """
+        Get several emails using batched messages.get and attachment requests.
+
+        Args:
+            email_ids: Gmail message ids to fetch
+            include_attachments: Whether to include attachments
+            load_attachment_content: Whether to download attachment content;
+                when False it can be loaded later with load_attachments
+
+        Returns:
+            Mapping of message id to its Email, or to an EmailSystemError
+            (EmailNotFoundError if the message does not exist)
+
+        Raises:
+            ConnectionError: If not connected to Gmail
+        """
+        if not self.service:
+            raise ConnectionError("Not connected to Gmail")
+
+        messages = await self._execute_batch(
+            {
+                email_id: self.service.users()
+                .messages()
+                .get(
+                    userId="me",
+                    id=email_id,
+                    format="full",
+                    fields=self.MESSAGE_FIELDS,
+                )
+                for email_id in email_ids
+            }
+        )
+
+        results: dict[str, Email | EmailSystemError] = {}
+        pending_downloads: list[tuple[str, EmailAttachment]] = []
+
+        for email_id in email_ids:
+            message = messages.get(email_id)
+            if isinstance(message, Exception):
+                results[email_id] = message
+                continue
+
+            try:
+                email_obj = await self._parse_gmail_message(
+                    message, include_attachments, load_attachment_content=False
+                )
+            except Exception as e:
+                results[email_id] = EmailSystemError(
+                    f"Failed to parse Gmail message {email_id}: {e}"
+                )
+                continue
+
+            results[email_id] = email_obj
+            if load_attachment_content:
+                pending_downloads.extend(
+                    (email_id, attachment)
+                    for attachment in email_obj.attachments
+                    if attachment.attachment_id
+                    and not attachment.is_loaded
+                    and not attachment.blocked_reason
+                )
+
+        if pending_downloads:
+            await self._download_attachment_contents(pending_downloads)
+
+        return results
+
+    async def load_attachments(self, attachments: list[EmailAttachment]) -> None:
+        """
+        Download content for attachments listed without it.
+
+        Uses the same batched, concurrent download path as listing.
+
+        Args:
+            attachments: Attachments to load
+
+        Raises:
+            ConnectionError: If not connected to Gmail
+        """
+        if not self.service:
+            raise ConnectionError("Not connected to Gmail")
+
+        pending = [
+            (attachment.message_id, attachment)
+            for attachment in attachments
+            if not attachment.is_loaded
+            and attachment.source
+            and not attachment.blocked_reason
+        ]
+        if pending:
+            await self._download_attachment_contents(pending)
+
+    async def _download_attachment_contents(
+        self, pending: list[tuple[str, EmailAttachment]]
+    ) -> None:
+        """
+        Download attachment content through the batch endpoint.
+
+        Batches are limited to MAX_BATCH_SIZE attachments and roughly
+        ATTACHMENT_BATCH_MAX_BYTES of attachment data, and up to
+        max_concurrent_attachments batches are downloaded at once. Failures
+        are logged and recorded on the attachment's download_error, leaving
+        it without content.
+
+        Args:
+            pending: (message id, attachment) pairs to download
+        """
+        batches: list[list[tuple[str, EmailAttachment]]] = [[]]
+        batch_bytes = 0
+        for message_id, attachment in pending:
+            current = batches[-1]
+            if current and (
+                len(current) >= self.MAX_BATCH_SIZE
+                or batch_bytes + attachment.size > self.ATTACHMENT_BATCH_MAX_BYTES
+            ):
+                batches.append([])
+                batch_bytes = 0
+            batches[-1].append((message_id, attachment))
+            batch_bytes += attachment.size
+
+        semaphore = self._get_attachment_semaphore()
+
+        async def download(batch: list[tuple[str, EmailAttachment]]) -> None:
+            requests = {
+                str(i): self.service.users()
+                .messages()
+                .attachments()
+                .get(userId="me", messageId=message_id, id=attachment.attachment_id)
+                for i, (message_id, attachment) in enumerate(batch)
+            }
+            # Responses hold the whole batch, so it reserves its total size
+            batch_size = sum(attachment.size for _, attachment in batch)
+            async with self.attachment_byte_budget.reserve(batch_size):
+                logger.info(f"Downloading {len(batch)} Gmail attachments in one batch")
+                responses = await self._execute_batch(requests, semaphore)
+
+                for i, (message_id, attachment) in enumerate(batch):
+                    response = responses.get(str(i))
+                    if isinstance(response, Exception) or response is None:
+                        logger.error(
+                            f"Failed to download attachment {attachment.filename} from Gmail message {message_id}: {response}"
+                        )
+                        # Keep the attachment in the list but without content
+                        attachment.download_error = str(response or "No response")
+                        continue
+
+                    try:
+                        size = await self._store_attachment_base64(
+                            attachment, response["data"], urlsafe=True
+                        )
+                        logger.info(
+                            f"Successfully downloaded {attachment.filename}: {size} bytes"
+                        )
+                    except (KeyError, ValueError, TypeError) as e:
+                        logger.error(
+                            f"Failed to decode attachment {attachment.filename} from Gmail message {message_id}: {e}"
+                        )
+                        attachment.download_error = f"Invalid attachment data: {e}"
+
+        # Batches run concurrently, bounded by max_concurrent_attachments
+        # and the attachment byte budget
+        await asyncio.gather(*(download(batch) for batch in batches))
+
     async def send_email(self, request: EmailSendRequest) -> str:
         """Send an email via Gmail."""
         if not self.service:
@@ -562,7 +1352,7 @@ class GmailInterface(BaseEmailInterface):
             raw_message = base64.urlsafe_b64encode(message.as_bytes()).decode()
 
             # Send message
-            result = await self._run_in_executor(
+            result = await self._execute_request(
                 self.service.users()
                 .messages()
                 .send(userId="me", body={"raw": raw_message})
@@ -588,7 +1378,7 @@ class GmailInterface(BaseEmailInterface):
             raise ConnectionError("Not connected to Gmail")
 
         try:
-            await self._run_in_executor(
+            await self._execute_request(
                 self.service.users().messages().trash(userId="me", id=email_id).execute
             )
             return True
@@ -603,7 +1393,7 @@ class GmailInterface(BaseEmailInterface):
             raise ConnectionError("Not connected to Gmail")
 
         try:
-            result = await self._run_in_executor(
+            result = await self._execute_request(
                 self.service.users().labels().list(userId="me").execute
             )
 
@@ -652,8 +1442,12 @@ class GmailInterface(BaseEmailInterface):
                     request_params["pageToken"] = next_page_token
 
                 # Get contacts page
-                results = await self._run_in_executor(
-                    people_service.people().connections().list(**request_params).execute
+                results = await self._execute_request(
+                    people_service.people()
+                    .connections()
+                    .list(**request_params)
+                    .execute,
+                    api="people",
                 )
 
                 connections = results.get("connections", [])
@@ -720,7 +1514,7 @@ class GmailInterface(BaseEmailInterface):
             if remove_labels:
                 body["removeLabelIds"] = remove_labels
 
-            await self._run_in_executor(
+            await self._execute_request(
                 self.service.users()
                 .messages()
                 .modify(userId="me", id=email_id, body=body)
@@ -734,7 +1528,10 @@ class GmailInterface(BaseEmailInterface):
             raise EmailSystemError(f"Failed to modify Gmail message labels: {e}") from e
 
     async def _parse_gmail_message(
-        self, message: dict[str, Any], include_attachments: bool = False
+        self,
+        message: dict[str, Any],
+        include_attachments: bool = False,
+        load_attachment_content: bool = True,
     ) -> Email:
         """Parse Gmail API message into Email object."""
 
@@ -765,15 +1562,13 @@ class GmailInterface(BaseEmailInterface):
             with contextlib.suppress(ValueError, TypeError, AttributeError):
                 sent_date = email.utils.parsedate_to_datetime(headers["date"])
 
-        # Parse body
-        body_text, body_html = await self._extract_body(message["payload"])
-
-        # Parse attachments
-        attachments = []
-        if include_attachments:
-            attachments = await self._extract_attachments(
-                message["payload"], message["id"]
-            )
+        # Parse body and attachments in one pass over the MIME tree
+        body_text, body_html, attachments = await self._extract_payload(
+            message["payload"],
+            message["id"],
+            include_attachments,
+            load_attachment_content,
+        )
 
         # Determine importance
         importance = EmailImportance.NORMAL
@@ -814,35 +1609,98 @@ class GmailInterface(BaseEmailInterface):
             raw_data=message,
         )
 
-    async def _extract_body(
-        self, payload: dict[str, Any]
-    ) -> tuple[str | None, str | None]:
-        """Extract text and HTML body from Gmail message payload."""
+    async def _extract_payload(
+        self,
+        payload: dict[str, Any],
+        message_id: str,
+        include_attachments: bool = True,
+        load_content: bool = True,
+    ) -> tuple[str | None, str | None, list[EmailAttachment]]:
+        """
+        Extract body and attachments from a Gmail payload in one pass.
+
+        Walks the MIME tree iteratively in document order, so attachments
+        inside nested multiparts (e.g. forwarded messages) are found too.
+        The first text/plain and text/html parts without a filename are the
+        body; parts with a filename are attachments. Attachment content
+        Gmail already returned inline in body.data is decoded directly
+        instead of being fetched by attachment ID.
+
+        Args:
+            payload: Message payload from the Gmail API
+            message_id: Gmail message ID
+            include_attachments: Whether to collect attachments
+            load_content: Whether to download attachment content that was
+                not returned inline
+
+        Returns:
+            Tuple of (body_text, body_html, attachments)
+        """
         body_text = None
         body_html = None
+        attachments: list[EmailAttachment] = []
+        inline: list[tuple[EmailAttachment, str]] = []
 
-        if "parts" in payload:
-            # Multipart message
-            for part in payload["parts"]:
-                if part["mimeType"] == "text/plain":
-                    body_text = await self._decode_body_data(part["body"])
-                elif part["mimeType"] == "text/html":
-                    body_html = await self._decode_body_data(part["body"])
-                elif part["mimeType"].startswith("multipart/"):
-                    # Nested multipart
-                    nested_text, nested_html = await self._extract_body(part)
-                    if nested_text:
-                        body_text = nested_text
-                    if nested_html:
-                        body_html = nested_html
-        else:
-            # Single part message
-            if payload["mimeType"] == "text/plain":
-                body_text = await self._decode_body_data(payload["body"])
-            elif payload["mimeType"] == "text/html":
-                body_html = await self._decode_body_data(payload["body"])
+        stack = [payload]
+        while stack:
+            part = stack.pop()
+            mime_type = part.get("mimeType", "")
+            body = part.get("body", {})
 
-        return body_text, body_html
+            if part.get("filename"):
+                if not include_attachments:
+                    continue
+                attachment = EmailAttachment(
+                    filename=part["filename"],
+                    content_type=mime_type,
+                    size=body.get("size", 0),
+                    attachment_id=body.get("attachmentId"),
+                    message_id=message_id,
+                    provider="gmail",
+                )
+                if body.get("data"):
+                    inline.append((attachment, body["data"]))
+                elif not attachment.attachment_id:
+                    logger.warning(
+                        f"Gmail attachment {attachment.filename} has no attachment ID - cannot download content"
+                    )
+                attachments.append(attachment)
+            elif part.get("parts"):
+                # Reversed so parts pop off the stack in document order
+                stack.extend(reversed(part["parts"]))
+            elif mime_type == "text/plain" and body_text is None:
+                body_text = await self._decode_body_data(body)
+            elif mime_type == "text/html" and body_html is None:
+                body_html = await self._decode_body_data(body)
+
+        # Gate downloads on metadata before any content is fetched
+        self._apply_attachment_filter(attachments)
+
+        # Inline content needs no API round trip
+        for attachment, data in inline:
+            if attachment.blocked_reason:
+                continue
+            try:
+                await self._store_attachment_base64(attachment, data, urlsafe=True)
+            except (ValueError, TypeError) as e:
+                logger.error(
+                    f"Failed to decode inline attachment {attachment.filename} from Gmail message {message_id}: {e}"
+                )
+                attachment.download_error = f"Invalid attachment data: {e}"
+
+        # Optionally load content
+        if load_content:
+            pending = [
+                (message_id, attachment)
+                for attachment in attachments
+                if attachment.attachment_id
+                and not attachment.is_loaded
+                and not attachment.blocked_reason
+            ]
+            if pending:
+                await self._download_attachment_contents(pending)
+
+        return body_text, body_html, attachments
 
     async def _decode_body_data(self, body_data: dict[str, Any]) -> str | None:
         """Decode Gmail message body data."""
@@ -857,57 +1715,3 @@ class GmailInterface(BaseEmailInterface):
         except Exception as e:
             logger.warning("Failed to decode body data: %s", e)
             return None
-
-    async def _extract_attachments(
-        self, payload: dict[str, Any], message_id: str
-    ) -> list[EmailAttachment]:
-        """Extract attachments from Gmail message."""
-        attachments = []
-
-        if "parts" in payload:
-            for part in payload["parts"]:
-                if "filename" in part and part["filename"]:
-                    # This is an attachment
-                    attachment = EmailAttachment(
-                        filename=part["filename"],
-                        content_type=part["mimeType"],
-                        size=part["body"].get("size", 0),
-                        attachment_id=part["body"].get("attachmentId"),
-                    )
-
-                    # Optionally load content
-                    if part["body"].get("attachmentId"):
-                        try:
-                            logger.info(
-                                f"Downloading content for {attachment.filename} from Gmail message {message_id}"
-                            )
-                            att_data = await self._run_in_executor(
-                                self.service.users()
-                                .messages()
-                                .attachments()
-                                .get(
-                                    userId="me",
-                                    messageId=message_id,
-                                    id=part["body"]["attachmentId"],
-                                )
-                                .execute
-                            )
-                            attachment.content = base64.urlsafe_b64decode(
-                                att_data["data"]
-                            )
-                            logger.info(
-                                f"Successfully downloaded {attachment.filename}: {len(attachment.content)} bytes"
-                            )
-                        except Exception as e:
-                            logger.error(
-                                f"Failed to download attachment {attachment.filename} from Gmail message {message_id}: {e}"
-                            )
-                            # Keep the attachment in the list but without content
-                    else:
-                        logger.warning(
-                            f"Gmail attachment {attachment.filename} has no attachment ID - cannot download content"
-                        )
-
-                    attachments.append(attachment)
-
-        return attachments
@@ -0,0 +1,495 @@
+"""
+Async Gmail REST Transport
+
+aiohttp-based replacement for the googleapiclient transport used by
+GmailInterface. Requests run on the event loop instead of holding a
+thread each, so Gmail throughput scales with the number of concurrent
+tasks rather than with the thread pool size.
+
+The transport mirrors the small part of the googleapiclient resource API
+that GmailInterface uses:
+
+    service.users().messages().get(userId="me", id=...).execute()
+
+except that ``execute()`` is a coroutine. Batches use the same
+``new_batch_http_request(callback=...)`` / ``add()`` / ``execute()``
+shape and are sent as multipart/mixed requests to the Gmail batch
+endpoint. Errors are raised as googleapiclient HttpError, so existing
+status handling works unchanged with either transport.
+
+Supported methods:
+    users.getProfile, users.messages.{list,get,send,trash,modify},
+    users.messages.attachments.get, users.labels.list, users.history.list
+"""
+
+# # Standard library imports
+import asyncio
+import email.parser
+import email.policy
+import json
+import os
+
+# Logging system
+import sys
+import uuid
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Any
+from urllib.parse import quote, urlencode
+
+# # Third-party imports
+import aiohttp
+import httplib2
+from google.auth.transport.requests import Request
+from google.oauth2.credentials import Credentials
+from googleapiclient.errors import HttpError
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+# # Local application imports
+from utils.logging_system import get_logger  # noqa: E402
+
+# Initialize logger
+logger = get_logger(__name__)
+
+GMAIL_API_ROOT = "https://gmail.googleapis.com"
+GMAIL_API_PATH = "/gmail/v1/"
+GMAIL_BATCH_URL = f"{GMAIL_API_ROOT}/batch/gmail/v1"
+
+# (resource path, method name) -> (HTTP method, URL template)
+_METHODS: dict[tuple[str, str], tuple[str, str]] = {
+    ("users", "getProfile"): ("GET", "users/{userId}/profile"),
+    ("users.messages", "list"): ("GET", "users/{userId}/messages"),
+    ("users.messages", "get"): ("GET", "users/{userId}/messages/{id}"),
+    ("users.messages", "send"): ("POST", "users/{userId}/messages/send"),
+    ("users.messages", "trash"): ("POST", "users/{userId}/messages/{id}/trash"),
+    ("users.messages", "modify"): ("POST", "users/{userId}/messages/{id}/modify"),
+    ("users.messages.attachments", "get"): (
+        "GET",
+        "users/{userId}/messages/{messageId}/attachments/{id}",
+    ),
+    ("users.labels", "list"): ("GET", "users/{userId}/labels"),
+    ("users.history", "list"): ("GET", "users/{userId}/history"),
+}
+
+
+def _http_error(
+    status: int, content: bytes, uri: str, headers: dict[str, str] | None = None
+) -> HttpError:
+    """
+    Build a googleapiclient HttpError for a failed REST response.
+
+    Args:
+        status: HTTP status code
+        content: Response body
+        uri: Request URI
+        headers: Response headers
+
+    Returns:
+        HttpError whose resp carries the status and lower-cased headers
+    """
+    info = {key.lower(): value for key, value in (headers or {}).items()}
+    info["status"] = str(status)
+    return HttpError(httplib2.Response(info), content, uri=uri)
+
+
+@dataclass
+class GmailRestRequest:
+    """A Gmail API call that can be executed directly or added to a batch."""
+
+    client: "GmailRestClient"
+    method: str
+    path: str  # Relative to GMAIL_API_PATH
+    params: list[tuple[str, str]] = field(default_factory=list)
+    body: dict[str, Any] | None = None
+
+    @property
+    def uri(self) -> str:
+        """Absolute request URI including the query string."""
+        query = f"?{urlencode(self.params)}" if self.params else ""
+        return f"{GMAIL_API_ROOT}{GMAIL_API_PATH}{self.path}{query}"
+
+    async def execute(self) -> dict[str, Any]:
+        """
+        Execute the request.
+
+        Returns:
+            Decoded JSON response
+
+        Raises:
+            HttpError: If Gmail returns an error status
+        """
+        return await self.client.execute(self)
+
+
+class _GmailRestResource:
+    """Resource node mimicking the googleapiclient discovery resources."""
+
+    def __init__(self, client: "GmailRestClient", path: str) -> None:
+        """
+        Initialize the resource.
+
+        Args:
+            client: REST client that builds and sends requests
+            path: Dotted resource path, e.g. 'users.messages'
+        """
+        self._client = client
+        self._path = path
+
+    def __getattr__(self, name: str) -> Callable[..., Any]:
+        """
+        Resolve a method or sub-resource by name.
+
+        Args:
+            name: Method or sub-resource name
+
+        Returns:
+            Callable building a request, or returning the sub-resource
+
+        Raises:
+            AttributeError: If the transport does not support the name
+        """
+        if (self._path, name) in _METHODS:
+            http_method, template = _METHODS[(self._path, name)]
+            return lambda **kwargs: self._client.build_request(
+                http_method, template, kwargs
+            )
+
+        child = f"{self._path}.{name}"
+        if any(path == child or path.startswith(f"{child}.") for path, _ in _METHODS):
+            return lambda: _GmailRestResource(self._client, child)
+
+        raise AttributeError(f"Gmail REST transport does not support {child}")
+
+
+class GmailRestBatch:
+    """Batch of Gmail requests sent as one multipart/mixed HTTP call."""
+
+    def __init__(
+        self, client: "GmailRestClient", callback: Callable[[str, Any, Any], None]
+    ) -> None:
+        """
+        Initialize the batch.
+
+        Args:
+            client: REST client that sends the batch
+            callback: Called with (request_id, response, exception) per item
+        """
+        self.client = client
+        self.callback = callback
+        self.requests: dict[str, GmailRestRequest] = {}
+
+    def add(self, request: GmailRestRequest, request_id: str) -> None:
+        """
+        Add a request to the batch.
+
+        Args:
+            request: Request built through the REST service
+            request_id: Identifier passed back to the callback
+        """
+        self.requests[request_id] = request
+
+    async def execute(self) -> None:
+        """
+        Send the batch and invoke the callback for every item.
+
+        Raises:
+            HttpError: If the batch call itself fails
+        """
+        responses = await self.client.execute_batch(self.requests)
+        for request_id in self.requests:
+            response = responses.get(request_id)
+            if isinstance(response, Exception):
+                self.callback(request_id, None, response)
+            elif response is None:
+                self.callback(
+                    request_id,
+                    None,
+                    _http_error(500, b"Missing batch response", GMAIL_BATCH_URL),
+                )
+            else:
+                self.callback(request_id, response, None)
+
+
+class GmailRestService:
+    """Entry point mirroring ``build("gmail", "v1")`` for the REST transport."""
+
+    def __init__(self, client: "GmailRestClient") -> None:
+        """
+        Initialize the service.
+
+        Args:
+            client: REST client that builds and sends requests
+        """
+        self.client = client
+
+    def users(self) -> _GmailRestResource:
+        """Get the users resource."""
+        return _GmailRestResource(self.client, "users")
+
+    def new_batch_http_request(
+        self, callback: Callable[[str, Any, Any], None]
+    ) -> GmailRestBatch:
+        """
+        Create a batch whose results are reported through a callback.
+
+        Args:
+            callback: Called with (request_id, response, exception) per item
+
+        Returns:
+            Empty batch
+        """
+        return GmailRestBatch(self.client, callback)
+
+
+class GmailRestClient:
+    """
+    aiohttp client for the Gmail REST API using Google OAuth credentials.
+
+    One pooled session is kept per event loop; expired access tokens are
+    refreshed with the credentials' refresh token before a request.
+    """
+
+    REQUEST_TIMEOUT = 60
+    CONNECTION_POOL_SIZE = 20
+    KEEPALIVE_TIMEOUT = 60
+    DNS_CACHE_TTL = 300
+
+    def __init__(self, credentials: Credentials) -> None:
+        """
+        Initialize the client.
+
+        Args:
+            credentials: Authorized Google OAuth credentials
+        """
+        self.credentials = credentials
+        self.session: aiohttp.ClientSession | None = None
+        self._session_loop: asyncio.AbstractEventLoop | None = None
+        self._refresh_lock: asyncio.Lock | None = None
+
+    def build_request(
+        self, method: str, template: str, kwargs: dict[str, Any]
+    ) -> GmailRestRequest:
+        """
+        Build a request from googleapiclient-style keyword arguments.
+
+        Path parameters fill the URL template, ``body`` becomes the JSON
+        body and the remaining arguments become query parameters (lists
+        are repeated).
+
+        Args:
+            method: HTTP method
+            template: URL template relative to the API root
+            kwargs: Method arguments
+
+        Returns:
+            Unexecuted request
+        """
+        kwargs = dict(kwargs)
+        body = kwargs.pop("body", None)
+
+        path_params = {}
+        for name in ("userId", "messageId", "id"):
+            if "{" + name + "}" in template:
+                path_params[name] = quote(str(kwargs.pop(name)), safe="")
+        path = template.format(**path_params)
+
+        params: list[tuple[str, str]] = []
+        for name, value in kwargs.items():
+            if value is None:
+                continue
+            values = value if isinstance(value, list | tuple) else [value]
+            for item in values:
+                if isinstance(item, bool):
+                    item = "true" if item else "false"
+                params.append((name, str(item)))
+
+        return GmailRestRequest(
+            client=self, method=method, path=path, params=params, body=body
+        )
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """
+        Get the pooled session for the running event loop.
+
+        Returns:
+            Open aiohttp session
+        """
+        loop = asyncio.get_running_loop()
+        if self.session and not self.session.closed and self._session_loop is loop:
+            return self.session
+
+        if self.session and not self.session.closed:
+            await self.session.close()
+
+        self.session = aiohttp.ClientSession(
+            timeout=aiohttp.ClientTimeout(total=self.REQUEST_TIMEOUT),
+            connector=aiohttp.TCPConnector(
+                limit=self.CONNECTION_POOL_SIZE,
+                keepalive_timeout=self.KEEPALIVE_TIMEOUT,
+                ttl_dns_cache=self.DNS_CACHE_TTL,
+            ),
+            headers={"User-Agent": "EmailAgent-Gmail/1.0"},
+        )
+        self._session_loop = loop
+        self._refresh_lock = asyncio.Lock()
+        return self.session
+
+    async def _auth_headers(self) -> dict[str, str]:
+        """
+        Get the Authorization header, refreshing the token if needed.
+
+        Returns:
+            Header dictionary with a valid bearer token
+        """
+        if not self.credentials.valid:
+            async with self._refresh_lock:
+                if not self.credentials.valid:
+                    loop = asyncio.get_running_loop()
+                    await loop.run_in_executor(
+                        None, self.credentials.refresh, Request()
+                    )
+                    logger.info("Gmail access token refreshed")
+
+        return {"Authorization": f"Bearer {self.credentials.token}"}
+
+    async def execute(self, request: GmailRestRequest) -> dict[str, Any]:
+        """
+        Execute a single request.
+
+        Args:
+            request: Request to send
+
+        Returns:
+            Decoded JSON response (empty for empty bodies)
+
+        Raises:
+            HttpError: If Gmail returns an error status or the request fails
+        """
+        session = await self._get_session()
+        headers = await self._auth_headers()
+
+        try:
+            async with session.request(
+                request.method, request.uri, json=request.body, headers=headers
+            ) as response:
+                content = await response.read()
+                if response.status >= 400:
+                    raise _http_error(
+                        response.status, content, request.uri, dict(response.headers)
+                    )
+        except aiohttp.ClientError as e:
+            raise _http_error(503, str(e).encode(), request.uri) from e
+
+        return json.loads(content) if content else {}
+
+    async def execute_batch(
+        self, requests: dict[str, GmailRestRequest]
+    ) -> dict[str, dict[str, Any] | HttpError]:
+        """
+        Send requests through the Gmail batch endpoint.
+
+        Args:
+            requests: Mapping of request id to request (at most 100)
+
+        Returns:
+            Mapping of request id to its decoded response or HttpError
+
+        Raises:
+            HttpError: If the batch call itself fails
+        """
+        boundary = f"batch_{uuid.uuid4().hex}"
+        parts = []
+        for request_id, request in requests.items():
+            query = f"?{urlencode(request.params)}" if request.params else ""
+            lines = [
+                f"--{boundary}",
+                "Content-Type: application/http",
+                f"Content-ID: <{request_id}>",
+                "",
+                f"{request.method} {GMAIL_API_PATH}{request.path}{query} HTTP/1.1",
+            ]
+            if request.body is not None:
+                lines += [
+                    "Content-Type: application/json",
+                    "",
+                    json.dumps(request.body),
+                ]
+            else:
+                lines.append("")
+            parts.append("\r\n".join(lines))
+        payload = "\r\n".join(parts) + f"\r\n--{boundary}--\r\n"
+
+        session = await self._get_session()
+        headers = await self._auth_headers()
+        headers["Content-Type"] = f"multipart/mixed; boundary={boundary}"
+
+        try:
+            async with session.post(
+                GMAIL_BATCH_URL, data=payload.encode(), headers=headers
+            ) as response:
+                content = await response.read()
+                if response.status >= 400:
+                    raise _http_error(
+                        response.status,
+                        content,
+                        GMAIL_BATCH_URL,
+                        dict(response.headers),
+                    )
+                content_type = response.headers.get("Content-Type", "")
+        except aiohttp.ClientError as e:
+            raise _http_error(503, str(e).encode(), GMAIL_BATCH_URL) from e
+
+        return self._parse_batch_response(content_type, content)
+
+    def _parse_batch_response(
+        self, content_type: str, content: bytes
+    ) -> dict[str, dict[str, Any] | HttpError]:
+        """
+        Parse a multipart/mixed batch response.
+
+        Args:
+            content_type: Content-Type header including the boundary
+            content: Response body
+
+        Returns:
+            Mapping of request id to its decoded response or HttpError
+        """
+        message = email.parser.BytesParser(policy=email.policy.HTTP).parsebytes(
+            f"Content-Type: {content_type}\r\n\r\n".encode() + content
+        )
+
+        results: dict[str, dict[str, Any] | HttpError] = {}
+        for part in message.iter_parts():
+            content_id = part.get("Content-ID", "").strip("<>")
+            request_id = content_id.removeprefix("response-")
+
+            # Decode the raw part bytes as UTF-8 ourselves: the text payload
+            # carries non-ASCII bytes as surrogate escapes.
+            raw = part.get_payload(decode=True)
+            if not isinstance(raw, bytes):
+                continue
+            text = raw.decode("utf-8", errors="replace")
+            head, _, body = text.replace("\r\n", "\n").partition("\n\n")
+            status_line, *header_lines = head.split("\n")
+            status = int(status_line.split(" ")[1])
+            part_headers = dict(
+                line.split(":", 1) for line in header_lines if ":" in line
+            )
+            part_headers = {k.strip(): v.strip() for k, v in part_headers.items()}
+
+            if status >= 400:
+                results[request_id] = _http_error(
+                    status, body.encode(), GMAIL_BATCH_URL, part_headers
+                )
+            else:
+                results[request_id] = json.loads(body) if body.strip() else {}
+
+        return results
+
+    async def close(self) -> None:
+        """Close the pooled HTTP session."""
+        if self.session and not self.session.closed:
+            await self.session.close()
+        self.session = None
+        self._session_loop = None
@@ -50,13 +50,14 @@ import socketserver
 # Logging system
 import sys
 import threading
+import time
 import webbrowser
-from collections.abc import Callable
+from collections.abc import AsyncGenerator, Callable
 from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
-from urllib.parse import parse_qs, urlparse
+from urllib.parse import parse_qs, urlencode, urlparse
 
 # # Third-party imports
 import aiohttp
@@ -83,6 +84,22 @@ from .base import (  # noqa: E402
     EmailSendRequest,
     EmailSystemError,
 )
+from .msgraph_batch import (  # noqa: E402
+    GraphBatchClient,
+    GraphBatchRequest,
+    GraphBatchResponse,
+)
+from .rate_limiter import (  # noqa: E402
+    DEFAULT_BYTE_BUDGET,
+    ApiRateLimiter,
+    get_rate_limiter,
+)
+from .spool import (  # noqa: E402
+    CHUNK_SIZE,
+    DEFAULT_SPOOL_THRESHOLD,
+    SpooledAttachmentBuffer,
+)
+from .sync_state import SyncStateStore  # noqa: E402
 
 # Initialize logger
 logger = get_logger(__name__)
@@ -295,10 +312,48 @@ class MicrosoftGraphInterface(BaseEmailInterface):
     DEFAULT_PAGE_SIZE = 25
     MAX_PAGE_SIZE = 100
     REQUEST_TIMEOUT = 30
+    CONNECTION_POOL_SIZE = 20  # Open connections kept by the session
+    KEEPALIVE_TIMEOUT = 60  # Seconds an idle connection stays open
+    DNS_CACHE_TTL = 300
+    TOKEN_REFRESH_MARGIN = 300  # Refresh tokens expiring within 5 minutes
+    TOKEN_REFRESH_RETRY = 30  # Seconds between failed silent refresh attempts
     AUTH_TIMEOUT = 300  # 5 minutes for authentication
+    DELTA_PAGE_SIZE = 50
+    DELTA_SEEN_LIMIT = 5000  # Message ids remembered to skip changed messages
+    BATCH_ATTACHMENT_MAX_SIZE = 4 * 1024 * 1024  # Larger ones download alone
+    ATTACHMENT_BATCH_MAX_BYTES = 16 * 1024 * 1024  # Attachment bytes per $batch
+    DOWNLOAD_CHUNK_SIZE = CHUNK_SIZE  # Bytes read per streamed download chunk
+    DOWNLOAD_RESUME_ATTEMPTS = 3  # Range resumes after a dropped connection
+    # Response projection: only the message properties _parse_graph_message
+    # reads, and attachment metadata without contentBytes (content is
+    # fetched separately through $batch or streamed downloads)
+    MESSAGE_SELECT = (
+        "id,conversationId,internetMessageId,subject,from,toRecipients,"
+        "ccRecipients,body,importance,isRead,flag,sentDateTime,receivedDateTime"
+    )
+    ATTACHMENT_METADATA_SELECT = "id,name,contentType,size"
+    ATTACHMENT_METADATA_EXPAND = f"attachments($select={ATTACHMENT_METADATA_SELECT})"
+    # Delta queries do not expand attachments; hasAttachments tells which
+    # messages need their attachment metadata fetched through $batch
+    DELTA_SELECT = f"{MESSAGE_SELECT},hasAttachments"
+    BODY_CONTENT_TYPES = ("text", "html")
+
+    # Outlook limits: 10,000 requests per 10 minutes and 4 concurrent
+    # requests per mailbox
+    RETRY_ATTEMPTS = 3  # Retries for throttled requests
+    RATE_LIMIT_PER_SECOND = 16
+    MAX_CONCURRENT_REQUESTS = 4
 
     def __init__(
-        self, credentials_path: str = "config/msgraph_credentials.json"
+        self,
+        credentials_path: str = "config/msgraph_credentials.json",
+        sync_state_path: str = "data/sync_state.json",
+        graph_endpoint: str | None = None,
+        max_concurrent_attachments: int = 10,
+        attachment_spool_threshold: int = DEFAULT_SPOOL_THRESHOLD,
+        attachment_spool_dir: str | None = None,
+        attachment_byte_budget: int = DEFAULT_BYTE_BUDGET,
+        body_content_type: str = "text",
     ) -> None:
         """
         Initialize Microsoft Graph interface with complete configuration.
@@ -309,31 +364,75 @@ class MicrosoftGraphInterface(BaseEmailInterface):
 
         Args:
             credentials_path: Path to Microsoft Graph credentials JSON file
+            sync_state_path: JSON file holding incremental sync checkpoints
+            graph_endpoint: Override for the Graph API base URL, e.g. a
+                local stand-in server used in tests
+            max_concurrent_attachments: Maximum attachment downloads and
+                attachment $batch calls in flight at once
+            attachment_spool_threshold: Attachments larger than this many
+                bytes are kept in a temporary file instead of in memory
+            attachment_spool_dir: Directory for attachment spool files
+            attachment_byte_budget: Attachment bytes that may be downloading
+                at once across the process (0 for no limit)
+            body_content_type: Message body format Graph should return,
+                'text' or 'html'
 
         Raises:
             FileNotFoundError: If credentials file not found
-            ValueError: If credentials file is invalid
+            ValueError: If credentials file is invalid or the body content
+                type is unknown
             RuntimeError: If required dependencies are missing
 
         Note:
             Requires valid Microsoft Graph application registration with
             appropriate permissions for email access in the target tenant.
         """
-        super().__init__()
+        super().__init__(
+            max_concurrent_attachments,
+            attachment_spool_threshold,
+            attachment_spool_dir,
+            attachment_byte_budget,
+        )
 
         self.logger = get_logger(f"{__name__}.MicrosoftGraphInterface")
         self.logger.info("Initializing Microsoft Graph email interface")
 
+        if body_content_type not in self.BODY_CONTENT_TYPES:
+            raise ValueError(
+                f"Unknown body content type '{body_content_type}', "
+                f"expected one of {self.BODY_CONTENT_TYPES}"
+            )
+        # Graph converts bodies server-side, so HTML is not shipped for text
+        self.body_content_type = body_content_type
+
         # Core components
         self.access_token: str | None = None
+        self.token_expires_at: float | None = None
+        self._token_refresh_retry_at = 0.0
         self.app: msal.PublicClientApplication | None = None
         self.session: aiohttp.ClientSession | None = None
+        self._session_loop: asyncio.AbstractEventLoop | None = None
+
+        # Connection pool counters, updated by the session's trace hooks
+        self.connection_stats = {
+            "requests": 0,
+            "connections_created": 0,
+            "connections_reused": 0,
+            "dns_cache_hits": 0,
+            "dns_cache_misses": 0,
+        }
         self.executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="msgraph")
 
         # Load and validate credentials
         self.credentials_path = Path(credentials_path)
         self.credentials = self._load_credentials()
 
+        # Incremental sync checkpoints (deltaLink per folder)
+        self.sync_state = SyncStateStore(sync_state_path)
+
+        if graph_endpoint:
+            self.GRAPH_ENDPOINT = graph_endpoint.rstrip("/")
+
         # Performance tracking
         self.request_count = 0
         self.error_count = 0
@@ -474,7 +573,7 @@ class MicrosoftGraphInterface(BaseEmailInterface):
                 )
 
             # Store access token
-            self.access_token = token_result["access_token"]
+            self._store_token(token_result)
             self.logger.info("Microsoft Graph access token acquired successfully")
 
             # Initialize HTTP session
@@ -614,16 +713,97 @@ class MicrosoftGraphInterface(BaseEmailInterface):
             server.shutdown()
             server.server_close()
 
+    def _store_token(self, token_result: dict[str, Any]) -> None:
+        """
+        Store an MSAL token result.
+
+        Args:
+            token_result: Token response containing access_token and expires_in
+        """
+        self.access_token = token_result["access_token"]
+        expires_in = token_result.get("expires_in")
+        self.token_expires_at = (
+            time.monotonic() + float(expires_in) if expires_in else None
+        )
+
+    async def _ensure_access_token(self) -> None:
+        """
+        Silently refresh the access token shortly before it expires.
+
+        The new token is swapped into the session headers, so the connection
+        pool is kept. After a failed refresh the expiry is kept and the
+        refresh is retried TOKEN_REFRESH_RETRY seconds later.
+        """
+        now = time.monotonic()
+        if (
+            not self.app
+            or self.token_expires_at is None
+            or now < self.token_expires_at - self.TOKEN_REFRESH_MARGIN
+            or now < self._token_refresh_retry_at
+        ):
+            return
+
+        accounts = await self._run_in_executor(self.app.get_accounts)
+        token_result = None
+        if accounts:
+            token_result = await self._run_in_executor(
+                self.app.acquire_token_silent, self.SCOPES, account=accounts[0]
+            )
+
+        if not token_result or "access_token" not in token_result:
+            self.logger.warning(
+                "Silent Microsoft Graph token refresh failed - keeping current token"
+            )
+            # Avoid retrying the refresh on every request
+            self._token_refresh_retry_at = now + self.TOKEN_REFRESH_RETRY
+            return
+
+        self._store_token(token_result)
+        if self.session:
+            self.session.headers["Authorization"] = f"Bearer {self.access_token}"
+        self.logger.info("Microsoft Graph access token refreshed")
+
+    def _create_trace_config(self) -> aiohttp.TraceConfig:
+        """
+        Create trace hooks that count requests and connection reuse.
+
+        Returns:
+            TraceConfig updating connection_stats
+        """
+        stats = self.connection_stats
+
+        def counter(name: str) -> Callable:
+            async def increment(*_args: Any) -> None:
+                stats[name] += 1
+
+            return increment
+
+        trace_config = aiohttp.TraceConfig()
+        trace_config.on_request_start.append(counter("requests"))
+        trace_config.on_connection_create_end.append(counter("connections_created"))
+        trace_config.on_connection_reuseconn.append(counter("connections_reused"))
+        trace_config.on_dns_cache_hit.append(counter("dns_cache_hits"))
+        trace_config.on_dns_cache_miss.append(counter("dns_cache_misses"))
+        return trace_config
+
     @log_function()
     async def _initialize_http_session(self) -> None:
         """
-        Initialize async HTTP session for Microsoft Graph API calls.
+        Initialize the pooled HTTP session for Microsoft Graph API calls.
 
-        Creates configured aiohttp session with appropriate headers,
-        timeouts, and error handling for API interactions.
+        The session and its connection pool live for the lifetime of the
+        interface: reconnecting only swaps the Authorization header. A new
+        session is created only when none is open or the event loop changed.
         """
-        if self.session:
-            await self.session.close()
+        loop = asyncio.get_running_loop()
+        if self.session and not self.session.closed and self._session_loop is loop:
+            self.session.headers["Authorization"] = f"Bearer {self.access_token}"
+            self.logger.info("Reusing pooled HTTP session for Microsoft Graph API")
+            return
+
+        if self.session and not self.session.closed:
+            with contextlib.suppress(Exception):
+                await self.session.close()
 
         # Configure session with authentication headers
         headers = {
@@ -633,32 +813,62 @@ class MicrosoftGraphInterface(BaseEmailInterface):
         }
 
         timeout = aiohttp.ClientTimeout(total=self.REQUEST_TIMEOUT)
+        connector = aiohttp.TCPConnector(
+            limit=self.CONNECTION_POOL_SIZE,
+            limit_per_host=self.CONNECTION_POOL_SIZE,
+            keepalive_timeout=self.KEEPALIVE_TIMEOUT,
+            ttl_dns_cache=self.DNS_CACHE_TTL,
+            use_dns_cache=True,
+        )
 
         self.session = aiohttp.ClientSession(
             headers=headers,
             timeout=timeout,
+            connector=connector,
+            trace_configs=[self._create_trace_config()],
             raise_for_status=False,  # Handle errors manually
         )
+        self._session_loop = loop
 
         self.logger.info("HTTP session initialized for Microsoft Graph API")
 
+    def get_connection_stats(self) -> dict[str, Any]:
+        """
+        Get connection pool counters.
+
+        Returns:
+            Request, connection and DNS cache counters with the reuse ratio
+        """
+        created = self.connection_stats["connections_created"]
+        reused = self.connection_stats["connections_reused"]
+        return {
+            **self.connection_stats,
+            "reuse_ratio": (
+                round(reused / (created + reused), 3) if created + reused else 0.0
+            ),
+            "pool_size": self.CONNECTION_POOL_SIZE,
+            "session_open": bool(self.session and not self.session.closed),
+        }
+
     @log_function()
     async def disconnect(self) -> None:
         """
-        Disconnect from Microsoft Graph and cleanup resources.
+        Disconnect from Microsoft Graph.
 
-        Properly closes HTTP sessions, clears authentication tokens,
-        and resets connection state with complete cleanup.
+        Clears authentication tokens and resets connection state. The HTTP
+        connection pool and thread pool are kept so a later connect() reuses
+        them; call close() to release them.
         """
         self.logger.info("Disconnecting from Microsoft Graph")
 
-        # Close HTTP session
-        if self.session:
-            await self.session.close()
-            self.session = None
+        # Stop authenticating pooled connections
+        if self.session and not self.session.closed:
+            self.session.headers.pop("Authorization", None)
 
         # Clear authentication
         self.access_token = None
+        self.token_expires_at = None
+        self._token_refresh_retry_at = 0.0
         self.app = None
 
         # Reset connection state
@@ -666,11 +876,23 @@ class MicrosoftGraphInterface(BaseEmailInterface):
         self.user_email = None
         self.display_name = None
 
-        # Shutdown thread pool
-        self.executor.shutdown(wait=True)
-
         self.logger.info("Microsoft Graph disconnection complete")
 
+    @log_function()
+    async def close(self) -> None:
+        """Disconnect and release the HTTP connection pool and thread pool."""
+        await self.disconnect()
+
+        if self.session:
+            await self.session.close()
+            self.session = None
+            self._session_loop = None
+
+        self.executor.shutdown(wait=True)
+        self.logger.info(
+            f"Microsoft Graph interface closed: {self.get_connection_stats()}"
+        )
+
     @log_function()
     async def get_profile(self) -> dict[str, Any]:
         """
@@ -686,14 +908,14 @@ class MicrosoftGraphInterface(BaseEmailInterface):
             ConnectionError: If not connected to Microsoft Graph
             EmailSystemError: If profile retrieval fails
         """
-        if not self.session:
+        if not self.session or not self.access_token:
             raise ConnectionError("Not connected to Microsoft Graph")
 
         try:
             # Get user profile from Microsoft Graph
             url = f"{self.GRAPH_ENDPOINT}/me"
 
-            async with self.session.get(url) as response:
+            async with self._request("GET", url) as response:
                 if response.status == 200:
                     profile_data = await response.json()
 
@@ -730,82 +952,112 @@ class MicrosoftGraphInterface(BaseEmailInterface):
             self.logger.error(f"Microsoft Graph profile retrieval failed: {e}")
             raise EmailSystemError(f"Profile retrieval error: {e}") from e
 
-    async def list_emails(self, criteria: EmailSearchCriteria) -> list[Email]:
-        """List emails matching criteria."""
-        if not self.session:
-            raise ConnectionError("Not connected to Microsoft Graph")
+    def _build_message_query(
+        self, criteria: EmailSearchCriteria
+    ) -> tuple[str, dict[str, str]]:
+        """
+        Build the messages URL and query parameters for search criteria.
 
-        try:
-            # Build Microsoft Graph filter and search query
-            filters = []
-
-            if criteria.sender:
-                filters.append(f"from/emailAddress/address eq '{criteria.sender}'")
-            if criteria.subject:
-                filters.append(f"contains(subject, '{criteria.subject}')")
-            if criteria.has_attachments:
-                filters.append("hasAttachments eq true")
-            if criteria.is_unread is True:
-                filters.append("isRead eq false")
-            elif criteria.is_unread is False:
-                filters.append("isRead eq true")
-            if criteria.is_flagged:
-                filters.append("flag/flagStatus eq 'flagged'")
-            if criteria.date_after:
-                # Use proper ISO format for Microsoft Graph compatibility
-                if criteria.date_after.tzinfo is None:
-                    # Add UTC timezone if naive datetime
-                    criteria.date_after = criteria.date_after.replace(tzinfo=UTC)
-                iso_date = criteria.date_after.strftime("%Y-%m-%dT%H:%M:%S.%fZ")
-                filters.append(f"receivedDateTime ge {iso_date}")
-            if criteria.date_before:
-                # Use proper ISO format for Microsoft Graph compatibility
-                if criteria.date_before.tzinfo is None:
-                    # Add UTC timezone if naive datetime
-                    criteria.date_before = criteria.date_before.replace(tzinfo=UTC)
-                iso_date = criteria.date_before.strftime("%Y-%m-%dT%H:%M:%S.%fZ")
-                filters.append(f"receivedDateTime le {iso_date}")
-
-            # Build URL
-            url = f"{self.GRAPH_ENDPOINT}/me/messages"
-            params = {
-                "$top": str(criteria.max_results),
-                "$orderby": "receivedDateTime desc",
-            }
+        Args:
+            criteria: Search criteria for filtering emails
 
-            # Always expand attachments to include attachment data (unless explicitly excluding them)
-            if criteria.has_attachments is not False:
-                params["$expand"] = "attachments"
+        Returns:
+            Tuple of (request URL, query parameters) for the first page
+        """
+        # Build Microsoft Graph filter and search query
+        filters = []
+
+        if criteria.sender:
+            filters.append(f"from/emailAddress/address eq '{criteria.sender}'")
+        if criteria.subject:
+            filters.append(f"contains(subject, '{criteria.subject}')")
+        if criteria.has_attachments:
+            filters.append("hasAttachments eq true")
+        if criteria.is_unread is True:
+            filters.append("isRead eq false")
+        elif criteria.is_unread is False:
+            filters.append("isRead eq true")
+        if criteria.is_flagged:
+            filters.append("flag/flagStatus eq 'flagged'")
+        if criteria.date_after:
+            # Use proper ISO format for Microsoft Graph compatibility
+            if criteria.date_after.tzinfo is None:
+                # Add UTC timezone if naive datetime
+                criteria.date_after = criteria.date_after.replace(tzinfo=UTC)
+            iso_date = criteria.date_after.strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+            filters.append(f"receivedDateTime ge {iso_date}")
+        if criteria.date_before:
+            # Use proper ISO format for Microsoft Graph compatibility
+            if criteria.date_before.tzinfo is None:
+                # Add UTC timezone if naive datetime
+                criteria.date_before = criteria.date_before.replace(tzinfo=UTC)
+            iso_date = criteria.date_before.strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+            filters.append(f"receivedDateTime le {iso_date}")
+
+        # Build URL; later pages come from @odata.nextLink
+        url = f"{self.GRAPH_ENDPOINT}/me/messages"
+        params = {
+            "$top": str(min(criteria.max_results, self.MAX_PAGE_SIZE)),
+            "$orderby": "receivedDateTime desc",
+            "$select": self.MESSAGE_SELECT,
+        }
 
-            if filters:
-                # Microsoft Graph requires: properties in $orderby must also appear in $filter
-                # AND properties in $orderby must appear FIRST in $filter
+        # Expand attachment metadata unless attachments are explicitly excluded
+        if criteria.has_attachments is not False:
+            params["$expand"] = self.ATTACHMENT_METADATA_EXPAND
 
-                # Check if we already have receivedDateTime filters from date criteria
-                has_date_filter = any("receivedDateTime" in f for f in filters)
-                if not has_date_filter:
-                    # Add minimal date filter only if no date criteria specified
-                    date_filter = "receivedDateTime ge 1900-01-01T00:00:00Z"
-                    all_filters = [date_filter] + filters
-                else:
-                    # Move existing receivedDateTime filters to the front
-                    date_filters = [f for f in filters if "receivedDateTime" in f]
-                    other_filters = [f for f in filters if "receivedDateTime" not in f]
-                    all_filters = date_filters + other_filters
+        if filters:
+            # Microsoft Graph requires: properties in $orderby must also appear in $filter
+            # AND properties in $orderby must appear FIRST in $filter
+
+            # Check if we already have receivedDateTime filters from date criteria
+            has_date_filter = any("receivedDateTime" in f for f in filters)
+            if not has_date_filter:
+                # Add minimal date filter only if no date criteria specified
+                date_filter = "receivedDateTime ge 1900-01-01T00:00:00Z"
+                all_filters = [date_filter] + filters
+            else:
+                # Move existing receivedDateTime filters to the front
+                date_filters = [f for f in filters if "receivedDateTime" in f]
+                other_filters = [f for f in filters if "receivedDateTime" not in f]
+                all_filters = date_filters + other_filters
+
+            params["$filter"] = " and ".join(all_filters)
+
+        if criteria.query:
+            params["$search"] = f'"{criteria.query}"'
 
-                params["$filter"] = " and ".join(all_filters)
+        # Handle labels (folders)
+        if criteria.labels:
+            # For Microsoft Graph, we need to search in specific folders
+            # This is a simplified approach - real implementation might need folder hierarchy
+            folder_name = criteria.labels[0]  # Use first label as folder
+            url = f"{self.GRAPH_ENDPOINT}/me/mailFolders('{folder_name}')/messages"
 
-            if criteria.query:
-                params["$search"] = f'"{criteria.query}"'
+        return url, params
 
-            # Handle labels (folders)
-            if criteria.labels:
-                # For Microsoft Graph, we need to search in specific folders
-                # This is a simplified approach - real implementation might need folder hierarchy
-                folder_name = criteria.labels[0]  # Use first label as folder
-                url = f"{self.GRAPH_ENDPOINT}/me/mailFolders('{folder_name}')/messages"
+    async def _fetch_message_page(
+        self, url: str, params: dict[str, str] | None = None
+    ) -> dict[str, Any]:
+        """
+        Fetch one page of messages.
+
+        Args:
+            url: Messages URL, or an @odata.nextLink which already carries
+                its query parameters
+            params: Query parameters for the first page
+
+        Returns:
+            Raw page response with 'value' and optional '@odata.nextLink'
 
-            async with self.session.get(url, params=params) as response:
+        Raises:
+            AuthenticationError: If the access token is invalid
+            EmailSystemError: If the request fails
+        """
+        try:
+            async with self._request(
+                "GET", url, params=params, headers=self._body_headers()
+            ) as response:
                 if response.status == 401:
                     raise AuthenticationError(
                         "Microsoft Graph token expired or invalid"
@@ -815,80 +1067,677 @@ class MicrosoftGraphInterface(BaseEmailInterface):
                         f"Failed to list messages: HTTP {response.status}"
                     )
 
-                data = await response.json()
-                messages = data.get("value", [])
-
-                # Convert to Email objects
-                emails = []
-                include_attachments = (
-                    criteria.has_attachments is not False
-                )  # Include attachments unless explicitly excluded
-                for msg in messages:
+                return await response.json()
+
+        except aiohttp.ClientError as e:
+            raise EmailSystemError(
+                f"Failed to list Microsoft Graph messages: {e}"
+            ) from e
+
+    async def _execute_batch(
+        self,
+        requests: list[GraphBatchRequest],
+        semaphore: asyncio.Semaphore | None = None,
+    ) -> dict[str, GraphBatchResponse]:
+        """
+        Execute requests through the Microsoft Graph $batch endpoint.
+
+        Args:
+            requests: Sub-requests to combine into batches
+            semaphore: Bounds how many $batch calls run at once; without
+                one they run one after another
+
+        Returns:
+            Mapping of request id to its response
+
+        Raises:
+            ConnectionError: If not connected to Microsoft Graph
+            AuthenticationError: If the access token is invalid
+        """
+        if not self.session or not self.access_token:
+            raise ConnectionError("Not connected to Microsoft Graph")
+
+        await self._ensure_access_token()
+        return await GraphBatchClient(
+            self.session, self.GRAPH_ENDPOINT, semaphore, self._get_rate_limiter()
+        ).execute(requests)
+
+    def _body_headers(self) -> dict[str, str]:
+        """
+        Get request headers selecting the message body format.
+
+        Returns:
+            Prefer header for the configured body content type
+        """
+        return {"Prefer": f'outlook.body-content-type="{self.body_content_type}"'}
+
+    async def _load_attachment_contents(self, emails: list[Email]) -> None:
+        """
+        Download content for attachments not included in the message responses.
+
+        Args:
+            emails: Parsed emails whose attachments should be loaded
+        """
+        await self.load_attachments(
+            [attachment for email_obj in emails for attachment in email_obj.attachments]
+        )
+
+    async def load_attachments(self, attachments: list[EmailAttachment]) -> None:
+        """
+        Download content for attachments listed without it.
+
+        Attachments up to BATCH_ATTACHMENT_MAX_SIZE are fetched through
+        $batch requests of at most 20 attachments and roughly
+        ATTACHMENT_BATCH_MAX_BYTES of attachment data across all given
+        attachments; larger ones are downloaded individually so a single
+        batch response stays small. Up to max_concurrent_attachments $batch
+        calls and downloads run at once, within the attachment byte budget.
+        Failed downloads are logged and recorded on the attachment's
+        download_error, and the attachment is kept without content so the
+        processing pipeline can report it.
+
+        Args:
+            attachments: Attachments to load
+        """
+        pending: list[EmailAttachment] = []
+        for attachment in attachments:
+            if attachment.is_loaded:
+                self.logger.debug(
+                    f"Attachment {attachment.filename} already has content loaded"
+                )
+            elif attachment.blocked_reason:
+                self.logger.debug(
+                    f"Attachment {attachment.filename} blocked by attachment policy"
+                )
+            elif not attachment.source:
+                self.logger.warning(
+                    f"Attachment {attachment.filename} has no content and cannot be downloaded (missing message_id or attachment_id)"
+                )
+            else:
+                pending.append(attachment)
+
+        if not pending:
+            return
+
+        batched = [a for a in pending if a.size <= self.BATCH_ATTACHMENT_MAX_SIZE]
+        individual = [a for a in pending if a.size > self.BATCH_ATTACHMENT_MAX_SIZE]
+
+        semaphore = self._get_attachment_semaphore()
+        requests = [
+            GraphBatchRequest(
+                id=str(index),
+                method="GET",
+                url=f"/me/messages/{attachment.message_id}/attachments/{attachment.attachment_id}",
+            )
+            for index, attachment in enumerate(batched)
+        ]
+
+        # One $batch call per group, each reserving its attachments' bytes;
+        # groups are bounded by size too, since each response is parsed whole
+        groups: list[list[tuple[GraphBatchRequest, EmailAttachment]]] = [[]]
+        group_bytes = 0
+        for request, attachment in zip(requests, batched, strict=True):
+            current = groups[-1]
+            if current and (
+                len(current) >= GraphBatchClient.MAX_BATCH_SIZE
+                or group_bytes + attachment.size > self.ATTACHMENT_BATCH_MAX_BYTES
+            ):
+                groups.append([])
+                group_bytes = 0
+            groups[-1].append((request, attachment))
+            group_bytes += attachment.size
+        groups = [group for group in groups if group]
+
+        async def load_batched(
+            group: list[tuple[GraphBatchRequest, EmailAttachment]],
+        ) -> None:
+            group_bytes = sum(attachment.size for _, attachment in group)
+            async with self.attachment_byte_budget.reserve(group_bytes):
+                responses = await self._execute_batch(
+                    [request for request, _ in group], semaphore
+                )
+                for request, attachment in group:
+                    response = responses[request.id]
+                    error = response.error()
+                    if error is None:
+                        content_bytes = (response.body or {}).get("contentBytes")
+                        if content_bytes is None:
+                            error = EmailSystemError(
+                                "Attachment response has no content"
+                            )
+                        else:
+                            try:
+                                size = await self._store_attachment_base64(
+                                    attachment, content_bytes
+                                )
+                            except (binascii.Error, ValueError) as e:
+                                error = EmailSystemError(
+                                    f"Invalid attachment content: {e}"
+                                )
+
+                    if error is None:
+                        self.logger.info(
+                            f"Successfully downloaded {attachment.filename}: {size} bytes"
+                        )
+                    else:
+                        self.logger.error(
+                            f"Failed to download attachment {attachment.filename} from message {attachment.message_id}: {error}"
+                        )
+                        attachment.download_error = str(error)
+
+        async def load_individually(attachment: EmailAttachment) -> None:
+            # Large attachments stream straight into a spool buffer, so at
+            # most the spool threshold plus one chunk is held in memory
+            buffer = self._new_attachment_buffer(attachment)
+            in_memory = min(
+                attachment.size,
+                self.attachment_spool_threshold + self.DOWNLOAD_CHUNK_SIZE,
+            )
+            try:
+                async with (
+                    self.attachment_byte_budget.reserve(in_memory),
+                    semaphore,
+                ):
+                    self.logger.info(
+                        f"Downloading content for {attachment.filename} from message {attachment.message_id}"
+                    )
+                    await self.stream_attachment(
+                        attachment.message_id, attachment.attachment_id, buffer
+                    )
+            except Exception as e:
+                buffer.discard()
+                self.logger.error(
+                    f"Failed to download attachment {attachment.filename} from message {attachment.message_id}: {e}"
+                )
+                attachment.download_error = str(e)
+            else:
+                attachment.set_content(buffer)
+                self.logger.info(
+                    f"Successfully downloaded {attachment.filename}: {buffer.size} bytes"
+                )
+
+        # $batch calls and individual downloads share the same bound
+        await asyncio.gather(
+            *(load_batched(group) for group in groups),
+            *(load_individually(attachment) for attachment in individual),
+        )
+
+        self.logger.info(
+            f"Loaded {len(pending)} attachments "
+            f"({len(batched)} batched in {len(groups)} "
+            f"requests, {len(individual)} individually)"
+        )
+
+    async def list_emails(self, criteria: EmailSearchCriteria) -> list[Email]:
+        """List emails matching criteria."""
+        return [email_obj async for email_obj in self.stream_emails(criteria)]
+
+    @log_function()
+    async def stream_emails(
+        self, criteria: EmailSearchCriteria
+    ) -> AsyncGenerator[Email, None]:
+        """
+        Stream emails matching criteria by following @odata.nextLink.
+
+        The next page is requested in the background while the current one
+        is consumed, and each Email is yielded as soon as its attachments
+        are loaded, so only one page of messages is held at a time.
+        Streaming stops once criteria.max_results emails have been read.
+
+        Args:
+            criteria: Search criteria for filtering emails
+
+        Yields:
+            Email objects matching criteria
+
+        Raises:
+            ConnectionError: If not connected to Microsoft Graph
+            AuthenticationError: If the access token is invalid
+            EmailSystemError: If listing messages fails
+        """
+        if not self.session or not self.access_token:
+            raise ConnectionError("Not connected to Microsoft Graph")
+
+        url, params = self._build_message_query(criteria)
+        # Include attachments unless explicitly excluded
+        include_attachments = criteria.has_attachments is not False
+
+        remaining = criteria.max_results
+        page_count = 0
+        page_task: asyncio.Task | None = None
+
+        try:
+            if remaining > 0:
+                page_task = asyncio.create_task(self._fetch_message_page(url, params))
+
+            while page_task is not None:
+                data = await page_task
+                page_task = None
+                page_count += 1
+
+                messages = data.get("value", [])[:remaining]
+                remaining -= len(messages)
+                next_link = data.get("@odata.nextLink")
+
+                # Prefetch the next page while this page is consumed
+                if next_link and remaining > 0:
+                    page_task = asyncio.create_task(self._fetch_message_page(next_link))
+
+                logger.debug(
+                    "Microsoft Graph page %d: %d messages (more pages: %s)",
+                    page_count,
+                    len(messages),
+                    page_task is not None,
+                )
+
+                # Group consecutive emails until their attachments fill a
+                # $batch request, then load the group in one round trip
+                group: list[Email] = []
+                group_attachments = 0
+                for index, msg in enumerate(messages):
                     try:
-                        email_obj = self._parse_graph_message(msg, include_attachments)
-                        emails.append(email_obj)
+                        email_obj = await self._parse_graph_message(
+                            msg, include_attachments
+                        )
+                        group.append(email_obj)
+                        group_attachments += sum(
+                            1
+                            for attachment in email_obj.attachments
+                            if attachment.size <= self.BATCH_ATTACHMENT_MAX_SIZE
+                        )
                     except Exception as e:
                         logger.warning(
                             "Failed to parse message %s: %s", msg.get("id"), e
                         )
-                        continue
-
-                # Download attachment content for all emails
-                if include_attachments:
-                    for email in emails:
-                        for attachment in email.attachments:
-                            if (
-                                not attachment.content
-                                and hasattr(attachment, "_message_id")
-                                and attachment.attachment_id
-                            ):
-                                try:
-                                    self.logger.info(
-                                        f"Downloading content for {attachment.filename} from message {attachment._message_id}"
-                                    )
-                                    attachment.content = await self.download_attachment(
-                                        attachment._message_id, attachment.attachment_id
-                                    )
-                                    self.logger.info(
-                                        f"Successfully downloaded {attachment.filename}: {len(attachment.content)} bytes"
-                                    )
-                                except Exception as e:
-                                    self.logger.error(
-                                        f"Failed to download attachment {attachment.filename} from message {attachment._message_id}: {e}"
-                                    )
-                                    # Keep the attachment in the list but without content
-                                    # This allows the processing pipeline to log the missing content
-                            elif not attachment.content:
-                                self.logger.warning(
-                                    f"Attachment {attachment.filename} has no content and cannot be downloaded (missing message_id or attachment_id)"
-                                )
-                            else:
-                                self.logger.debug(
-                                    f"Attachment {attachment.filename} already has content loaded"
-                                )
 
-                return emails
+                    if group and (
+                        group_attachments >= GraphBatchClient.MAX_BATCH_SIZE
+                        or index == len(messages) - 1
+                    ):
+                        if include_attachments and criteria.include_attachment_content:
+                            await self._load_attachment_contents(group)
+                        for email_obj in group:
+                            yield email_obj
+                        group = []
+                        group_attachments = 0
+
+        finally:
+            if page_task is not None and not page_task.done():
+                page_task.cancel()
+                with contextlib.suppress(asyncio.CancelledError, Exception):
+                    await page_task
+
+    async def _fetch_delta_page(
+        self, url: str, params: dict[str, str] | None = None
+    ) -> dict[str, Any] | None:
+        """
+        Fetch one page of a messages delta round.
+
+        Args:
+            url: Delta URL, @odata.nextLink or stored @odata.deltaLink
+            params: Query parameters for a new delta round
+
+        Returns:
+            Raw page response, or None if the delta token has expired and
+            the folder needs a full resync
+
+        Raises:
+            AuthenticationError: If the access token is invalid
+            EmailSystemError: If the request fails
+        """
+        headers = {
+            "Prefer": f"odata.maxpagesize={self.DELTA_PAGE_SIZE}, "
+            f'outlook.body-content-type="{self.body_content_type}"'
+        }
+
+        try:
+            async with self._request(
+                "GET", url, params=params, headers=headers
+            ) as response:
+                if response.status == 401:
+                    raise AuthenticationError(
+                        "Microsoft Graph token expired or invalid"
+                    )
+                elif response.status == 410:
+                    return None
+                elif response.status != 200:
+                    raise EmailSystemError(
+                        f"Failed to get message delta: HTTP {response.status}"
+                    )
+
+                return await response.json()
 
         except aiohttp.ClientError as e:
             raise EmailSystemError(
-                f"Failed to list Microsoft Graph messages: {e}"
+                f"Failed to get Microsoft Graph message delta: {e}"
             ) from e
 
+    async def _start_delta_round(self, folder: str) -> str | None:
+        """
+        Obtain a deltaLink that tracks messages arriving from now on.
+
+        The initial round is filtered to messages received from the current
+        time, so it completes in a page or two regardless of folder size.
+        The round selects the same message properties as stream_emails, so
+        later delta pages can be parsed without fetching each message.
+
+        Args:
+            folder: Mail folder id or well-known name (e.g. 'inbox')
+
+        Returns:
+            The @odata.deltaLink for the folder, or None if none was returned
+        """
+        url = f"{self.GRAPH_ENDPOINT}/me/mailFolders/{folder}/messages/delta"
+        now = datetime.now(UTC).strftime("%Y-%m-%dT%H:%M:%SZ")
+        params = {
+            "$select": self.DELTA_SELECT,
+            "$filter": f"receivedDateTime ge {now}",
+        }
+
+        while url:
+            data = await self._fetch_delta_page(url, params)
+            if data is None:
+                return None
+            params = None
+            if data.get("@odata.deltaLink"):
+                return data["@odata.deltaLink"]
+            url = data.get("@odata.nextLink")
+
+        return None
+
+    def _get_seen_message_ids(self, mailbox: str, folder: str) -> list[str]:
+        """
+        Get the ids of messages already yielded by a sync of a folder.
+
+        Args:
+            mailbox: Mailbox identifier
+            folder: Mail folder id or well-known name
+
+        Returns:
+            Message ids, oldest first
+        """
+        stored = self.sync_state.get("msgraph", mailbox, f"delta_seen:{folder}")
+        if not stored:
+            return []
+        try:
+            seen = json.loads(stored)
+        except json.JSONDecodeError:
+            return []
+        if not isinstance(seen, list):
+            return []
+        return [str(message_id) for message_id in seen]
+
+    def _store_seen_message_ids(
+        self, mailbox: str, folder: str, seen: list[str]
+    ) -> None:
+        """
+        Store the ids of yielded messages, keeping the DELTA_SEEN_LIMIT newest.
+
+        Args:
+            mailbox: Mailbox identifier
+            folder: Mail folder id or well-known name
+            seen: Message ids, oldest first
+        """
+        self.sync_state.set(
+            "msgraph",
+            mailbox,
+            f"delta_seen:{folder}",
+            json.dumps(seen[-self.DELTA_SEEN_LIMIT :]),
+        )
+
+    async def _fetch_delta_messages(
+        self, message_ids: list[str]
+    ) -> dict[str, dict[str, Any]]:
+        """
+        Fetch messages listed by id only through $batch requests.
+
+        Delta rounds started before the round selected the message
+        projection return bare ids; their messages are fetched 20 per
+        round trip instead of one request each.
+
+        Args:
+            message_ids: Microsoft Graph message ids
+
+        Returns:
+            Mapping of message id to its raw message; messages that could
+            not be fetched are left out
+        """
+        query = urlencode({"$select": self.DELTA_SELECT})
+        requests = [
+            GraphBatchRequest(
+                id=str(index),
+                method="GET",
+                url=f"/me/messages/{message_id}?{query}",
+                headers=self._body_headers(),
+            )
+            for index, message_id in enumerate(message_ids)
+        ]
+        responses = await self._execute_batch(
+            requests, self._get_attachment_semaphore()
+        )
+
+        messages: dict[str, dict[str, Any]] = {}
+        for request, message_id in zip(requests, message_ids, strict=True):
+            response = responses[request.id]
+            error = response.error()
+            if isinstance(error, AuthenticationError):
+                raise error
+            if error is None and isinstance(response.body, dict):
+                messages[message_id] = response.body
+            elif not isinstance(error, EmailNotFoundError):
+                # Not found means deleted since the delta round
+                logger.warning("Failed to get email %s: %s", message_id, error)
+        return messages
+
+    async def _fetch_attachment_metadata(self, messages: list[dict[str, Any]]) -> None:
+        """
+        Add attachment metadata to messages returned by a delta query.
+
+        Attachment lists are fetched through $batch requests, 20 messages
+        per round trip, and stored under each message's 'attachments' key
+        as an expanded message listing would have them. Only messages with
+        hasAttachments set are fetched.
+
+        Args:
+            messages: Raw delta messages, updated in place
+        """
+        pending = [msg for msg in messages if msg.get("hasAttachments")]
+        if not pending:
+            return
+
+        query = urlencode({"$select": self.ATTACHMENT_METADATA_SELECT})
+        requests = [
+            GraphBatchRequest(
+                id=str(index),
+                method="GET",
+                url=f"/me/messages/{msg['id']}/attachments?{query}",
+            )
+            for index, msg in enumerate(pending)
+        ]
+        responses = await self._execute_batch(
+            requests, self._get_attachment_semaphore()
+        )
+
+        for request, msg in zip(requests, pending, strict=True):
+            response = responses[request.id]
+            error = response.error()
+            if isinstance(error, AuthenticationError):
+                raise error
+            if error is None and isinstance(response.body, dict):
+                msg["attachments"] = response.body.get("value", [])
+            else:
+                logger.warning(
+                    "Failed to list attachments of email %s: %s", msg["id"], error
+                )
+
+    @log_function()
+    async def stream_new_emails(
+        self, criteria: EmailSearchCriteria
+    ) -> AsyncGenerator[Email, None]:
+        """
+        Stream new or changed emails in a folder using a delta query.
+
+        The @odata.deltaLink of the last completed round is stored per
+        mailbox and folder in the sync state file. Without a checkpoint, or
+        when Graph reports it as expired (HTTP 410), a new delta round is
+        started from the current time and a full sync is done through
+        stream_emails. Once criteria.max_results emails have been yielded,
+        the sync stops at the next page boundary and stores that page's
+        @odata.nextLink so the next poll resumes where this one stopped.
+
+        Delta pages carry the selected message properties, so messages are
+        parsed without fetching each one; attachment metadata, which delta
+        cannot expand, is listed through $batch requests. Delta also
+        reports changes to existing messages (e.g. a read flag flip);
+        ids of yielded messages are remembered per folder and skipped when
+        they show up again.
+
+        Args:
+            criteria: Search criteria; labels[0] selects the folder
+                (defaults to the inbox)
+
+        Yields:
+            Email objects added or changed since the previous sync
+
+        Raises:
+            ConnectionError: If not connected to Microsoft Graph
+            AuthenticationError: If the access token is invalid
+            EmailSystemError: If the delta query fails
+        """
+        if not self.session or not self.access_token:
+            raise ConnectionError("Not connected to Microsoft Graph")
+
+        folder = criteria.labels[0] if criteria.labels else "inbox"
+        mailbox = self.user_email or "me"
+        checkpoint_key = f"delta_link:{folder}"
+        url = self.sync_state.get("msgraph", mailbox, checkpoint_key)
+
+        data = None
+        if url:
+            data = await self._fetch_delta_page(url)
+            if data is None:
+                self.logger.warning(
+                    f"Microsoft Graph delta token for {mailbox}/{folder} has "
+                    f"expired - falling back to full sync"
+                )
+                self.sync_state.clear("msgraph", mailbox, checkpoint_key)
+
+        seen = self._get_seen_message_ids(mailbox, folder)
+
+        if data is None:
+            # Start tracking before listing so nothing arriving during the
+            # full sync is missed by the next incremental run
+            delta_link = await self._start_delta_round(folder)
+            async for email_obj in self.stream_emails(criteria):
+                seen.append(email_obj.id)
+                yield email_obj
+            self._store_seen_message_ids(mailbox, folder, seen)
+            if delta_link:
+                self.sync_state.set("msgraph", mailbox, checkpoint_key, delta_link)
+            return
+
+        # Include attachments unless explicitly excluded
+        include_attachments = criteria.has_attachments is not False
+        seen_ids = set(seen)
+        yielded = 0
+
+        while True:
+            changed = [
+                msg
+                for msg in data.get("value", [])
+                if "@removed" not in msg and msg.get("id") not in seen_ids
+            ]
+
+            # Rounds started with an id-only projection list bare ids
+            id_only = [msg["id"] for msg in changed if "receivedDateTime" not in msg]
+            if id_only:
+                fetched = await self._fetch_delta_messages(id_only)
+                changed = [
+                    msg if "receivedDateTime" in msg else fetched.get(msg["id"])
+                    for msg in changed
+                ]
+            changed = [msg for msg in changed if msg is not None]
+
+            if include_attachments:
+                await self._fetch_attachment_metadata(changed)
+
+            page_emails: list[Email] = []
+            for msg in changed:
+                try:
+                    email_obj = await self._parse_graph_message(
+                        msg, include_attachments
+                    )
+                except Exception as e:
+                    logger.warning("Failed to parse message %s: %s", msg.get("id"), e)
+                    continue
+
+                page_emails.append(email_obj)
+
+            # Load the whole page's attachments through $batch requests
+            if include_attachments and criteria.include_attachment_content:
+                await self._load_attachment_contents(page_emails)
+
+            for email_obj in page_emails:
+                yielded += 1
+                seen.append(email_obj.id)
+                seen_ids.add(email_obj.id)
+                yield email_obj
+
+            next_link = data.get("@odata.nextLink")
+            if not next_link:
+                checkpoint = data.get("@odata.deltaLink")
+                break
+
+            if yielded >= criteria.max_results:
+                # Resume the round from the next page on the following poll
+                checkpoint = next_link
+                break
+
+            data = await self._fetch_delta_page(next_link)
+            if data is None:
+                self.sync_state.clear("msgraph", mailbox, checkpoint_key)
+                checkpoint = None
+                break
+
+        self.logger.info(
+            f"Microsoft Graph delta sync for {mailbox}/{folder}: "
+            f"{yielded} new messages"
+        )
+        self._store_seen_message_ids(mailbox, folder, seen)
+        if checkpoint:
+            self.sync_state.set("msgraph", mailbox, checkpoint_key, checkpoint)
+
     async def get_email(
-        self, email_id: str, include_attachments: bool = False
+        self,
+        email_id: str,
+        include_attachments: bool = False,
+        load_attachment_content: bool = True,
     ) -> Email:
-        """Get a specific email by ID."""
-        if not self.session:
+        """
+        Get a specific email by ID.
+
+        Args:
+            email_id: Microsoft Graph message id
+            include_attachments: Whether to include attachments
+            load_attachment_content: Whether to download the attachment
+                content after listing attachment metadata
+
+        Returns:
+            Parsed Email
+        """
+        if not self.session or not self.access_token:
             raise ConnectionError("Not connected to Microsoft Graph")
 
         try:
-            # Get message with attachments if requested
-            expand = "$expand=attachments" if include_attachments else ""
+            # Get message with attachment metadata if requested
             url = f"{self.GRAPH_ENDPOINT}/me/messages/{email_id}"
-            if expand:
-                url += f"?{expand}"
+            params = {"$select": self.MESSAGE_SELECT}
+            if include_attachments:
+                params["$expand"] = self.ATTACHMENT_METADATA_EXPAND
 
-            async with self.session.get(url) as response:
+            async with self._request(
+                "GET", url, params=params, headers=self._body_headers()
+            ) as response:
                 if response.status == 401:
                     raise AuthenticationError(
                         "Microsoft Graph token expired or invalid"
@@ -901,14 +1750,18 @@ class MicrosoftGraphInterface(BaseEmailInterface):
                     )
 
                 data = await response.json()
-                return self._parse_graph_message(data, include_attachments)
+                email_obj = await self._parse_graph_message(data, include_attachments)
+
+            if include_attachments and load_attachment_content:
+                await self.load_attachments(email_obj.attachments)
+            return email_obj
 
         except aiohttp.ClientError as e:
             raise EmailSystemError(f"Failed to get Microsoft Graph message: {e}") from e
 
     async def send_email(self, request: EmailSendRequest) -> str:
         """Send an email via Microsoft Graph."""
-        if not self.session:
+        if not self.session or not self.access_token:
             raise ConnectionError("Not connected to Microsoft Graph")
 
         try:
@@ -984,7 +1837,7 @@ class MicrosoftGraphInterface(BaseEmailInterface):
                             }
                         )
 
-            async with self.session.post(url, json=payload) as response:
+            async with self._request("POST", url, json=payload) as response:
                 if response.status == 401:
                     raise AuthenticationError(
                         "Microsoft Graph token expired or invalid"
@@ -1014,13 +1867,13 @@ class MicrosoftGraphInterface(BaseEmailInterface):
 
     async def delete_email(self, email_id: str) -> bool:
         """Delete an email."""
-        if not self.session:
+        if not self.session or not self.access_token:
             raise ConnectionError("Not connected to Microsoft Graph")
 
         try:
             url = f"{self.GRAPH_ENDPOINT}/me/messages/{email_id}"
 
-            async with self.session.delete(url) as response:
+            async with self._request("DELETE", url) as response:
                 if response.status == 401:
                     raise AuthenticationError(
                         "Microsoft Graph token expired or invalid"
@@ -1041,13 +1894,13 @@ class MicrosoftGraphInterface(BaseEmailInterface):
 
     async def get_labels(self) -> list[str]:
         """Get available folders (labels)."""
-        if not self.session:
+        if not self.session or not self.access_token:
             raise ConnectionError("Not connected to Microsoft Graph")
 
         try:
             url = f"{self.GRAPH_ENDPOINT}/me/mailFolders"
 
-            async with self.session.get(url) as response:
+            async with self._request("GET", url) as response:
                 if response.status == 401:
                     raise AuthenticationError(
                         "Microsoft Graph token expired or invalid"
@@ -1066,7 +1919,7 @@ class MicrosoftGraphInterface(BaseEmailInterface):
 
     async def add_label(self, email_id: str, label: str) -> bool:
         """Move email to folder (Microsoft Graph doesn't have labels like Gmail)."""
-        if not self.session:
+        if not self.session or not self.access_token:
             raise ConnectionError("Not connected to Microsoft Graph")
 
         try:
@@ -1081,7 +1934,7 @@ class MicrosoftGraphInterface(BaseEmailInterface):
             url = f"{self.GRAPH_ENDPOINT}/me/messages/{email_id}/move"
             payload = {"destinationId": folder_id}
 
-            async with self.session.post(url, json=payload) as response:
+            async with self._request("POST", url, json=payload) as response:
                 if response.status == 401:
                     raise AuthenticationError(
                         "Microsoft Graph token expired or invalid"
@@ -1105,37 +1958,231 @@ class MicrosoftGraphInterface(BaseEmailInterface):
         # For simplicity, we move back to inbox when removing a "label"
         return await self.add_label(email_id, "Inbox")
 
+    @log_function()
+    async def batch_update_messages(
+        self,
+        email_ids: list[str],
+        update_data: dict[str, Any] | None = None,
+        move_to_folder: str | None = None,
+    ) -> dict[str, EmailSystemError | None]:
+        """
+        Update and/or move many messages through $batch requests.
+
+        Post-processing mutations such as marking a page of messages read
+        and filing them into a folder are sent 20 per round trip. When both
+        are requested, each move depends on the message's update, because
+        moving a message gives it a new id.
+
+        Args:
+            email_ids: Messages to update
+            update_data: Message properties to PATCH (e.g. {"isRead": True})
+            move_to_folder: Display name of the folder to move messages to
+
+        Returns:
+            Mapping of email id to None on success or the error that
+            occurred for that message
+
+        Raises:
+            ConnectionError: If not connected to Microsoft Graph
+            AuthenticationError: If the access token is invalid
+            EmailSystemError: If the destination folder does not exist
+        """
+        if not self.session or not self.access_token:
+            raise ConnectionError("Not connected to Microsoft Graph")
+
+        folder_id = None
+        if move_to_folder:
+            folder_id = (await self._get_folders_dict()).get(move_to_folder)
+            if not folder_id:
+                raise EmailSystemError(f"Folder '{move_to_folder}' not found")
+
+        requests: list[GraphBatchRequest] = []
+        request_ids: dict[str, list[str]] = {}
+        for index, email_id in enumerate(email_ids):
+            ids = request_ids.setdefault(email_id, [])
+            if update_data:
+                requests.append(
+                    GraphBatchRequest(
+                        id=f"update-{index}",
+                        method="PATCH",
+                        url=f"/me/messages/{email_id}",
+                        body=update_data,
+                    )
+                )
+                ids.append(requests[-1].id)
+            if folder_id:
+                requests.append(
+                    GraphBatchRequest(
+                        id=f"move-{index}",
+                        method="POST",
+                        url=f"/me/messages/{email_id}/move",
+                        body={"destinationId": folder_id},
+                        depends_on=list(ids),
+                    )
+                )
+                ids.append(requests[-1].id)
+
+        responses = await self._execute_batch(requests) if requests else {}
+
+        results: dict[str, EmailSystemError | None] = {}
+        for email_id, ids in request_ids.items():
+            # The first failure explains any dependent request failing (424)
+            results[email_id] = next(
+                (
+                    error
+                    for error in (responses[request_id].error() for request_id in ids)
+                    if error is not None
+                ),
+                None,
+            )
+
+        failed = sum(1 for error in results.values() if error is not None)
+        self.logger.info(
+            f"Batch updated {len(results) - failed}/{len(results)} messages "
+            f"in {-(-len(requests) // GraphBatchClient.MAX_BATCH_SIZE)} requests"
+        )
+        return results
+
     async def download_attachment(self, email_id: str, attachment_id: str) -> bytes:
         """Download attachment content from Microsoft Graph."""
-        if not self.session:
+        buffer = SpooledAttachmentBuffer(threshold=sys.maxsize)
+        await self.stream_attachment(email_id, attachment_id, buffer)
+        return buffer.getvalue()
+
+    async def stream_attachment(
+        self,
+        email_id: str,
+        attachment_id: str,
+        buffer: SpooledAttachmentBuffer,
+    ) -> str:
+        """
+        Stream attachment content into a buffer in DOWNLOAD_CHUNK_SIZE chunks.
+
+        Memory use is bounded by the chunk size once the buffer spools to
+        disk. If the connection drops mid-body, the download resumes from
+        the bytes already written with an HTTP Range request, up to
+        DOWNLOAD_RESUME_ATTEMPTS times; a server that ignores the range
+        restarts the download from scratch.
+
+        Args:
+            email_id: Graph message id
+            attachment_id: Graph attachment id
+            buffer: Empty buffer receiving the content; closed on success
+
+        Returns:
+            Hex SHA-256 of the downloaded content
+
+        Raises:
+            ConnectionError: If not connected
+            AuthenticationError: If the token was rejected
+            EmailNotFoundError: If the attachment does not exist
+            EmailSystemError: If the download fails
+        """
+        if not self.session or not self.access_token:
             raise ConnectionError("Not connected to Microsoft Graph")
 
-        try:
-            url = f"{self.GRAPH_ENDPOINT}/me/messages/{email_id}/attachments/{attachment_id}/$value"
+        url = f"{self.GRAPH_ENDPOINT}/me/messages/{email_id}/attachments/{attachment_id}/$value"
+        # Bound idle reads rather than the whole transfer of a large body
+        timeout = aiohttp.ClientTimeout(total=None, sock_read=self.REQUEST_TIMEOUT)
 
-            async with self.session.get(url) as response:
-                if response.status == 401:
-                    raise AuthenticationError(
-                        "Microsoft Graph token expired or invalid"
-                    )
-                elif response.status == 404:
-                    raise EmailNotFoundError(
-                        f"Attachment {attachment_id} not found in email {email_id}"
-                    )
-                elif response.status != 200:
+        for attempt in range(self.DOWNLOAD_RESUME_ATTEMPTS + 1):
+            offset = buffer.size
+            headers = {"Range": f"bytes={offset}-"} if offset else {}
+            try:
+                async with self._request(
+                    "GET", url, headers=headers, timeout=timeout
+                ) as response:
+                    if response.status == 401:
+                        raise AuthenticationError(
+                            "Microsoft Graph token expired or invalid"
+                        )
+                    elif response.status == 404:
+                        raise EmailNotFoundError(
+                            f"Attachment {attachment_id} not found in email {email_id}"
+                        )
+                    elif response.status not in (200, 206):
+                        raise EmailSystemError(
+                            f"Failed to download attachment: HTTP {response.status}"
+                        )
+
+                    content_range = response.headers.get("Content-Range", "")
+                    if offset and not (
+                        response.status == 206
+                        and content_range.startswith(f"bytes {offset}-")
+                    ):
+                        self.logger.warning(
+                            f"Range request for attachment {attachment_id} not honored; restarting download"
+                        )
+                        buffer.discard()
+
+                    async for chunk in response.content.iter_chunked(
+                        self.DOWNLOAD_CHUNK_SIZE
+                    ):
+                        buffer.write(chunk)
+
+                buffer.close()
+                return buffer.sha256
+
+            except (
+                aiohttp.ClientPayloadError,
+                aiohttp.ClientConnectionError,
+                TimeoutError,
+            ) as e:
+                if attempt == self.DOWNLOAD_RESUME_ATTEMPTS:
                     raise EmailSystemError(
-                        f"Failed to download attachment: HTTP {response.status}"
-                    )
+                        f"Failed to download Microsoft Graph attachment after {attempt + 1} attempts: {e}"
+                    ) from e
+                self.logger.warning(
+                    f"Download of attachment {attachment_id} interrupted after "
+                    f"{buffer.size} bytes ({e}); resuming"
+                )
 
-                content = await response.read()
-                return content
-
-        except aiohttp.ClientError as e:
-            raise EmailSystemError(
-                f"Failed to download Microsoft Graph attachment: {e}"
-            ) from e
+            except aiohttp.ClientError as e:
+                raise EmailSystemError(
+                    f"Failed to download Microsoft Graph attachment: {e}"
+                ) from e
 
     # Helper methods
+    def _get_rate_limiter(self) -> ApiRateLimiter:
+        """
+        Get the shared Microsoft Graph rate limiter for this mailbox.
+
+        Returns:
+            Process-wide ApiRateLimiter
+        """
+        return get_rate_limiter(
+            "msgraph",
+            self.user_email or "me",
+            "graph",
+            requests_per_second=self.RATE_LIMIT_PER_SECOND,
+            max_concurrency=self.MAX_CONCURRENT_REQUESTS,
+            retry_attempts=self.RETRY_ATTEMPTS,
+        )
+
+    def _request(
+        self, method: str, url: str, **kwargs: Any
+    ) -> contextlib.AbstractAsyncContextManager[aiohttp.ClientResponse]:
+        """
+        Send a Graph request under the shared rate limiter.
+
+        Requests throttled with HTTP 429/503 are retried up to
+        RETRY_ATTEMPTS times, honoring Retry-After.
+
+        Args:
+            method: HTTP method
+            url: Request URL
+            **kwargs: Additional aiohttp request arguments
+
+        Returns:
+            Async context manager yielding the final response
+        """
+
+        async def send() -> aiohttp.ClientResponse:
+            await self._ensure_access_token()
+            return await self.session.request(method, url, **kwargs)
+
+        return self._get_rate_limiter().request(send)
+
     async def _run_in_executor(self, func: Callable, *args: Any, **kwargs: Any) -> Any:
         """Run blocking function in thread executor."""
         loop = asyncio.get_event_loop()
@@ -1143,13 +2190,13 @@ class MicrosoftGraphInterface(BaseEmailInterface):
 
     async def _update_message(self, email_id: str, update_data: dict[str, Any]) -> bool:
         """Update message properties."""
-        if not self.session:
+        if not self.session or not self.access_token:
             raise ConnectionError("Not connected to Microsoft Graph")
 
         try:
             url = f"{self.GRAPH_ENDPOINT}/me/messages/{email_id}"
 
-            async with self.session.patch(url, json=update_data) as response:
+            async with self._request("PATCH", url, json=update_data) as response:
                 if response.status == 401:
                     raise AuthenticationError(
                         "Microsoft Graph token expired or invalid"
@@ -1170,13 +2217,13 @@ class MicrosoftGraphInterface(BaseEmailInterface):
 
     async def _get_folders_dict(self) -> dict[str, str]:
         """Get folder name to ID mapping."""
-        if not self.session:
+        if not self.session or not self.access_token:
             raise ConnectionError("Not connected to Microsoft Graph")
 
         try:
             url = f"{self.GRAPH_ENDPOINT}/me/mailFolders"
 
-            async with self.session.get(url) as response:
+            async with self._request("GET", url) as response:
                 if response.status != 200:
                     return {}
 
@@ -1187,7 +2234,7 @@ class MicrosoftGraphInterface(BaseEmailInterface):
         except aiohttp.ClientError:
             return {}
 
-    def _parse_graph_message(
+    async def _parse_graph_message(
         self, message: dict[str, Any], include_attachments: bool = False
     ) -> Email:
         """Parse Microsoft Graph message into Email object."""
@@ -1250,18 +2297,23 @@ class MicrosoftGraphInterface(BaseEmailInterface):
                     content_type=att.get("contentType", ""),
                     size=att.get("size", 0),
                     attachment_id=att.get("id"),
+                    # Message ID for later content download
+                    message_id=message.get("id"),
+                    provider="msgraph",
                 )
 
-                # Store message ID for later content download
-                attachment._message_id = message.get("id")
-
                 # If content is included in response (rare)
                 if att.get("contentBytes"):
                     with contextlib.suppress(ValueError, TypeError, binascii.Error):
-                        attachment.content = base64.b64decode(att["contentBytes"])
+                        await self._store_attachment_base64(
+                            attachment, att["contentBytes"]
+                        )
 
                 attachments.append(attachment)
 
+            # Gate downloads on metadata before any content is fetched
+            self._apply_attachment_filter(attachments)
+
         # Parse importance
         importance = EmailImportance.NORMAL
         graph_importance = message.get("importance", "normal").lower()
@@ -0,0 +1,388 @@
+"""
+Microsoft Graph JSON Batching Client
+
+Combines multiple Microsoft Graph API calls into JSON ``$batch`` requests
+so that attachment downloads and mailbox updates for a page of messages
+take a few HTTP round trips instead of one per call.
+
+Features:
+    - Up to 20 sub-requests per ``$batch`` call (the Graph limit)
+    - ``dependsOn`` ordering, with dependent requests kept in one batch
+    - Per-response status handling mapped to email interface exceptions
+    - Throttled sub-requests resent with their dependents after a backoff
+
+Reference:
+    https://learn.microsoft.com/graph/json-batching
+"""
+
+# # Standard library imports
+import asyncio
+import contextlib
+import dataclasses
+import os
+
+# Logging system
+import sys
+from dataclasses import dataclass, field
+from typing import Any
+
+# # Third-party imports
+import aiohttp
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+# # Local application imports
+from utils.logging_system import get_logger  # noqa: E402
+
+from .base import (  # noqa: E402
+    AuthenticationError,
+    EmailNotFoundError,
+    EmailSystemError,
+)
+from .rate_limiter import (  # noqa: E402
+    THROTTLE_STATUSES,
+    ApiRateLimiter,
+    parse_retry_after,
+)
+
+# Initialize logger
+logger = get_logger(__name__)
+
+
+@dataclass
+class GraphBatchRequest:
+    """A single sub-request of a Microsoft Graph JSON batch."""
+
+    id: str
+    method: str
+    url: str  # Relative to the API version root, e.g. "/me/messages/{id}"
+    body: dict[str, Any] | None = None
+    headers: dict[str, str] = field(default_factory=dict)
+    depends_on: list[str] = field(default_factory=list)
+
+    def to_payload(self) -> dict[str, Any]:
+        """
+        Convert the request to its JSON batch representation.
+
+        Returns:
+            Dictionary for the 'requests' array of a $batch call
+        """
+        payload: dict[str, Any] = {
+            "id": self.id,
+            "method": self.method,
+            "url": self.url,
+        }
+        headers = dict(self.headers)
+        if self.body is not None:
+            payload["body"] = self.body
+            headers.setdefault("Content-Type", "application/json")
+        if headers:
+            payload["headers"] = headers
+        if self.depends_on:
+            payload["dependsOn"] = self.depends_on
+        return payload
+
+
+@dataclass
+class GraphBatchResponse:
+    """Response to a single sub-request of a Microsoft Graph JSON batch."""
+
+    id: str
+    status: int
+    headers: dict[str, str] = field(default_factory=dict)
+    body: Any = None
+
+    @property
+    def ok(self) -> bool:
+        """Whether the sub-request succeeded."""
+        return 200 <= self.status < 300
+
+    def error(self) -> EmailSystemError | None:
+        """
+        Map a failed sub-response to an email interface exception.
+
+        Returns:
+            AuthenticationError (401), EmailNotFoundError (404) or
+            EmailSystemError for other failures; None if it succeeded
+        """
+        if self.ok:
+            return None
+
+        message = f"HTTP {self.status}"
+        if isinstance(self.body, dict):
+            message = self.body.get("error", {}).get("message", message)
+
+        if self.status == 401:
+            return AuthenticationError("Microsoft Graph token expired or invalid")
+        if self.status == 404:
+            return EmailNotFoundError(f"Batch request {self.id} not found: {message}")
+        return EmailSystemError(
+            f"Batch request {self.id} failed: {message}",
+            {"status": self.status},
+        )
+
+
+class GraphBatchClient:
+    """
+    Client for the Microsoft Graph ``$batch`` endpoint.
+
+    Splits any number of sub-requests into batches of at most
+    MAX_BATCH_SIZE, keeping requests linked through ``dependsOn`` in the
+    same batch as Graph requires.
+    """
+
+    MAX_BATCH_SIZE = 20
+
+    def __init__(
+        self,
+        session: aiohttp.ClientSession,
+        graph_endpoint: str,
+        semaphore: asyncio.Semaphore | None = None,
+        rate_limiter: ApiRateLimiter | None = None,
+    ) -> None:
+        """
+        Initialize the batch client.
+
+        Args:
+            session: Authenticated aiohttp session for Graph calls
+            graph_endpoint: Graph API version root, e.g. https://graph.microsoft.com/v1.0
+            semaphore: Bounds how many $batch calls run at once; without one
+                the calls run one after another
+            rate_limiter: Limiter for the mailbox; enables retrying
+                throttled batches and sub-requests
+        """
+        self.session = session
+        self.batch_url = f"{graph_endpoint}/$batch"
+        self.semaphore = semaphore
+        self.rate_limiter = rate_limiter
+
+    def _plan_batches(
+        self, requests: list[GraphBatchRequest]
+    ) -> list[list[GraphBatchRequest]]:
+        """
+        Group sub-requests into batches that respect dependsOn links.
+
+        Requests connected through dependsOn form one group, and groups are
+        packed into batches in request order.
+
+        Args:
+            requests: Sub-requests to plan
+
+        Returns:
+            List of batches, each with at most MAX_BATCH_SIZE requests
+
+        Raises:
+            ValueError: If ids are duplicated, a dependency is unknown, or a
+                dependency group exceeds MAX_BATCH_SIZE
+        """
+        by_id = {request.id: request for request in requests}
+        if len(by_id) != len(requests):
+            raise ValueError("Batch request ids must be unique")
+
+        # Union-find over dependsOn links
+        parent = {request.id: request.id for request in requests}
+
+        def find(request_id: str) -> str:
+            while parent[request_id] != request_id:
+                parent[request_id] = parent[parent[request_id]]
+                request_id = parent[request_id]
+            return request_id
+
+        for request in requests:
+            for dependency in request.depends_on:
+                if dependency not in by_id:
+                    raise ValueError(
+                        f"Batch request {request.id} depends on unknown request {dependency}"
+                    )
+                parent[find(request.id)] = find(dependency)
+
+        groups: dict[str, list[GraphBatchRequest]] = {}
+        for request in requests:
+            groups.setdefault(find(request.id), []).append(request)
+
+        batches: list[list[GraphBatchRequest]] = [[]]
+        for group in groups.values():
+            if len(group) > self.MAX_BATCH_SIZE:
+                raise ValueError(
+                    f"Dependent batch requests exceed {self.MAX_BATCH_SIZE}: "
+                    f"{[request.id for request in group]}"
+                )
+            if len(batches[-1]) + len(group) > self.MAX_BATCH_SIZE:
+                batches.append([])
+            batches[-1].extend(group)
+
+        return [batch for batch in batches if batch]
+
+    async def execute(
+        self, requests: list[GraphBatchRequest]
+    ) -> dict[str, GraphBatchResponse]:
+        """
+        Execute sub-requests through the $batch endpoint.
+
+        A failed $batch call is reported as a failed response for each of
+        its sub-requests rather than raised, so callers handle every
+        outcome per item.
+
+        Args:
+            requests: Sub-requests to execute
+
+        Returns:
+            Mapping of request id to its response
+
+        Raises:
+            AuthenticationError: If the access token is invalid
+            ValueError: If the requests cannot be batched
+        """
+        batches = self._plan_batches(requests)
+        responses: dict[str, GraphBatchResponse] = {}
+
+        if self.semaphore is None:
+            for batch in batches:
+                responses.update(await self._execute_batch(batch))
+        else:
+            for batch_responses in await asyncio.gather(
+                *(self._execute_batch(batch) for batch in batches)
+            ):
+                responses.update(batch_responses)
+
+        return responses
+
+    async def _execute_batch(
+        self, batch: list[GraphBatchRequest]
+    ) -> dict[str, GraphBatchResponse]:
+        """
+        Execute one planned batch, resending throttled sub-requests.
+
+        Sub-requests answered with 429/503, and dependents that failed
+        because of them (424), are resent together after a backoff.
+
+        Args:
+            batch: At most MAX_BATCH_SIZE sub-requests
+
+        Returns:
+            Mapping of request id to its response
+
+        Raises:
+            AuthenticationError: If the access token is invalid
+        """
+        responses: dict[str, GraphBatchResponse] = {}
+        pending = batch
+        attempts = self.rate_limiter.retry_attempts if self.rate_limiter else 0
+
+        for attempt in range(attempts + 1):
+            batch_responses, answered = await self._send_batch(pending)
+            responses.update(batch_responses)
+            if not answered:
+                # The $batch call itself failed and was already retried
+                break
+
+            retry_ids = {
+                request.id
+                for request in pending
+                if responses[request.id].status in THROTTLE_STATUSES
+            }
+            if not retry_ids or attempt == attempts:
+                break
+
+            retry_after = max(
+                (
+                    parse_retry_after(responses[request_id].headers.get("Retry-After"))
+                    or 0.0
+                    for request_id in retry_ids
+                ),
+                default=0.0,
+            )
+            # Dependencies always precede their dependents in a batch
+            for request in pending:
+                if responses[request.id].status == 424 and retry_ids.intersection(
+                    request.depends_on
+                ):
+                    retry_ids.add(request.id)
+
+            pending = [
+                dataclasses.replace(
+                    request,
+                    depends_on=[d for d in request.depends_on if d in retry_ids],
+                )
+                for request in pending
+                if request.id in retry_ids
+            ]
+            await asyncio.sleep(
+                self.rate_limiter.record_throttle(attempt, retry_after or None)
+            )
+
+        return responses
+
+    async def _send_batch(
+        self, batch: list[GraphBatchRequest]
+    ) -> tuple[dict[str, GraphBatchResponse], bool]:
+        """
+        Send a single $batch call.
+
+        Args:
+            batch: At most MAX_BATCH_SIZE sub-requests
+
+        Returns:
+            Tuple of (mapping of request id to its response, whether Graph
+            answered the batch rather than failing the whole call)
+
+        Raises:
+            AuthenticationError: If the access token is invalid
+        """
+        payload = {"requests": [request.to_payload() for request in batch]}
+        responses: dict[str, GraphBatchResponse] = {}
+
+        def send() -> Any:
+            return self.session.post(self.batch_url, json=payload)
+
+        request_context = (
+            send()
+            if self.rate_limiter is None
+            else self.rate_limiter.request(send, cost=len(batch))
+        )
+
+        try:
+            async with (
+                self.semaphore or contextlib.nullcontext(),
+                request_context as response,
+            ):
+                if response.status == 401:
+                    raise AuthenticationError(
+                        "Microsoft Graph token expired or invalid"
+                    )
+                if response.status != 200:
+                    return {
+                        request.id: GraphBatchResponse(
+                            id=request.id, status=response.status
+                        )
+                        for request in batch
+                    }, False
+
+                data = await response.json()
+
+        except aiohttp.ClientError as e:
+            logger.error(f"Microsoft Graph $batch call failed: {e}")
+            return {
+                request.id: GraphBatchResponse(
+                    id=request.id,
+                    status=503,
+                    body={"error": {"message": str(e)}},
+                )
+                for request in batch
+            }, False
+
+        for item in data.get("responses", []):
+            responses[item["id"]] = GraphBatchResponse(
+                id=item["id"],
+                status=int(item.get("status", 500)),
+                headers=item.get("headers", {}),
+                body=item.get("body"),
+            )
+
+        # Graph should answer every sub-request; guard against gaps
+        for request in batch:
+            responses.setdefault(
+                request.id, GraphBatchResponse(id=request.id, status=500)
+            )
+
+        return responses, True
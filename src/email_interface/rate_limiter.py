@@ -0,0 +1,582 @@
+"""
+Provider Rate Limiting for Email Interfaces
+
+Shared throttling layer for Gmail and Microsoft Graph API calls. Each
+(provider, mailbox, API) combination gets one ApiRateLimiter, shared by
+every interface instance and event loop in the process, combining:
+
+    - A token bucket bounding the request rate
+    - An AIMD controller bounding concurrent requests: the limit grows by
+      one request per window of successes and is halved on a throttle
+    - Retry-After aware, jittered exponential backoff for throttled calls
+
+A throttle response pauses the whole bucket until its Retry-After has
+passed, so concurrent callers back off together instead of each
+hammering the provider with its own retries.
+
+ByteBudget bounds work by size rather than count: attachment downloads
+and saves reserve the sizes providers report, so many small files can
+run at once while a few large ones wait for room.
+
+The limiter only uses thread locks and plain sleeps, so it is not tied
+to one event loop: the web app's shared loop and any loop a script or
+test starts can use the same limiter.
+"""
+
+# # Standard library imports
+import asyncio
+import contextlib
+import email.utils
+import os
+import random
+
+# Logging system
+import sys
+import threading
+import time
+from collections import deque
+from collections.abc import AsyncIterator, Awaitable, Callable
+from datetime import UTC, datetime
+from typing import Any
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+# # Local application imports
+from utils.logging_system import get_logger  # noqa: E402
+
+# Initialize logger
+logger = get_logger(__name__)
+
+# HTTP statuses that signal throttling or transient overload
+THROTTLE_STATUSES = frozenset({429, 503})
+
+DEFAULT_BYTE_BUDGET = 256 * 1024 * 1024  # In-flight attachment bytes
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """
+    Parse a Retry-After header value.
+
+    Args:
+        value: Header value, either delay seconds or an HTTP date
+
+    Returns:
+        Delay in seconds, or None if the value is missing or invalid
+    """
+    if not value:
+        return None
+
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    try:
+        retry_at = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=UTC)
+    return max(0.0, (retry_at - datetime.now(UTC)).total_seconds())
+
+
+class TokenBucket:
+    """Thread-safe token bucket that can be paused for a Retry-After period."""
+
+    def __init__(self, rate: float, capacity: float | None = None) -> None:
+        """
+        Initialize the bucket.
+
+        Args:
+            rate: Tokens added per second
+            capacity: Maximum stored tokens (defaults to one second of rate)
+        """
+        self.rate = rate
+        self.capacity = capacity or rate
+        self._tokens = self.capacity
+        self._updated_at = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def _reserve(self, tokens: float) -> float:
+        """
+        Take tokens, going into debt if there are not enough.
+
+        Args:
+            tokens: Tokens to take
+
+        Returns:
+            Seconds the caller must wait before its request may be sent
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.capacity, self._tokens + (now - self._updated_at) * self.rate
+            )
+            self._updated_at = now
+            self._tokens -= tokens
+
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+            return max(wait, self._paused_until - now)
+
+    async def acquire(self, tokens: float = 1.0) -> None:
+        """
+        Wait until the requested tokens are available.
+
+        Args:
+            tokens: Tokens to take; capped at the bucket capacity
+        """
+        wait = self._reserve(min(tokens, self.capacity))
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def pause(self, seconds: float) -> None:
+        """
+        Stop handing out tokens for a period, e.g. after a throttle.
+
+        Args:
+            seconds: Length of the pause
+        """
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
+
+class AIMDConcurrencyLimiter:
+    """
+    Concurrency limit with additive increase and multiplicative decrease.
+
+    The limit grows by one after a limit's worth of successful requests
+    and is multiplied by ``decrease_factor`` when the provider throttles.
+    Waiters may belong to different event loops.
+    """
+
+    def __init__(
+        self,
+        initial_limit: int,
+        min_limit: int = 1,
+        max_limit: int | None = None,
+        decrease_factor: float = 0.5,
+    ) -> None:
+        """
+        Initialize the controller.
+
+        Args:
+            initial_limit: Starting number of concurrent requests
+            min_limit: Lowest limit a throttle can push the limit to
+            max_limit: Highest limit (defaults to initial_limit)
+            decrease_factor: Multiplier applied to the limit on a throttle
+        """
+        self.min_limit = max(1, min_limit)
+        self.max_limit = max(self.min_limit, max_limit or initial_limit)
+        self.limit = float(min(max(initial_limit, self.min_limit), self.max_limit))
+        self.decrease_factor = decrease_factor
+        self.in_flight = 0
+        self._waiters: deque[tuple[asyncio.AbstractEventLoop, asyncio.Future]] = deque()
+        self._lock = threading.Lock()
+
+    async def acquire(self) -> None:
+        """Wait for a free concurrency slot."""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            if self.in_flight < int(self.limit) and not self._waiters:
+                self.in_flight += 1
+                return
+            future = loop.create_future()
+            self._waiters.append((loop, future))
+
+        try:
+            await future
+        except asyncio.CancelledError:
+            with self._lock:
+                if (loop, future) in self._waiters:
+                    self._waiters.remove((loop, future))
+                    raise
+            # The slot was handed over just before cancellation
+            self.release()
+            raise
+
+    def release(self) -> None:
+        """Free a slot and hand it to the next waiter, if any."""
+        with self._lock:
+            self.in_flight -= 1
+            self._wake_waiters()
+
+    def _wake_waiters(self) -> None:
+        """Hand free slots to waiters; the lock must be held."""
+        while self._waiters and self.in_flight < int(self.limit):
+            loop, future = self._waiters.popleft()
+            if loop.is_closed():
+                continue
+            self.in_flight += 1
+            loop.call_soon_threadsafe(_resolve_waiter, future)
+
+    def on_success(self) -> None:
+        """Additive increase: grow the limit by one per window of successes."""
+        with self._lock:
+            self.limit = min(self.max_limit, self.limit + 1.0 / self.limit)
+            self._wake_waiters()
+
+    def on_throttle(self) -> None:
+        """Multiplicative decrease after the provider throttled a request."""
+        with self._lock:
+            self.limit = max(self.min_limit, self.limit * self.decrease_factor)
+
+
+class ByteBudget:
+    """
+    Byte-weighted semaphore bounding the total size of work in flight.
+
+    Callers are admitted in FIFO order while the reserved bytes stay
+    within the limit, so a large request is not starved by a stream of
+    small ones. A request larger than the whole budget is admitted once
+    nothing else is in flight. A limit of 0 disables the budget. Waiters
+    may belong to different event loops.
+    """
+
+    def __init__(self, limit_bytes: int) -> None:
+        """
+        Initialize the budget.
+
+        Args:
+            limit_bytes: Maximum bytes reserved at once (0 for no limit)
+        """
+        self.limit = max(0, limit_bytes)
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self.wait_count = 0
+        self._waiters: deque[tuple[asyncio.AbstractEventLoop, asyncio.Future, int]] = (
+            deque()
+        )
+        self._lock = threading.Lock()
+
+    def _cost(self, nbytes: int) -> int:
+        """Bytes actually reserved for a request of nbytes."""
+        return max(0, min(nbytes, self.limit))
+
+    async def acquire(self, nbytes: int) -> int:
+        """
+        Wait until nbytes fit within the budget.
+
+        Args:
+            nbytes: Expected size of the work
+
+        Returns:
+            Bytes reserved, to be passed to release()
+        """
+        cost = self._cost(nbytes)
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            if not self._waiters and self.in_flight + cost <= self.limit:
+                self._admit(cost)
+                return cost
+            future = loop.create_future()
+            waiter = (loop, future, cost)
+            self._waiters.append(waiter)
+            self.wait_count += 1
+
+        try:
+            await future
+        except asyncio.CancelledError:
+            with self._lock:
+                if waiter in self._waiters:
+                    self._waiters.remove(waiter)
+                    # Waiters queued behind this one may fit now
+                    self._wake_waiters()
+                    raise
+            # The bytes were handed over just before cancellation
+            self.release(cost)
+            raise
+        return cost
+
+    def release(self, cost: int) -> None:
+        """
+        Return reserved bytes and admit waiters that now fit.
+
+        Args:
+            cost: Value returned by acquire()
+        """
+        with self._lock:
+            self.in_flight -= cost
+            self._wake_waiters()
+
+    @contextlib.asynccontextmanager
+    async def reserve(self, nbytes: int) -> AsyncIterator[None]:
+        """
+        Hold nbytes of the budget for the duration of the block.
+
+        Args:
+            nbytes: Expected size of the work
+        """
+        cost = await self.acquire(nbytes)
+        try:
+            yield
+        finally:
+            self.release(cost)
+
+    def _admit(self, cost: int) -> None:
+        """Reserve bytes for an admitted caller; the lock must be held."""
+        self.in_flight += cost
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+
+    def _wake_waiters(self) -> None:
+        """Admit waiters in order while they fit; the lock must be held."""
+        while self._waiters:
+            loop, future, cost = self._waiters[0]
+            if loop.is_closed():
+                self._waiters.popleft()
+                continue
+            if self.in_flight + cost > self.limit:
+                break
+            self._waiters.popleft()
+            self._admit(cost)
+            loop.call_soon_threadsafe(_resolve_waiter, future)
+
+    def get_stats(self) -> dict[str, int]:
+        """
+        Get budget counters.
+
+        Returns:
+            Limit, reserved and peak reserved bytes, and waits so far
+        """
+        return {
+            "limit_bytes": self.limit,
+            "in_flight_bytes": self.in_flight,
+            "peak_in_flight_bytes": self.peak_in_flight,
+            "waits": self.wait_count,
+            "waiting": len(self._waiters),
+        }
+
+
+def _resolve_waiter(future: asyncio.Future) -> None:
+    """Complete a waiter future unless it was cancelled meanwhile."""
+    if not future.done():
+        future.set_result(None)
+
+
+class ApiRateLimiter:
+    """
+    Rate, concurrency and retry policy for one provider API and mailbox.
+
+    Callers hold a slot for the duration of each request and report
+    whether it succeeded or was throttled; throttled requests are retried
+    up to retry_attempts times after backoff_delay seconds.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        requests_per_second: float,
+        max_concurrency: int,
+        retry_attempts: int = 3,
+        base_delay: float = 1.0,
+        max_delay: float = 60.0,
+    ) -> None:
+        """
+        Initialize the limiter.
+
+        Args:
+            name: Identifier used in log messages
+            requests_per_second: Sustained request rate
+            max_concurrency: Highest concurrency the AIMD controller may reach
+            retry_attempts: Retries for a throttled request
+            base_delay: First backoff delay in seconds
+            max_delay: Upper bound for a computed backoff delay; a
+                provider Retry-After is never shortened to fit it
+        """
+        self.name = name
+        self.bucket = TokenBucket(requests_per_second)
+        self.concurrency = AIMDConcurrencyLimiter(
+            initial_limit=max(1, max_concurrency // 2),
+            max_limit=max_concurrency,
+        )
+        self.retry_attempts = retry_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+
+        # Counters for monitoring
+        self.request_count = 0
+        self.throttle_count = 0
+
+    @contextlib.asynccontextmanager
+    async def slot(self, cost: float = 1.0) -> AsyncIterator[None]:
+        """
+        Hold a rate and concurrency slot for one request.
+
+        Args:
+            cost: Tokens the request uses, e.g. sub-requests in a batch
+        """
+        await self.concurrency.acquire()
+        try:
+            await self.bucket.acquire(cost)
+            self.request_count += 1
+            yield
+        finally:
+            self.concurrency.release()
+
+    @contextlib.asynccontextmanager
+    async def request(
+        self, send: Callable[[], Awaitable[Any]], cost: float = 1.0
+    ) -> AsyncIterator[Any]:
+        """
+        Send an HTTP request, retrying while the provider throttles it.
+
+        The response object must expose ``status``, ``headers`` and
+        ``release()`` like an aiohttp response; it is released on exit.
+
+        Args:
+            send: Coroutine factory issuing the request, called per attempt
+            cost: Tokens the request uses
+
+        Yields:
+            The first response that is not throttled, or the last
+            throttled one once retries are exhausted
+        """
+        for attempt in range(self.retry_attempts + 1):
+            async with self.slot(cost):
+                response = await send()
+                try:
+                    throttled = response.status in THROTTLE_STATUSES
+                    if not throttled or attempt == self.retry_attempts:
+                        if not throttled:
+                            self.record_success()
+                        yield response
+                        return
+
+                    delay = self.record_throttle(
+                        attempt, parse_retry_after(response.headers.get("Retry-After"))
+                    )
+                finally:
+                    response.release()
+
+            await asyncio.sleep(delay)
+
+    def record_success(self) -> None:
+        """Record a request that was not throttled."""
+        self.concurrency.on_success()
+
+    def record_throttle(self, attempt: int, retry_after: float | None = None) -> float:
+        """
+        Record a throttled request and compute how long to wait.
+
+        Pauses the token bucket so every caller of this API backs off, and
+        lowers the concurrency limit.
+
+        Args:
+            attempt: Zero-based retry attempt of the throttled request
+            retry_after: Delay requested by the provider, if any
+
+        Returns:
+            Seconds to wait before retrying
+        """
+        self.throttle_count += 1
+        self.concurrency.on_throttle()
+        delay = self.backoff_delay(attempt, retry_after)
+        self.bucket.pause(delay)
+
+        logger.warning(
+            f"{self.name} throttled (attempt {attempt + 1}); retrying in "
+            f"{delay:.1f}s with concurrency limit {int(self.concurrency.limit)}"
+        )
+        return delay
+
+    def backoff_delay(self, attempt: int, retry_after: float | None = None) -> float:
+        """
+        Compute a retry delay.
+
+        A provider Retry-After is honored as the minimum, even beyond
+        max_delay; otherwise the delay is exponential in the attempt with
+        full jitter.
+
+        Args:
+            attempt: Zero-based retry attempt
+            retry_after: Delay requested by the provider, if any
+
+        Returns:
+            Delay in seconds
+        """
+        backoff = min(self.max_delay, self.base_delay * 2**attempt)
+        if retry_after is not None:
+            # Up to 10% extra spreads out callers released at the same time
+            return max(retry_after, backoff) * random.uniform(1.0, 1.1)
+        return random.uniform(0, backoff)
+
+    def get_stats(self) -> dict[str, float | int]:
+        """
+        Get limiter counters.
+
+        Returns:
+            Request and throttle counts and the current concurrency limit
+        """
+        return {
+            "requests": self.request_count,
+            "throttled": self.throttle_count,
+            "concurrency_limit": int(self.concurrency.limit),
+            "in_flight": self.concurrency.in_flight,
+        }
+
+
+_limiters: dict[tuple[str, str, str], ApiRateLimiter] = {}
+_limiters_lock = threading.Lock()
+_byte_budgets: dict[str, ByteBudget] = {}
+
+
+def get_rate_limiter(
+    provider: str,
+    mailbox: str,
+    api: str,
+    requests_per_second: float,
+    max_concurrency: int,
+    retry_attempts: int = 3,
+) -> ApiRateLimiter:
+    """
+    Get the process-wide limiter for a provider API and mailbox.
+
+    The limits are used when the limiter is first created; later calls
+    return the existing limiter unchanged.
+
+    Args:
+        provider: Email provider name (e.g. 'gmail', 'msgraph')
+        mailbox: Mailbox identifier, usually the account email address
+        api: API within the provider (e.g. 'gmail', 'people', 'graph')
+        requests_per_second: Sustained request rate
+        max_concurrency: Highest concurrency for the AIMD controller
+        retry_attempts: Retries for a throttled request
+
+    Returns:
+        Shared ApiRateLimiter
+    """
+    key = (provider, mailbox, api)
+    with _limiters_lock:
+        limiter = _limiters.get(key)
+        if limiter is None:
+            limiter = ApiRateLimiter(
+                name=f"{provider}/{api} for {mailbox}",
+                requests_per_second=requests_per_second,
+                max_concurrency=max_concurrency,
+                retry_attempts=retry_attempts,
+            )
+            _limiters[key] = limiter
+        return limiter
+
+
+def get_byte_budget(name: str, limit_bytes: int = DEFAULT_BYTE_BUDGET) -> ByteBudget:
+    """
+    Get the process-wide byte budget with the given name.
+
+    The limit is used when the budget is first created; later calls
+    return the existing budget unchanged.
+
+    Args:
+        name: Budget name (e.g. 'attachments')
+        limit_bytes: Maximum bytes reserved at once (0 for no limit)
+
+    Returns:
+        Shared ByteBudget
+    """
+    with _limiters_lock:
+        budget = _byte_budgets.get(name)
+        if budget is None:
+            budget = ByteBudget(limit_bytes)
+            _byte_budgets[name] = budget
+        return budget
@@ -0,0 +1,283 @@
+"""
+Spooled Attachment Buffers
+
+Holds downloaded attachment content in memory while it is small and in a
+temporary file once it grows past a threshold, so a batch containing a
+few large PDFs does not keep hundreds of megabytes of bytes objects alive
+in the worker process.
+
+Spooled content is referenced by its file path, which is plain data and
+can travel through the processing graph state and its checkpoints. The
+attachment processor moves the file into place when saving; files that
+are never saved are removed with remove_spool_file. Buffers hash their
+content as it is written, so downloads get a SHA-256 without a second pass.
+
+Providers that return attachments as base64 text are decoded in chunks
+with decode_base64_into, which is meant to run in a worker thread.
+"""
+
+# # Standard library imports
+import base64
+import contextlib
+import hashlib
+import os
+
+# Logging system
+import sys
+import tempfile
+from collections.abc import Iterator
+from pathlib import Path
+from typing import BinaryIO
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+# # Local application imports
+from utils.logging_system import get_logger  # noqa: E402
+
+# Initialize logger
+logger = get_logger(__name__)
+
+DEFAULT_SPOOL_THRESHOLD = 5 * 1024 * 1024  # Content above this goes to disk
+CHUNK_SIZE = 1024 * 1024
+# Base64 characters decoding to one CHUNK_SIZE block (a multiple of 4)
+BASE64_CHUNK_CHARS = CHUNK_SIZE // 3 * 4
+
+
+class SpooledAttachmentBuffer:
+    """
+    Write-once attachment buffer, in memory below a threshold and on disk above.
+
+    Content is appended with write() and the buffer is closed once the
+    download completes. Spooled files are created with delete=False so the
+    path can outlive the buffer; the owner removes them.
+    """
+
+    def __init__(
+        self,
+        threshold: int = DEFAULT_SPOOL_THRESHOLD,
+        directory: str | None = None,
+        suffix: str = "",
+    ) -> None:
+        """
+        Initialize an empty buffer.
+
+        Args:
+            threshold: Size in bytes above which content is moved to disk
+            directory: Directory for spool files (system temp dir if None)
+            suffix: Spool file suffix, e.g. the attachment's extension
+        """
+        self.threshold = threshold
+        self.directory = directory or None
+        self.suffix = suffix
+        self.path: str | None = None
+        self.size = 0
+        self._memory = bytearray()
+        self._file = None
+        self._hash = hashlib.sha256()
+
+    @classmethod
+    def from_bytes(
+        cls,
+        data: bytes,
+        threshold: int = DEFAULT_SPOOL_THRESHOLD,
+        directory: str | None = None,
+        suffix: str = "",
+    ) -> "SpooledAttachmentBuffer":
+        """
+        Create a closed buffer holding the given content.
+
+        Args:
+            data: Attachment content
+            threshold: Size in bytes above which content is moved to disk
+            directory: Directory for spool files (system temp dir if None)
+            suffix: Spool file suffix
+
+        Returns:
+            Closed buffer
+        """
+        buffer = cls(threshold, directory, suffix)
+        buffer.write(data)
+        buffer.close()
+        return buffer
+
+    @property
+    def is_spooled(self) -> bool:
+        """Whether the content lives in a temporary file."""
+        return self.path is not None
+
+    @property
+    def sha256(self) -> str:
+        """Hex SHA-256 digest of the content written so far."""
+        return self._hash.hexdigest()
+
+    def write(self, data: bytes) -> None:
+        """
+        Append content, moving the buffer to disk once it passes the threshold.
+
+        Args:
+            data: Next chunk of content
+        """
+        if self._file is None and self.size + len(data) > self.threshold:
+            if self.directory:
+                os.makedirs(self.directory, exist_ok=True)
+            # The handle stays open across write() calls; close() and
+            # discard() release it, so no with block can own it here
+            self._file = tempfile.NamedTemporaryFile(  # noqa: SIM115
+                prefix="attachment_",
+                suffix=self.suffix,
+                dir=self.directory,
+                delete=False,
+            )
+            self.path = self._file.name
+            self._file.write(self._memory)
+            self._memory = bytearray()
+
+        if self._file is not None:
+            self._file.write(data)
+        else:
+            self._memory.extend(data)
+        self._hash.update(data)
+        self.size += len(data)
+
+    def close(self) -> None:
+        """Finish writing; the spool file stays on disk."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def getvalue(self) -> bytes:
+        """
+        Get the whole content.
+
+        Returns:
+            Content bytes (read from disk if spooled)
+        """
+        if self.path:
+            with open(self.path, "rb") as f:
+                return f.read()
+        return bytes(self._memory)
+
+    def iter_chunks(self, chunk_size: int = CHUNK_SIZE) -> Iterator[bytes]:
+        """
+        Iterate over the content without loading it all at once.
+
+        Args:
+            chunk_size: Maximum bytes per chunk
+
+        Yields:
+            Consecutive chunks of content
+        """
+        if self.path:
+            yield from iter_spool_file(self.path, chunk_size)
+        else:
+            view = memoryview(self._memory)
+            for start in range(0, len(view), chunk_size):
+                yield bytes(view[start : start + chunk_size])
+
+    def discard(self) -> None:
+        """Drop the content and remove the spool file, if any."""
+        self.close()
+        if self.path:
+            remove_spool_file(self.path)
+            self.path = None
+        self._memory = bytearray()
+        self._hash = hashlib.sha256()
+        self.size = 0
+
+
+def decode_base64_into(
+    data: str | bytes,
+    writer: SpooledAttachmentBuffer | BinaryIO,
+    urlsafe: bool = False,
+    chunk_chars: int = BASE64_CHUNK_CHARS,
+) -> int:
+    """
+    Decode base64 text block by block into a writer.
+
+    Only one decoded block is held at a time, so a large attachment is
+    not duplicated in memory. Line breaks are removed first and missing
+    final padding (as in Gmail's unpadded data) is tolerated. Blocking;
+    call it through asyncio.to_thread from async code.
+
+    Args:
+        data: Base64 text
+        writer: Buffer or binary file receiving the decoded bytes
+        urlsafe: Whether data uses the URL-safe alphabet
+        chunk_chars: Characters decoded per block, a multiple of 4
+
+    Returns:
+        Number of decoded bytes written
+
+    Raises:
+        binascii.Error: If data is not valid base64
+    """
+    if chunk_chars % 4:
+        raise ValueError("chunk_chars must be a multiple of 4")
+
+    # Chunk boundaries must align with 4-character groups
+    separators = ("\r", "\n", " ") if isinstance(data, str) else (b"\r", b"\n", b" ")
+    if any(sep in data for sep in separators):
+        data = data[:0].join(data.split())
+
+    decode = base64.urlsafe_b64decode if urlsafe else base64.b64decode
+    padding = "=" if isinstance(data, str) else b"="
+    written = 0
+    for start in range(0, len(data), chunk_chars):
+        chunk = data[start : start + chunk_chars]
+        block = decode(chunk + padding * (-len(chunk) % 4))
+        writer.write(block)
+        written += len(block)
+    return written
+
+
+def write_base64_file(data: str | bytes, path: Path, urlsafe: bool = False) -> int:
+    """
+    Decode base64 text straight into a file.
+
+    Args:
+        data: Base64 text
+        path: Destination file, created or truncated
+        urlsafe: Whether data uses the URL-safe alphabet
+
+    Returns:
+        Number of decoded bytes written
+
+    Raises:
+        binascii.Error: If data is not valid base64; the file is removed
+    """
+    try:
+        with open(path, "wb") as f:
+            return decode_base64_into(data, f, urlsafe)
+    except ValueError:
+        remove_spool_file(str(path))
+        raise
+
+
+def iter_spool_file(path: str, chunk_size: int = CHUNK_SIZE) -> Iterator[bytes]:
+    """
+    Iterate over a spool file in chunks.
+
+    Args:
+        path: Spool file path
+        chunk_size: Maximum bytes per chunk
+
+    Yields:
+        Consecutive chunks of the file
+    """
+    with open(path, "rb") as f:
+        while chunk := f.read(chunk_size):
+            yield chunk
+
+
+def remove_spool_file(path: str | None) -> None:
+    """
+    Remove a spool file if it still exists.
+
+    Args:
+        path: Spool file path, or None
+    """
+    if not path:
+        return
+    with contextlib.suppress(FileNotFoundError):
+        os.remove(path)
+        logger.debug(f"Removed attachment spool file {path}")
@@ -0,0 +1,151 @@
+"""
+Incremental Sync Checkpoint Store
+
+Persists per-mailbox synchronization checkpoints (Gmail historyId,
+Microsoft Graph deltaLink) so that polling cycles only fetch messages
+added since the previous cycle.
+
+Checkpoints are stored in a small JSON document keyed by provider,
+mailbox and checkpoint name:
+
+    {
+        "gmail": {
+            "user@example.com": {
+                "history_id": {"value": "123456", "updated_at": "..."}
+            }
+        }
+    }
+
+Writes go through a temporary file and an atomic rename so a crash
+during a save never leaves a truncated checkpoint file behind.
+"""
+
+# # Standard library imports
+import contextlib
+import json
+import os
+
+# Logging system
+import sys
+import tempfile
+import threading
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+# # Local application imports
+from utils.logging_system import get_logger  # noqa: E402
+
+# Initialize logger
+logger = get_logger(__name__)
+
+
+class SyncStateStore:
+    """
+    JSON-file store for incremental sync checkpoints.
+
+    Each value is identified by (provider, mailbox, key). The store is
+    safe to share between interfaces in the same process.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        """
+        Initialize the checkpoint store.
+
+        Args:
+            path: Location of the JSON checkpoint file (created on first save)
+        """
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._data: dict[str, Any] = self._load()
+
+    def _load(self) -> dict[str, Any]:
+        """
+        Load checkpoints from disk.
+
+        Returns:
+            Checkpoint document, or an empty one if the file is missing
+            or unreadable
+        """
+        if not self.path.exists():
+            return {}
+
+        try:
+            with open(self.path) as f:
+                data = json.load(f)
+            return data if isinstance(data, dict) else {}
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"Could not read sync state from {self.path}: {e}")
+            return {}
+
+    def _save(self) -> None:
+        """Atomically write the checkpoint document to disk."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(
+            dir=self.path.parent, prefix=f".{self.path.name}.", suffix=".tmp"
+        )
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(self._data, f, indent=2)
+            os.replace(tmp_path, self.path)
+        except OSError:
+            with contextlib.suppress(OSError):
+                os.unlink(tmp_path)
+            raise
+
+    def get(self, provider: str, mailbox: str, key: str) -> str | None:
+        """
+        Get a stored checkpoint.
+
+        Args:
+            provider: Email provider name (e.g. 'gmail', 'msgraph')
+            mailbox: Mailbox identifier, usually the account email address
+            key: Checkpoint name within the mailbox
+
+        Returns:
+            Stored checkpoint value, or None if there is none
+        """
+        with self._lock:
+            entry = self._data.get(provider, {}).get(mailbox, {}).get(key)
+        return entry.get("value") if isinstance(entry, dict) else None
+
+    def set(self, provider: str, mailbox: str, key: str, value: str) -> None:
+        """
+        Store a checkpoint and persist it.
+
+        Args:
+            provider: Email provider name
+            mailbox: Mailbox identifier
+            key: Checkpoint name within the mailbox
+            value: Checkpoint value to store
+        """
+        with self._lock:
+            # Re-read first so checkpoints saved by other interfaces survive
+            self._data = self._load()
+            self._data.setdefault(provider, {}).setdefault(mailbox, {})[key] = {
+                "value": value,
+                "updated_at": datetime.now(UTC).isoformat(),
+            }
+            self._save()
+
+        logger.debug(f"Saved {provider} sync checkpoint '{key}' for {mailbox}")
+
+    def clear(self, provider: str, mailbox: str, key: str) -> None:
+        """
+        Remove a checkpoint so the next sync starts from scratch.
+
+        Args:
+            provider: Email provider name
+            mailbox: Mailbox identifier
+            key: Checkpoint name within the mailbox
+        """
+        with self._lock:
+            self._data = self._load()
+            mailbox_state = self._data.get(provider, {}).get(mailbox, {})
+            if key in mailbox_state:
+                del mailbox_state[key]
+                self._save()
+
+        logger.info(f"Cleared {provider} sync checkpoint '{key}' for {mailbox}")
@@ -13,7 +13,9 @@ Storage Structure:
 
 # # Standard library imports
 import json
+import re
 import sqlite3
+from collections import Counter
 from contextlib import contextmanager
 from dataclasses import asdict, dataclass
 from datetime import datetime
@@ -57,18 +59,255 @@ class MemoryItem:
         return cls(**data)
 
 
+class AssetProfileIndex:
+    """
+    Inverted index over asset profile keywords, names and filename patterns.
+
+    Keeps normalized keyword tokens and name tokens mapped to asset ids,
+    plus postings for every 2- and 3-character slice of the lowercased
+    keywords and names. The slice postings find every asset in which a
+    query occurs as a substring, so substring search only scores those
+    candidates instead of the whole catalog.
+
+    The words of the keywords and the filename patterns are indexed too,
+    so candidate retrieval can look up fuzzy keyword and filename matches
+    without visiting every profile.
+    """
+
+    def __init__(self) -> None:
+        self.keyword_tokens: dict[str, set[str]] = {}
+        self.keyword_words: dict[str, set[str]] = {}
+        self.name_tokens: dict[str, set[str]] = {}
+        self.filename_patterns: dict[str, set[str]] = {}
+        self._grams: dict[str, set[str]] = {}
+        self._pattern_lengths: Counter[int] = Counter()
+        self._asset_keys: dict[str, tuple[set[str], ...]] = {}
+        self._positions: dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._asset_keys)
+
+    @staticmethod
+    def _profile_texts(profile: dict[str, Any]) -> tuple[list[str], str]:
+        """Lowercased keywords and name of a profile."""
+        keywords = [
+            keyword.lower()
+            for keyword in profile.get("keywords", [])
+            if isinstance(keyword, str)
+        ]
+        return keywords, str(profile.get("name", "")).lower()
+
+    def _postings(self) -> tuple[dict[str, set[str]], ...]:
+        """Postings indexes, in the order of each asset's key sets."""
+        return (
+            self.keyword_tokens,
+            self.keyword_words,
+            self.name_tokens,
+            self.filename_patterns,
+            self._grams,
+        )
+
+    @staticmethod
+    def _slices(text: str) -> set[str]:
+        """All 2- and 3-character slices of text."""
+        return {
+            text[start : start + size]
+            for size in (2, 3)
+            for start in range(len(text) - size + 1)
+        }
+
+    def add(self, asset_id: str, profile: dict[str, Any]) -> None:
+        """Index a profile, replacing any previous entry for the asset."""
+        self.remove(asset_id, keep_position=True)
+        keywords, name = self._profile_texts(profile)
+
+        keyword_tokens = {
+            token for keyword in keywords for token in keyword.strip().split()
+        }
+        keyword_words = {
+            word for keyword in keywords for word in re.findall(r"\b\w+\b", keyword)
+        }
+        name_tokens = set(name.split())
+        patterns = {
+            pattern
+            for pattern in profile.get("filename_patterns", [])
+            if isinstance(pattern, str)
+        }
+        grams = set().union(*(self._slices(text) for text in [*keywords, name]))
+
+        asset_keys = (keyword_tokens, keyword_words, name_tokens, patterns, grams)
+        for index, keys in zip(self._postings(), asset_keys, strict=True):
+            for key in keys:
+                if key not in index:
+                    index[key] = set()
+                    if index is self.filename_patterns:
+                        self._pattern_lengths[len(key)] += 1
+                index[key].add(asset_id)
+
+        self._asset_keys[asset_id] = asset_keys
+        self._positions.setdefault(asset_id, len(self._positions))
+
+    def remove(self, asset_id: str, keep_position: bool = False) -> None:
+        """Drop an asset from the index."""
+        keys = self._asset_keys.pop(asset_id, None)
+        if keys is not None:
+            for index, asset_keys in zip(self._postings(), keys, strict=True):
+                for key in asset_keys:
+                    postings = index[key]
+                    postings.discard(asset_id)
+                    if not postings:
+                        del index[key]
+                        if index is self.filename_patterns:
+                            self._pattern_lengths[len(key)] -= 1
+                            if not self._pattern_lengths[len(key)]:
+                                del self._pattern_lengths[len(key)]
+        if not keep_position:
+            self._positions.pop(asset_id, None)
+
+    def rebuild(self, asset_profiles: dict[str, dict[str, Any]]) -> None:
+        """Index a whole catalog from scratch, keeping its order."""
+        for index in (
+            *self._postings(),
+            self._pattern_lengths,
+            self._asset_keys,
+            self._positions,
+        ):
+            index.clear()
+        for asset_id, profile in asset_profiles.items():
+            self.add(asset_id, profile)
+
+    def substring_candidates(self, text: str) -> set[str] | None:
+        """
+        Assets whose keywords or name may contain text as a substring.
+
+        Args:
+            text: Lowercased query text
+
+        Returns:
+            Candidate asset ids (a superset of the true matches), or None
+            if text is too short to narrow the search
+        """
+        size = min(len(text), 3)
+        if size < 2:
+            return None
+
+        postings = sorted(
+            (
+                self._grams.get(text[start : start + size], set())
+                for start in range(len(text) - size + 1)
+            ),
+            key=len,
+        )
+        candidates = set(postings[0])
+        for posting in postings[1:]:
+            if not candidates:
+                break
+            candidates &= posting
+        return candidates
+
+    def filename_candidates(self, filename: str) -> set[str]:
+        """
+        Assets with a filename pattern occurring in the filename.
+
+        Only filename slices as long as some indexed pattern are looked up.
+
+        Args:
+            filename: Attachment filename (patterns are case-sensitive)
+
+        Returns:
+            Matching asset ids
+        """
+        found: set[str] = set()
+        for length in self._pattern_lengths:
+            for start in range(len(filename) - length + 1):
+                found.update(
+                    self.filename_patterns.get(filename[start : start + length], ())
+                )
+        return found
+
+    def in_catalog_order(self, asset_ids: set[str]) -> list[str]:
+        """Sort asset ids by their position in the catalog."""
+        return sorted(asset_ids, key=lambda asset_id: self._positions[asset_id])
+
+
 class SimpleSemanticMemory:
     """
     Semantic Memory using JSON file storage.
 
     Stores asset profiles, keywords, patterns, and factual knowledge.
+    Asset profiles are indexed by AssetProfileIndex; the index is rebuilt
+    whenever ``data`` is replaced and updated by add_asset_profile. Edit
+    profiles through add_asset_profile: the index cannot see in-place
+    changes (e.g. appending to a profile's keywords), so code that edits
+    ``data["asset_profiles"]`` directly must call rebuild_index() after.
     """
 
     def __init__(self):
         self.file_path = MEMORY_DATA_DIR / "semantic_memory.json"
-        self.data: dict[str, Any] = self._load_data()
+        self.index = AssetProfileIndex()
+        self.data = self._load_data()
         logger.info("✅ SimpleSemanticMemory initialized")
 
+    @property
+    def data(self) -> dict[str, Any]:
+        """Semantic memory contents."""
+        return self._data
+
+    @data.setter
+    def data(self, value: dict[str, Any]) -> None:
+        self._data = value
+        self.rebuild_index()
+
+    def rebuild_index(self) -> None:
+        """Rebuild the asset profile index from the current data."""
+        asset_profiles = self._data.get("asset_profiles", {})
+        self.index.rebuild(asset_profiles)
+        self._indexed_profiles = asset_profiles
+        logger.info(f"Indexed {len(self.index)} asset profiles")
+
+    def _asset_index(self) -> AssetProfileIndex:
+        """
+        Get the index, rebuilding it if asset_profiles was swapped out.
+
+        Only a replaced or resized asset_profiles dict is detected; edits
+        inside existing profiles need rebuild_index().
+        """
+        asset_profiles = self._data.get("asset_profiles", {})
+        stale = asset_profiles is not self._indexed_profiles
+        if stale or len(asset_profiles) != len(self.index):
+            self.rebuild_index()
+        return self.index
+
+    def get_asset_keyword_tokens(self) -> set[str]:
+        """
+        Get every word used in asset keywords.
+
+        Returns:
+            Lowercased keyword tokens across all asset profiles
+        """
+        return set(self._asset_index().keyword_tokens)
+
+    def get_asset_keyword_words(self) -> set[str]:
+        """
+        Get every regex word used in asset keywords, for fuzzy lookups.
+
+        Returns:
+            Lowercased keyword words across all asset profiles
+        """
+        return set(self._asset_index().keyword_words)
+
+    def get_assets_by_keyword_word(self, word: str) -> set[str]:
+        """
+        Get the assets whose keywords contain a word.
+
+        Args:
+            word: Lowercased word, as returned by get_asset_keyword_words
+
+        Returns:
+            Asset ids
+        """
+        return set(self._asset_index().keyword_words.get(word, ()))
+
     @log_function()
     def _load_data(self) -> dict[str, Any]:
         """Load data from JSON file"""
@@ -147,8 +386,25 @@ class SimpleSemanticMemory:
         """Search for asset profiles matching the query"""
         results = []
         query_lower = query.lower()
+        asset_profiles = self.data.get("asset_profiles", {})
+
+        # Only assets containing the query or one of its words can score
+        index = self._asset_index()
+        candidates: set[str] | None = set()
+        for text in [query_lower, *(w for w in query_lower.split() if len(w) > 1)]:
+            found = index.substring_candidates(text)
+            if found is None:
+                candidates = None
+                break
+            candidates |= found
+        asset_ids = (
+            list(asset_profiles)
+            if candidates is None
+            else index.in_catalog_order(candidates)
+        )
 
-        for asset_id, profile in self.data.get("asset_profiles", {}).items():
+        for asset_id in asset_ids:
+            profile = asset_profiles[asset_id]
             # Check if query term matches asset keywords or name
             score = 0.0
 
@@ -184,6 +440,48 @@ class SimpleSemanticMemory:
         results.sort(key=lambda x: x["score"], reverse=True)
         return results[:limit]
 
+    def find_assets_by_keyword_substring(self, text: str) -> list[str]:
+        """
+        Find the assets with a keyword containing text.
+
+        Args:
+            text: Query text (matched case-insensitively)
+
+        Returns:
+            Asset ids in catalog order
+        """
+        text_lower = text.lower()
+        asset_profiles = self.data.get("asset_profiles", {})
+        index = self._asset_index()
+        candidates = index.substring_candidates(text_lower)
+        asset_ids = (
+            list(asset_profiles)
+            if candidates is None
+            else index.in_catalog_order(candidates)
+        )
+        return [
+            asset_id
+            for asset_id in asset_ids
+            if any(
+                text_lower in keyword.lower()
+                for keyword in asset_profiles[asset_id].get("keywords", [])
+                if isinstance(keyword, str)
+            )
+        ]
+
+    def find_assets_by_filename(self, filename: str) -> list[str]:
+        """
+        Find the assets with a filename pattern occurring in a filename.
+
+        Args:
+            filename: Attachment filename
+
+        Returns:
+            Asset ids in catalog order
+        """
+        index = self._asset_index()
+        return index.in_catalog_order(index.filename_candidates(filename))
+
     @log_function()
     def get_file_type_rules(self, file_extension: str) -> dict[str, Any] | None:
         """Get file type rules for an extension"""
@@ -195,7 +493,10 @@ class SimpleSemanticMemory:
         if "asset_profiles" not in self.data:
             self.data["asset_profiles"] = {}
 
+        # Check staleness before mutating, so the new id doesn't look like drift
+        index = self._asset_index()
         self.data["asset_profiles"][asset_id] = profile
+        index.add(asset_id, profile)
         self._save_data()
         logger.info(f"Added asset profile: {asset_id}")
 
@@ -45,9 +45,11 @@ class EmailAgentConfig:
     # Gmail Configuration
     gmail_credentials_path: str
     gmail_token_path: str
+    gmail_transport: str  # "executor" or "aiohttp"
 
     # Microsoft Graph Configuration
     msgraph_credentials_path: str
+    msgraph_body_content_type: str  # "text" or "html"
 
     # Database/Storage
     qdrant_host: str
@@ -124,6 +126,12 @@ class EmailAgentConfig:
     max_concurrent_attachments: int
     email_batch_size: int
     processing_timeout_seconds: int
+    ingestion_pipeline_enabled: bool
+    lazy_attachment_fetch: bool
+    attachment_spool_threshold_mb: float
+    attachment_spool_dir: str
+    attachment_byte_budget_mb: float
+    ingestion_queue_size: int
 
     # Human Review Thresholds
     relevance_threshold: float
@@ -154,6 +162,8 @@ class EmailAgentConfig:
     # Email Search Configuration
     inbox_labels: list[str]
     max_search_results: int
+    email_sync_mode: str  # "full" or "incremental"
+    sync_state_file: str
 
     # Mailbox Configuration
     gmail_mailbox_id: str
@@ -206,11 +216,15 @@ class EmailAgentConfig:
             gmail_token_path=os.getenv(
                 "GMAIL_TOKEN_PATH", str(PROJECT_ROOT / "config/gmail_token.json")
             ),
+            gmail_transport=os.getenv("GMAIL_TRANSPORT", "executor").lower(),
             # Microsoft Graph Configuration
             msgraph_credentials_path=os.getenv(
                 "MSGRAPH_CREDENTIALS_PATH",
                 str(PROJECT_ROOT / "config/msgraph_credentials.json"),
             ),
+            msgraph_body_content_type=os.getenv(
+                "MSGRAPH_BODY_CONTENT_TYPE", "text"
+            ).lower(),
             # Database/Storage
             qdrant_host=qdrant_host,
             qdrant_port=qdrant_port,
@@ -320,6 +334,20 @@ class EmailAgentConfig:
             processing_timeout_seconds=int(
                 os.getenv("PROCESSING_TIMEOUT_SECONDS", "300")
             ),
+            ingestion_pipeline_enabled=parse_bool(
+                os.getenv("INGESTION_PIPELINE_ENABLED", "false")
+            ),
+            lazy_attachment_fetch=parse_bool(
+                os.getenv("LAZY_ATTACHMENT_FETCH", "true")
+            ),
+            attachment_spool_threshold_mb=float(
+                os.getenv("ATTACHMENT_SPOOL_THRESHOLD_MB", "5")
+            ),
+            attachment_spool_dir=os.getenv("ATTACHMENT_SPOOL_DIR", ""),
+            attachment_byte_budget_mb=float(
+                os.getenv("ATTACHMENT_BYTE_BUDGET_MB", "256")
+            ),
+            ingestion_queue_size=int(os.getenv("INGESTION_QUEUE_SIZE", "10")),
             # Human Review Thresholds
             relevance_threshold=float(os.getenv("RELEVANCE_THRESHOLD", "0.7")),
             low_confidence_threshold=float(
@@ -362,6 +390,10 @@ class EmailAgentConfig:
             # Email Search Configuration
             inbox_labels=parse_list(os.getenv("INBOX_LABELS", "INBOX,Inbox")),
             max_search_results=int(os.getenv("MAX_SEARCH_RESULTS", "100")),
+            email_sync_mode=os.getenv("EMAIL_SYNC_MODE", "full").lower(),
+            sync_state_file=os.getenv(
+                "SYNC_STATE_FILE", str(PROJECT_ROOT / "data/sync_state.json")
+            ),
             # Mailbox Configuration
             gmail_mailbox_id=os.getenv("GMAIL_MAILBOX_ID", "gmail_primary"),
             gmail_mailbox_name=os.getenv(
@@ -476,6 +508,24 @@ class EmailAgentConfig:
         if self.processing_timeout_seconds < 30:
             errors.append("processing_timeout_seconds must be at least 30")
 
+        if self.attachment_spool_threshold_mb < 0:
+            errors.append("attachment_spool_threshold_mb cannot be negative")
+
+        if self.attachment_byte_budget_mb < 0:
+            errors.append("attachment_byte_budget_mb cannot be negative")
+
+        if self.ingestion_queue_size < 1:
+            errors.append("ingestion_queue_size must be at least 1")
+
+        if self.email_sync_mode not in ("full", "incremental"):
+            errors.append("email_sync_mode must be 'full' or 'incremental'")
+
+        if self.gmail_transport not in ("executor", "aiohttp"):
+            errors.append("gmail_transport must be 'executor' or 'aiohttp'")
+
+        if self.msgraph_body_content_type not in ("text", "html"):
+            errors.append("msgraph_body_content_type must be 'text' or 'html'")
+
         # Validate directories exist or can be created
         for path, name in [
             (self.assets_base_path, "Assets base directory"),
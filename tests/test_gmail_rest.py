@@ -0,0 +1,37 @@
+"""
+Tests for the async Gmail REST transport.
+"""
+
+# # Third-party imports
+import pytest
+
+pytest.importorskip("aiohttp")
+pytest.importorskip("googleapiclient")
+
+# # Local application imports
+from src.email_interface.gmail_rest import GmailRestClient  # noqa: E402
+
+
+@pytest.mark.unit
+@pytest.mark.email
+def test_parse_batch_response_decodes_utf8_parts() -> None:
+    """Non-ASCII JSON in a batch part is decoded as UTF-8."""
+    boundary = "batch_abc"
+    content = (
+        f"--{boundary}\r\n"
+        "Content-Type: application/http\r\n"
+        "Content-ID: <response-1>\r\n"
+        "\r\n"
+        "HTTP/1.1 200 OK\r\n"
+        "Content-Type: application/json; charset=UTF-8\r\n"
+        "\r\n"
+        '{"subject": "Café résumé", "snippet": "naïve — ok"}\r\n'
+        f"--{boundary}--\r\n"
+    ).encode()
+
+    client = GmailRestClient.__new__(GmailRestClient)
+    results = client._parse_batch_response(
+        f"multipart/mixed; boundary={boundary}", content
+    )
+
+    assert results["1"] == {"subject": "Café résumé", "snippet": "naïve — ok"}
@@ -0,0 +1,194 @@
+"""
+Tests for Microsoft Graph delta sync against a local stand-in server.
+"""
+
+# # Standard library imports
+import json
+from pathlib import Path
+from typing import Any
+
+# # Third-party imports
+import pytest
+
+pytest.importorskip("aiohttp")
+pytest.importorskip("msal")
+pytest_asyncio = pytest.importorskip("pytest_asyncio")
+
+from aiohttp import web  # noqa: E402
+from aiohttp.test_utils import TestServer  # noqa: E402
+
+# # Local application imports
+from src.email_interface.base import EmailSearchCriteria  # noqa: E402
+from src.email_interface.msgraph import MicrosoftGraphInterface  # noqa: E402
+
+
+def _message(message_id: str, has_attachments: bool = False) -> dict[str, Any]:
+    """Build a raw Graph message with the selected properties."""
+    return {
+        "id": message_id,
+        "subject": f"Subject {message_id}",
+        "from": {"emailAddress": {"address": "sender@example.com"}},
+        "toRecipients": [],
+        "body": {"contentType": "text", "content": "Body"},
+        "receivedDateTime": "2026-10-16T10:00:00Z",
+        "hasAttachments": has_attachments,
+    }
+
+
+class StandInGraph:
+    """Minimal Graph server covering messages, delta and $batch."""
+
+    def __init__(self) -> None:
+        self.base_url = ""
+        self.delta_queries: list[dict[str, str]] = []
+        self.batch_urls: list[str] = []
+
+        self.app = web.Application()
+        self.app.router.add_get("/v1.0/me/mailFolders/inbox/messages/delta", self.delta)
+        self.app.router.add_get("/v1.0/me/messages", self.messages)
+        self.app.router.add_post("/v1.0/$batch", self.batch)
+
+    def delta_link(self, token: str) -> str:
+        return (
+            f"{self.base_url}/me/mailFolders/inbox/messages/delta?$deltatoken={token}"
+        )
+
+    async def delta(self, request: web.Request) -> web.Response:
+        self.delta_queries.append(dict(request.query))
+        token = request.query.get("$deltatoken")
+        if token == "expired":
+            return web.json_response(
+                {"error": {"code": "SyncStateNotFound"}}, status=410
+            )
+        if token == "current":
+            return web.json_response(
+                {
+                    "value": [
+                        _message("new-1", has_attachments=True),
+                        # Read flag flipped on an already processed message
+                        {**_message("seen-1"), "isRead": True},
+                        {"id": "gone-1", "@removed": {"reason": "deleted"}},
+                    ],
+                    "@odata.deltaLink": self.delta_link("next"),
+                }
+            )
+        # A new round started from the current time
+        return web.json_response(
+            {"value": [], "@odata.deltaLink": self.delta_link("fresh")}
+        )
+
+    async def messages(self, request: web.Request) -> web.Response:
+        return web.json_response({"value": [_message("full-1"), _message("full-2")]})
+
+    async def batch(self, request: web.Request) -> web.Response:
+        payload = await request.json()
+        responses = []
+        for sub_request in payload["requests"]:
+            self.batch_urls.append(sub_request["url"])
+            responses.append(
+                {
+                    "id": sub_request["id"],
+                    "status": 200,
+                    "body": {
+                        "value": [
+                            {
+                                "id": "att-1",
+                                "name": "report.pdf",
+                                "contentType": "application/pdf",
+                                "size": 10,
+                            }
+                        ]
+                    },
+                }
+            )
+        return web.json_response({"responses": responses})
+
+
+@pytest_asyncio.fixture
+async def graph(tmp_path: Path):
+    """Yield a stand-in server and an interface connected to it."""
+    stand_in = StandInGraph()
+    server = TestServer(stand_in.app)
+    await server.start_server()
+    stand_in.base_url = str(server.make_url("/v1.0"))
+
+    credentials_path = tmp_path / "msgraph_credentials.json"
+    credentials_path.write_text(
+        json.dumps({"client_id": "client-id-0000", "tenant_id": "tenant-id-0000"})
+    )
+    interface = MicrosoftGraphInterface(
+        credentials_path=str(credentials_path),
+        sync_state_path=str(tmp_path / "sync_state.json"),
+        graph_endpoint=stand_in.base_url,
+    )
+    interface.access_token = "token"
+    interface.user_email = "user@example.com"
+    await interface._initialize_http_session()
+
+    yield stand_in, interface
+
+    await interface.session.close()
+    await server.close()
+
+
+def _criteria() -> EmailSearchCriteria:
+    return EmailSearchCriteria(max_results=10, include_attachment_content=False)
+
+
+@pytest.mark.email
+@pytest.mark.asyncio
+async def test_delta_skips_seen_messages_and_lists_attachments(graph) -> None:
+    """Delta pages are parsed directly; seen and removed messages are skipped."""
+    stand_in, interface = graph
+    sync_state = interface.sync_state
+    sync_state.set(
+        "msgraph",
+        "user@example.com",
+        "delta_link:inbox",
+        stand_in.delta_link("current"),
+    )
+    sync_state.set(
+        "msgraph", "user@example.com", "delta_seen:inbox", json.dumps(["seen-1"])
+    )
+
+    emails = [email async for email in interface.stream_new_emails(_criteria())]
+
+    assert [email.id for email in emails] == ["new-1"]
+    assert [att.filename for att in emails[0].attachments] == ["report.pdf"]
+    # Attachment metadata comes through $batch, never a delta $expand
+    assert stand_in.batch_urls == [
+        "/me/messages/new-1/attachments?%24select=id%2Cname%2CcontentType%2Csize"
+    ]
+    assert all("$expand" not in query for query in stand_in.delta_queries)
+    assert sync_state.get(
+        "msgraph", "user@example.com", "delta_link:inbox"
+    ) == stand_in.delta_link("next")
+    assert json.loads(
+        sync_state.get("msgraph", "user@example.com", "delta_seen:inbox")
+    ) == ["seen-1", "new-1"]
+
+
+@pytest.mark.email
+@pytest.mark.asyncio
+async def test_expired_delta_token_falls_back_to_full_sync(graph) -> None:
+    """An expired deltaLink (HTTP 410) starts a new round and does a full sync."""
+    stand_in, interface = graph
+    sync_state = interface.sync_state
+    sync_state.set(
+        "msgraph",
+        "user@example.com",
+        "delta_link:inbox",
+        stand_in.delta_link("expired"),
+    )
+
+    emails = [email async for email in interface.stream_new_emails(_criteria())]
+
+    assert [email.id for email in emails] == ["full-1", "full-2"]
+    new_round = stand_in.delta_queries[-1]
+    assert "$filter" in new_round and "$expand" not in new_round
+    assert sync_state.get(
+        "msgraph", "user@example.com", "delta_link:inbox"
+    ) == stand_in.delta_link("fresh")
+    assert json.loads(
+        sync_state.get("msgraph", "user@example.com", "delta_seen:inbox")
+    ) == ["full-1", "full-2"]